@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Generate the PDF fixtures used by scripts/test_pdf_*.py
+
+Purpose: Small synthetic papers with known table layouts (committed next to
+         this script; re-run it only to change a fixture)
+Created: 2026-10-17
+
+Fixtures:
+- layout.pdf: page 0 - "Table 3." caption (with an italic run) over two
+  columns of prose; page 1 - prose in the left column, captioned 5-column
+  table in the right column
+- tables.pdf: three captioned text tables, one per page - Table 1 (AFT
+  ages, 25 x 7), Table 2 (U-Th-He, 30 x 8) and Table 3 (Table 2's rows,
+  landscape: /Rotate 90 page, text upright as displayed)
+- ruled.pdf: two ruled (lattice) tables on one page - Table 1 (8 x 4)
+  and Table 2 (5 x 3)
+
+Usage:
+    python scripts/fixtures/pdf/make_fixtures.py
+"""
+
+from pathlib import Path
+import fitz  # pymupdf
+
+FIXTURE_DIR = Path(__file__).parent
+
+PROSE = (
+    "Apatite fission-track thermochronology constrains the low-temperature cooling history "
+    "of the rift flanks and records exhumation driven by normal faulting along the border "
+    "fault system of the basin. "
+) * 6
+
+
+def make_layout(path: Path) -> None:
+    """Two-column prose under a caption, and a table beside prose"""
+    doc = fitz.open()
+
+    # Caption over two columns of prose (no table)
+    page = doc.new_page(width=595, height=842)
+    page.insert_text((48, 70), "Table 3.", fontsize=9, fontname="helv")
+    page.insert_text((86, 70), "Apatite", fontsize=9, fontname="heit")
+    page.insert_text((120, 70), "fission-track ages (see text)", fontsize=9, fontname="helv")
+    page.insert_textbox(fitz.Rect(48, 80, 290, 420), PROSE, fontsize=9)
+    page.insert_textbox(fitz.Rect(305, 80, 547, 420), PROSE, fontsize=9)
+
+    # Table in the right column, prose in the left
+    page = doc.new_page(width=595, height=842)
+    page.insert_textbox(fitz.Rect(48, 80, 290, 500), PROSE, fontsize=9)
+    page.insert_text((305, 90), "Table 4. Apatite (U-Th)/He ages", fontsize=9)
+    cols = [305, 360, 405, 450, 500]
+    y = 108
+    for x, header in zip(cols, ["Sample", "U", "Th", "Age", "Err"]):
+        page.insert_text((x, y), header, fontsize=8)
+    for i in range(12):
+        y += 11
+        for x, value in zip(cols, [f"MU-{i:02d}", f"{10 + i}", f"{20 + i}", f"{50 + i:.1f}", "1.2"]):
+            page.insert_text((x, y), value, fontsize=8)
+
+    doc.save(str(path))
+
+
+AFT_HEADER = ["Sample", "Central age", "Error", "Dispersion", "Ns", "Ni", "P(chi2)"]
+AFT_ROWS = [
+    [f"MU19-{i:02d}", f"{100 + i * 3.1:.1f}", f"{5 + i * 0.2:.1f}", f"{10 + i}", str(100 + i), str(200 + i), f"{0.5 + i / 100:.2f}"]
+    for i in range(25)
+]
+HE_HEADER = ["Sample", "U ppm", "Th ppm", "He ncc", "Raw age", "Ft", "Corr age", "Mass"]
+HE_ROWS = [
+    [f"MU19-{i // 3:02d}", f"{10 + i}", f"{20 + i}", f"{1 + i / 10:.2f}", f"{50 + i:.1f}", "0.7", f"{70 + i:.1f}", "3.2"]
+    for i in range(30)
+]
+RULED_TABLES = [
+    ("Table 1. Ruled apatite data for test samples", ["Sample", "U", "Th", "Age"],
+     [[f"S{i}", f"{1.5 * i:.1f}", f"{3.0 * i:.1f}", f"{4.5 * i:.1f}"] for i in range(1, 9)]),
+    ("Table 2. Second ruled table with other values", ["ID", "Ns", "Ni"],
+     [[f"K{i}", f"{10 * i + 1}", f"{10 * i + 2}"] for i in range(1, 6)]),
+]
+
+
+def _text_table_page(doc: fitz.Document, title: str, header: list, rows: list, rotate: int = 0) -> None:
+    """Page with a methods paragraph, a captioned text table and a figure caption"""
+    page = doc.new_page(width=595, height=842)
+    page.set_rotation(rotate)
+
+    def put(x: float, y: float, text: str, fontsize: float = 11) -> None:
+        # (x, y) as displayed; text upright as displayed
+        page.insert_text(fitz.Point(x, y) * page.derotation_matrix, text, fontsize=fontsize, rotate=rotate)
+
+    x0, y = 60, 80
+    put(x0, y, (
+        "METHODS\nSamples were analyzed at GeoSep Services using a Zeiss microscope and 100x dry objective.\n"
+        "Etched in 5.5% HNO3 at 21C for 20 seconds. Dosimeter glass CN5. zeta: 350.5 +/- 12.3 using EDM\n"
+    ))
+    y += 80
+    put(x0, y, title, fontsize=9)
+    y += 20
+    cols = [x0 + i * 70 for i in range(len(header))]
+    for x, label in zip(cols, header):
+        put(x, y, label, fontsize=8)
+    for row in rows:
+        y += 12
+        for x, value in zip(cols, row):
+            put(x, y, value, fontsize=8)
+    put(x0, page.rect.height - 42, "Figure 3. Something else entirely here", fontsize=9)
+
+
+def make_tables(path: Path) -> None:
+    """Three text tables, the last on a rotated page"""
+    doc = fitz.open()
+    _text_table_page(doc, "Table 1. Apatite fission-track central age results for Malawi samples", AFT_HEADER, AFT_ROWS)
+    _text_table_page(doc, "Table 2. Apatite (U-Th)/He single grain age data", HE_HEADER, HE_ROWS)
+    _text_table_page(doc, "Table 3. Apatite (U-Th)/He single grain data rotated", HE_HEADER, HE_ROWS, rotate=90)
+    doc.save(str(path))
+
+
+def make_ruled(path: Path) -> None:
+    """Two ruled tables, one above the other, on one page"""
+    doc = fitz.open()
+    page = doc.new_page(width=595, height=842)
+    y = 80
+    for title, header, rows in RULED_TABLES:
+        page.insert_text((60, y), title, fontsize=9)
+        top = y + 10
+        width = 80
+        x_lines = [60 + i * width for i in range(len(header) + 1)]
+        y_lines = [top + i * 16 for i in range(len(rows) + 2)]
+        for x in x_lines:
+            page.draw_line((x, y_lines[0]), (x, y_lines[-1]))
+        for line_y in y_lines:
+            page.draw_line((x_lines[0], line_y), (x_lines[-1], line_y))
+        for r, row in enumerate([header] + rows):
+            for c, value in enumerate(row):
+                page.insert_text((x_lines[c] + 4, y_lines[r] + 12), value, fontsize=8)
+        y = y_lines[-1] + 60
+    doc.save(str(path))
+
+
+FIXTURES = {
+    'layout.pdf': make_layout,
+    'tables.pdf': make_tables,
+    'ruled.pdf': make_ruled,
+}
+
+
+if __name__ == "__main__":
+    for name, make in FIXTURES.items():
+        make(FIXTURE_DIR / name)
+        print(f"✓ {name}")
@@ -10,8 +10,17 @@ Main modules:
 - validators: Domain-specific validation
 - cleaners: Post-extraction cleaning
 - cache: Caching layer
+- document_session: Shared open-once PDF handle
+- spans: Compact positioned text span store
+- text_index: Page text index (text, offsets, block geometry)
+- layout: Grid-indexed page layout and table region detection
+- coordinates: Page, display, Camelot and reading coordinate frames
+- row_alignment: Row alignment between extraction methods
+- extracted_table: Typed extracted-table container (type + provenance)
+- batch_extraction: Resumable corpus-level batch runner
 """
 
 from .extraction_engine import UniversalThermoExtractor, extract_from_pdf
+from .batch_extraction import run_batch
 
-__all__ = ['UniversalThermoExtractor', 'extract_from_pdf']
+__all__ = ['UniversalThermoExtractor', 'extract_from_pdf', 'run_batch']
@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""
+Batch Corpus Extraction
+
+Purpose: Run the extraction pipeline over a whole library of papers
+Created: 2026-10-17
+
+Features:
+- Paper discovery from a directory (recursive) or a manifest (.txt / .csv)
+- One worker process per paper, at most --workers at once; a worker that
+  crashes fails only its own paper
+- SQLite journal of per-paper progress, so an interrupted run resumes
+- Per-paper FAIR tables (CSV) + metadata, and a corpus summary CSV
+
+Usage:
+    python -m pdf.batch_extraction <pdf_dir_or_manifest> <output_dir> [--workers 4]
+
+Output layout:
+    <output_dir>/
+        extraction-journal.sqlite   # progress journal (resume state)
+        summary.csv                 # one row per paper
+        <paper>/
+            metadata.json
+            samples.csv, ft_ages.csv, ...
+"""
+
+import argparse
+import csv
+import json
+import logging
+import multiprocessing
+import queue
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from .extraction_engine import extract_from_pdf
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_NAME = 'extraction-journal.sqlite'
+SUMMARY_NAME = 'summary.csv'
+
+# Seconds between checks for crashed paper workers
+WORKER_POLL_INTERVAL = 1.0
+
+# Paper states in the journal
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+JOURNAL_SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    pdf_path    TEXT PRIMARY KEY,
+    output_dir  TEXT NOT NULL,
+    status      TEXT NOT NULL DEFAULT 'pending',
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    started_at  TEXT,
+    finished_at TEXT,
+    seconds     REAL,
+    n_tables    INTEGER,
+    n_records   INTEGER,
+    valid       INTEGER,
+    error       TEXT
+)
+"""
+
+
+class ExtractionJournal:
+    """SQLite record of per-paper batch progress (written by the parent process only)"""
+
+    def __init__(self, db_path: str):
+        """
+        Open (or create) a journal
+
+        Args:
+            db_path: Path to SQLite file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute(JOURNAL_SCHEMA)
+        self.conn.commit()
+
+    def register(self, papers: Dict[str, str]) -> int:
+        """
+        Add papers not yet in the journal
+
+        Args:
+            papers: Dict mapping PDF path → output directory
+
+        Returns:
+            Number of newly registered papers
+        """
+        before = self.conn.total_changes
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO papers (pdf_path, output_dir) VALUES (?, ?)",
+            papers.items()
+        )
+        self.conn.commit()
+        return self.conn.total_changes - before
+
+    def recover(self) -> int:
+        """
+        Reset papers left 'running' by an interrupted run back to 'pending'
+
+        Returns:
+            Number of papers reset
+        """
+        cursor = self.conn.execute(
+            "UPDATE papers SET status = ? WHERE status = ?", (PENDING, RUNNING)
+        )
+        self.conn.commit()
+        return cursor.rowcount
+
+    def pending(self, paths: List[str], retry_failed: bool = False) -> List[str]:
+        """
+        Papers from `paths` that still need extracting (in the given order)
+
+        Args:
+            paths: Candidate PDF paths
+            retry_failed: Also return papers that failed previously
+
+        Returns:
+            PDF paths to run
+        """
+        statuses = {PENDING, FAILED} if retry_failed else {PENDING}
+        rows = self.conn.execute("SELECT pdf_path, status FROM papers").fetchall()
+        status = {row['pdf_path']: row['status'] for row in rows}
+        return [p for p in paths if status.get(p) in statuses]
+
+    def mark_running(self, pdf_path: str) -> None:
+        self.conn.execute(
+            "UPDATE papers SET status = ?, attempts = attempts + 1, started_at = ?, "
+            "finished_at = NULL, error = NULL WHERE pdf_path = ?",
+            (RUNNING, _now(), pdf_path)
+        )
+        self.conn.commit()
+
+    def mark_done(self, pdf_path: str, result: Dict) -> None:
+        self.conn.execute(
+            "UPDATE papers SET status = ?, finished_at = ?, seconds = ?, n_tables = ?, "
+            "n_records = ?, valid = ? WHERE pdf_path = ?",
+            (DONE, _now(), result['seconds'], result['n_tables'],
+             result['n_records'], int(result['valid']), pdf_path)
+        )
+        self.conn.commit()
+
+    def mark_failed(self, pdf_path: str, error: str) -> None:
+        self.conn.execute(
+            "UPDATE papers SET status = ?, finished_at = ?, error = ? WHERE pdf_path = ?",
+            (FAILED, _now(), error, pdf_path)
+        )
+        self.conn.commit()
+
+    def rows(self) -> List[Dict]:
+        """All journal rows as dicts"""
+        return [dict(row) for row in self.conn.execute("SELECT * FROM papers ORDER BY pdf_path")]
+
+    def counts(self) -> Dict[str, int]:
+        """Number of papers per status"""
+        rows = self.conn.execute("SELECT status, COUNT(*) AS n FROM papers GROUP BY status")
+        return {row['status']: row['n'] for row in rows}
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> 'ExtractionJournal':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec='seconds')
+
+
+def discover_pdfs(source: str) -> List[str]:
+    """
+    List the papers to extract
+
+    Args:
+        source: Directory (searched recursively for *.pdf), or a manifest:
+                .csv with a 'pdf_path' column, or text with one path per line
+                (blank lines and '#' comments ignored). Relative manifest
+                paths are resolved against the manifest's directory.
+
+    Returns:
+        Sorted, de-duplicated absolute PDF paths
+    """
+    source = Path(source)
+
+    if source.is_dir():
+        paths = [p for p in source.rglob('*') if p.suffix.lower() == '.pdf']
+    elif source.suffix.lower() == '.csv':
+        with open(source, newline='') as f:
+            paths = [Path(row['pdf_path']) for row in csv.DictReader(f) if row.get('pdf_path')]
+    else:
+        lines = source.read_text().splitlines()
+        paths = [Path(line.strip()) for line in lines if line.strip() and not line.strip().startswith('#')]
+
+    if not source.is_dir():
+        paths = [p if p.is_absolute() else source.parent / p for p in paths]
+
+    found = sorted({str(p.resolve()) for p in paths})
+    missing = [p for p in found if not Path(p).exists()]
+    for path in missing:
+        logger.warning(f"⚠️  Listed PDF not found: {path}")
+
+    return [p for p in found if p not in missing]
+
+
+def _output_dirs(pdf_paths: List[str], output_dir: Path) -> Dict[str, str]:
+    """
+    Assign each paper an output directory named after its file
+
+    Papers sharing a file name get the name of their parent directory appended.
+    """
+    stems = {}
+    for path in pdf_paths:
+        stems.setdefault(Path(path).stem, []).append(path)
+
+    assigned = {}
+    for stem, paths in stems.items():
+        for path in paths:
+            name = stem if len(paths) == 1 else f"{stem}__{Path(path).parent.name}"
+            assigned[path] = str(output_dir / name)
+    return assigned
+
+
+def extract_paper(
+    pdf_path: str,
+    paper_output_dir: str,
+    cache_dir: str,
+    table_timeout: Optional[float] = None,
+    race: bool = False,
+    cache_limits: Optional[Dict] = None
+) -> Dict:
+    """
+    Extract one paper and write its FAIR tables (process-pool entry point)
+
+    Args:
+        pdf_path: Path to PDF file
+        paper_output_dir: Directory for this paper's CSVs and metadata
+        cache_dir: Extraction cache directory (shared across papers)
+        table_timeout: Per-table extraction time budget in seconds
+        race: Race the fallback methods for each table
+        cache_limits: cache_max_bytes / cache_max_entries / cache_ttl for extract_from_pdf
+
+    Returns:
+        Dict with seconds, n_tables, n_records, valid
+    """
+    start = time.monotonic()
+    results = extract_from_pdf(pdf_path, cache_dir, table_timeout=table_timeout, race=race,
+                               **(cache_limits or {}))
+
+    out = Path(paper_output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    for table_name, df in results['fair_data'].items():
+        df.to_csv(out / f"{table_name}.csv", index=False)
+
+    validation = results['validation']
+    with open(out / 'metadata.json', 'w') as f:
+        json.dump({
+            'pdf_path': pdf_path,
+            'metadata': results['metadata'],
+            'tables': sorted(results['tables']),
+            'fair_tables': sorted(results['fair_data']),
+            'overall_valid': validation['overall_valid']
+        }, f, indent=2, default=str)
+
+    return {
+        'seconds': round(time.monotonic() - start, 2),
+        'n_tables': len(results['tables']),
+        'n_records': validation['summary']['total_records'],
+        'valid': validation['overall_valid']
+    }
+
+
+def _paper_process(
+    pdf_path: str,
+    paper_output_dir: str,
+    cache_dir: str,
+    table_timeout: Optional[float],
+    race: bool,
+    cache_limits: Dict,
+    results: multiprocessing.Queue
+) -> None:
+    """Paper worker process: run extract_paper and report (pdf_path, result, error)"""
+    try:
+        result = extract_paper(pdf_path, paper_output_dir, cache_dir, table_timeout, race, cache_limits)
+        results.put((pdf_path, result, None))
+    except Exception as e:
+        results.put((pdf_path, None, f"{type(e).__name__}: {e}"))
+
+
+def write_summary(journal: ExtractionJournal, summary_path: Path) -> None:
+    """Write one CSV row per journaled paper"""
+    rows = journal.rows()
+    columns = ['pdf_path', 'output_dir', 'status', 'attempts', 'started_at', 'finished_at',
+               'seconds', 'n_tables', 'n_records', 'valid', 'error']
+    with open(summary_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def run_batch(
+    source: str,
+    output_dir: str,
+    cache_dir: str = './cache',
+    workers: int = 4,
+    journal_path: Optional[str] = None,
+    retry_failed: bool = False,
+    table_timeout: Optional[float] = None,
+    race: bool = False,
+    cache_max_bytes: Optional[int] = None,
+    cache_max_entries: Optional[int] = None,
+    cache_ttl: Optional[Union[float, Dict[str, float]]] = None
+) -> Dict:
+    """
+    Extract every paper in a directory or manifest, resuming from the journal
+
+    Papers already marked done are skipped; papers interrupted mid-run are
+    retried. Failed papers are only retried with retry_failed=True.
+
+    Args:
+        source: PDF directory or manifest file (see discover_pdfs)
+        output_dir: Root directory for per-paper output and summary.csv
+        cache_dir: Extraction cache directory
+        workers: Worker processes (papers extracted concurrently)
+        journal_path: SQLite journal path (default: <output_dir>/extraction-journal.sqlite)
+        retry_failed: Re-run papers that failed in an earlier run
+        table_timeout: Per-table extraction time budget in seconds
+        race: Race the fallback methods for each table
+        cache_max_bytes: Shared cache size limit in bytes (LRU eviction)
+        cache_max_entries: Shared cache entry limit (LRU eviction)
+        cache_ttl: Cache entry lifetime in seconds (one value, or {step: seconds})
+
+    Returns:
+        Dict with per-status counts, papers run this time, and summary path
+    """
+    output_root = Path(output_dir)
+    output_root.mkdir(parents=True, exist_ok=True)
+    journal_path = journal_path or output_root / JOURNAL_NAME
+
+    cache_limits = {
+        'cache_max_bytes': cache_max_bytes,
+        'cache_max_entries': cache_max_entries,
+        'cache_ttl': cache_ttl
+    }
+
+    pdf_paths = discover_pdfs(source)
+    logger.info(f"📚 Found {len(pdf_paths)} PDFs in {source}")
+
+    with ExtractionJournal(journal_path) as journal:
+        recovered = journal.recover()
+        if recovered:
+            logger.info(f"↻ Resuming {recovered} paper(s) interrupted in a previous run")
+        journal.register(_output_dirs(pdf_paths, output_root))
+
+        todo = journal.pending(pdf_paths, retry_failed=retry_failed)
+        logger.info(f"→ {len(todo)} to extract, {len(pdf_paths) - len(todo)} already handled")
+        paper_dirs = {row['pdf_path']: row['output_dir'] for row in journal.rows()}
+
+        # One process per paper: a paper is marked running when its worker
+        # starts, and a worker that dies fails only its own paper
+        completed = 0
+        result_queue = multiprocessing.Queue()
+        waiting = list(todo)
+        running = {}  # pdf_path → worker process
+
+        def finish(pdf_path: str, result: Optional[Dict], error: Optional[str]) -> None:
+            nonlocal completed
+            completed += 1
+            if error is not None:
+                journal.mark_failed(pdf_path, error)
+                logger.error(f"  ✗ [{completed}/{len(todo)}] {Path(pdf_path).name}: {error}")
+                return
+            journal.mark_done(pdf_path, result)
+            logger.info(f"  ✓ [{completed}/{len(todo)}] {Path(pdf_path).name}: "
+                        f"{result['n_tables']} tables, {result['n_records']} records "
+                        f"({result['seconds']:.1f}s)")
+
+        try:
+            while waiting or running:
+                while waiting and len(running) < max(1, workers):
+                    pdf_path = waiting.pop(0)
+                    process = multiprocessing.Process(
+                        target=_paper_process,
+                        args=(pdf_path, paper_dirs[pdf_path], cache_dir, table_timeout, race,
+                              cache_limits, result_queue)
+                    )  # Not daemonic: papers may start their own worker processes
+                    process.start()
+                    journal.mark_running(pdf_path)
+                    running[pdf_path] = process
+
+                try:
+                    pdf_path, result, error = result_queue.get(timeout=WORKER_POLL_INTERVAL)
+                except queue.Empty:
+                    pdf_path = None
+
+                if pdf_path in running:
+                    running.pop(pdf_path).join()
+                    finish(pdf_path, result, error)
+
+                for pdf_path, process in list(running.items()):
+                    # A clean exit has its result queued; a nonzero exit code never reports
+                    if process.exitcode not in (None, 0):
+                        del running[pdf_path]
+                        finish(pdf_path, None, f"Worker died (exit code {process.exitcode})")
+        finally:
+            # Interrupted: papers still running stay 'running' and are resumed next time
+            for process in running.values():
+                process.kill()
+                process.join()
+            result_queue.close()
+
+        summary_path = output_root / SUMMARY_NAME
+        write_summary(journal, summary_path)
+        counts = journal.counts()
+
+    logger.info(f"✅ Batch complete: {counts.get(DONE, 0)} done, {counts.get(FAILED, 0)} failed "
+                f"→ {summary_path}")
+
+    return {
+        'counts': counts,
+        'run': len(todo),
+        'summary_path': str(summary_path)
+    }
+
+
+def main():
+    """Main CLI"""
+    parser = argparse.ArgumentParser(description="Extract FAIR tables from a corpus of thermochronology papers")
+    parser.add_argument("source", help="Directory of PDFs, or manifest (.txt / .csv with pdf_path column)")
+    parser.add_argument("output_dir", help="Output directory (per-paper tables + summary.csv)")
+    parser.add_argument("--cache-dir", default="./cache", help="Extraction cache directory")
+    parser.add_argument("--workers", type=int, default=4, help="Papers extracted concurrently")
+    parser.add_argument("--journal", help="SQLite journal path (default: <output_dir>/extraction-journal.sqlite)")
+    parser.add_argument("--retry-failed", action="store_true", help="Re-run papers that failed previously")
+    parser.add_argument("--table-timeout", type=float, help="Per-table time budget in seconds")
+    parser.add_argument("--race", action="store_true", help="Race the fallback extraction methods")
+    parser.add_argument("--cache-max-bytes", type=int, help="Evict least recently used cache entries above this size")
+    parser.add_argument("--cache-max-entries", type=int, help="Evict least recently used cache entries above this count")
+    parser.add_argument("--cache-ttl", type=float, help="Cache entry lifetime in seconds")
+
+    args = parser.parse_args()
+
+    results = run_batch(
+        args.source,
+        args.output_dir,
+        cache_dir=args.cache_dir,
+        workers=args.workers,
+        journal_path=args.journal,
+        retry_failed=args.retry_failed,
+        table_timeout=args.table_timeout,
+        race=args.race,
+        cache_max_bytes=args.cache_max_bytes,
+        cache_max_entries=args.cache_max_entries,
+        cache_ttl=args.cache_ttl
+    )
+
+    print("\n" + "=" * 60)
+    print("BATCH EXTRACTION COMPLETE")
+    print("=" * 60)
+    for status, n in sorted(results['counts'].items()):
+        print(f"{status:>8}: {n}")
+    print(f"Summary: {results['summary_path']}")
+
+
+if __name__ == "__main__":
+    main()
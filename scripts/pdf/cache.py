@@ -5,16 +5,226 @@ PDF Extraction Caching Layer
 Purpose: Cache extraction results for speed (20-30x faster on re-runs)
 Author: Claude Code
 Created: 2025-11-16
+
+Entry layout (one directory per PDF + step):
+    index/<path md5>.json  - key index: PDF path → stat fingerprint + content digest
+    <md5>_<step>-<fingerprint>/
+        manifest.json      - payload structure (dicts, lists, scalars)
+        frame_0.arrow      - each DataFrame as uncompressed Arrow IPC (Feather v2)
+        ...
+
+DataFrames are loaded through a memory map, so a hit costs one mmap per
+frame rather than an unpickle. Loaded frames are backed by read-only
+buffers - .copy() before editing them in place.
 """
 
 import hashlib
+import json
+import os
 import pickle
 import logging
+import shutil
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+
+# Arrow is optional - without it payloads fall back to pickle files
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    HAS_ARROW = True
+except ImportError:
+    HAS_ARROW = False
 
 logger = logging.getLogger(__name__)
 
+# Read PDFs in 1 MiB chunks when hashing (never load the whole file)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Sidecar key index: one JSON file per resolved PDF path (stat fingerprint +
+# content digest), so concurrent workers never rewrite each other's entries
+INDEX_DIRNAME = 'index'
+
+# Per-entry payload description
+MANIFEST_FILENAME = 'manifest.json'
+
+# Eviction frees space down to this share of max_bytes / max_entries, so
+# the next full eviction scan is several writes away
+EVICT_LOW_WATER = 0.9
+
+# Bump to invalidate every cached step (e.g. after a payload format change)
+PIPELINE_VERSION = 2
+
+# Package modules whose code shapes each cached step's output
+STEP_SOURCES = {
+    'text_index': ['text_index.py'],
+    'structure': ['semantic_analysis.py', 'methods_parser.py', 'document_session.py', 'layout.py', 'spans.py',
+                  'coordinates.py'],
+    'tables': ['table_extractors.py', 'cleaners.py', 'extraction_engine.py'],
+    'fair_data': ['fair_transformer.py'],
+}
+
+# Steps whose output feeds each step (their fingerprints are inherited)
+STEP_INPUTS = {
+    'text_index': [],
+    'structure': ['text_index'],
+    'tables': ['structure'],
+    'fair_data': ['tables'],
+}
+
+
+def hash_file(path: str, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """
+    MD5 a file in fixed-size chunks
+
+    Args:
+        path: Path to file
+        chunk_size: Bytes read per chunk
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.md5()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _PayloadWriter:
+    """
+    Encode a payload as a JSON manifest plus one file per DataFrame
+
+    Supported: DataFrames, dicts with string keys, lists, tuples and JSON
+    scalars. Anything else raises TypeError (caller falls back to pickle).
+    """
+
+    def __init__(self, entry_dir: Path):
+        self.entry_dir = entry_dir
+        self.n_frames = 0
+
+    def encode(self, value: Any) -> Any:
+        if isinstance(value, pd.DataFrame):
+            return self._write_frame(value)
+        if isinstance(value, dict):
+            if not all(isinstance(k, str) for k in value):
+                raise TypeError("Only string dict keys can be cached")
+            return {'__dict__': {k: self.encode(v) for k, v in value.items()}}
+        if isinstance(value, tuple):
+            return {'__tuple__': [self.encode(v) for v in value]}
+        if isinstance(value, list):
+            return [self.encode(v) for v in value]
+        if value is None or isinstance(value, (str, bool, int, float)):
+            return value
+        if hasattr(value, 'item'):  # numpy scalar
+            return value.item()
+        raise TypeError(f"Cannot cache {type(value).__name__} without pickle")
+
+    def _write_frame(self, df: pd.DataFrame) -> Dict:
+        """Write one DataFrame; labels and index go to the manifest"""
+        name = f"frame_{self.n_frames}"
+        self.n_frames += 1
+
+        # Positional column names: extracted tables often repeat or omit headers
+        data = pd.DataFrame(
+            {f"c{i}": df.iloc[:, i].reset_index(drop=True) for i in range(len(df.columns))},
+            index=pd.RangeIndex(len(df))
+        )
+
+        spec = {
+            '__frame__': name,
+            'columns': [self._label(col) for col in df.columns],
+            'json_columns': [],
+        }
+
+        if isinstance(df.index, pd.RangeIndex):
+            spec['index'] = {'range': [df.index.start, df.index.stop, df.index.step]}
+        else:
+            spec['index'] = {'values': [self._label(v) for v in df.index]}
+
+        if not HAS_ARROW:
+            data.to_pickle(self.entry_dir / f"{name}.pkl")
+            spec['format'] = 'pickle'
+            return spec
+
+        # Mixed-type object columns (e.g. numbers and leftover text) are not
+        # Arrow-typed; store those cells JSON-encoded in a string column
+        try:
+            table = pa.Table.from_pandas(data, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            for col in data.columns:
+                try:
+                    pa.array(data[col], from_pandas=True)
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    data[col] = [json.dumps(v) for v in data[col].tolist()]
+                    spec['json_columns'].append(col)
+            table = pa.Table.from_pandas(data, preserve_index=False)
+
+        feather.write_feather(table, str(self.entry_dir / f"{name}.arrow"), compression='uncompressed')
+        spec['format'] = 'arrow'
+        return spec
+
+    @staticmethod
+    def _label(label: Any) -> Any:
+        """Column/index label as a JSON value"""
+        if hasattr(label, 'item'):
+            label = label.item()
+        if label is None or isinstance(label, (str, int, float, bool)):
+            return label
+        return str(label)
+
+
+class _PayloadReader:
+    """Decode a manifest written by _PayloadWriter"""
+
+    def __init__(self, entry_dir: Path, memory_map: bool = True):
+        self.entry_dir = entry_dir
+        self.memory_map = memory_map
+
+    def decode(self, value: Any) -> Any:
+        if isinstance(value, list):
+            return [self.decode(v) for v in value]
+        if isinstance(value, dict):
+            if '__frame__' in value:
+                return self._read_frame(value)
+            if '__tuple__' in value:
+                return tuple(self.decode(v) for v in value['__tuple__'])
+            return {k: self.decode(v) for k, v in value['__dict__'].items()}
+        return value
+
+    def _read_frame(self, spec: Dict) -> pd.DataFrame:
+        name = spec['__frame__']
+
+        if spec['format'] == 'pickle':
+            data = pd.read_pickle(self.entry_dir / f"{name}.pkl")
+        else:
+            table = feather.read_table(str(self.entry_dir / f"{name}.arrow"), memory_map=self.memory_map)
+            # split_blocks keeps numeric columns as zero-copy views of the map
+            data = table.to_pandas(split_blocks=True)
+            for col in spec['json_columns']:
+                data[col] = [json.loads(v) for v in data[col].tolist()]
+
+        data.columns = spec['columns']
+        if 'range' in spec['index']:
+            data.index = pd.RangeIndex(*spec['index']['range'])
+        else:
+            data.index = spec['index']['values']
+
+        return data
+
+
+@lru_cache(maxsize=None)
+def _source_digest(module_file: str) -> str:
+    """Content hash of a package module (computed once per process)"""
+    path = Path(__file__).parent / module_file
+    try:
+        return hash_file(str(path))
+    except OSError:
+        return 'missing'
+
 
 class PDFCache:
     """
@@ -22,30 +232,142 @@ class PDFCache:
 
     Features:
     - MD5-based cache keys (unique per PDF)
+    - Streaming hash, computed once per file version
+    - Persistent key index keyed by (path, size, mtime, inode), one file per PDF
     - Separate caching for each extraction step
+    - Step keys versioned by extractor code + parameters
+    - Size/entry-capped LRU eviction and per-step TTL
+    - Hit/miss/eviction statistics
     - Automatic cache directory creation
-    - Pickle serialization
+    - Arrow/Feather DataFrames + JSON manifest, memory-mapped on load
+      (pickle only for payloads the manifest cannot describe)
+
+    Each step's key carries a fingerprint of PIPELINE_VERSION, the source of
+    the modules listed in STEP_SOURCES, the step's parameters and the
+    fingerprints of its input steps. Editing cleaners.py therefore misses
+    'tables' and 'fair_data' but keeps 'structure' warm.
+
+    Entry write time is the manifest mtime (used for TTL) and last access
+    is the manifest atime, set explicitly on every hit (used for LRU order),
+    so several worker processes can share one cache directory.
+
+    With a size or entry limit, the directory is scanned once and a running
+    total is kept from then on; a write only triggers a full eviction scan
+    (which also resyncs the total with other workers' writes) when it takes
+    the total past a limit.
 
     Example:
-        cache = PDFCache('./cache')
+        cache = PDFCache('./cache', max_bytes=2 * 1024**3, ttl={'fair_data': 86400})
+        cache.set_step_params('tables', {'quality_threshold': 0.6})
         cache.set('paper.pdf', 'structure', document_structure)
         structure = cache.get('paper.pdf', 'structure')
+        print(cache.stats())
     """
 
-    def __init__(self, cache_dir: str = './cache'):
+    def __init__(
+        self,
+        cache_dir: str = './cache',
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        ttl: Optional[Union[float, Dict[str, float]]] = None,
+        step_params: Optional[Dict[str, Dict]] = None,
+        memory_map: bool = True
+    ):
         """
         Initialize cache
 
         Args:
             cache_dir: Directory for cache files
+            max_bytes: Evict least recently used entries above this total size
+            max_entries: Evict least recently used entries above this count
+            ttl: Entry lifetime in seconds - one value for all steps, or
+                 {step: seconds} (steps not listed never expire)
+            step_params: {step: parameters} included in each step's fingerprint
+            memory_map: Memory-map Arrow frames on load (zero-copy, read-only)
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.index_dir = self.cache_dir / INDEX_DIRNAME
+        self.index_dir.mkdir(exist_ok=True)
+        self._index: Dict[str, Dict] = {}  # Key index entries read by this instance
+
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.memory_map = memory_map
+        self.step_params: Dict[str, Dict] = {step: dict(p) for step, p in (step_params or {}).items()}
+
+        self._stats = {'hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0, 'expired': 0}
+        self._usage: Optional[Dict[str, int]] = None  # Running {'bytes', 'entries'} (limits only)
+        self._step_stats: Dict[str, Dict[str, int]] = {}
+
         logger.debug(f"Cache directory: {self.cache_dir}")
 
+    def get_pdf_hash(self, pdf_path: str) -> str:
+        """
+        Get content digest of a PDF, hashing it only if it changed
+
+        The digest is remembered in the sidecar index under the file's
+        (size, mtime, inode) fingerprint, so repeat lookups cost a stat()
+        (plus one small JSON read the first time an instance sees the file).
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Returns:
+            MD5 hex digest of the PDF content
+        """
+        resolved = str(Path(pdf_path).resolve())
+        st = os.stat(resolved)
+        fingerprint = [st.st_size, st.st_mtime_ns, st.st_ino]
+
+        entry = self._index.get(resolved)
+        if not entry or entry['stat'] != fingerprint:
+            entry = self._load_index_entry(resolved)  # Possibly hashed by another worker
+        if entry and entry['stat'] == fingerprint:
+            self._index[resolved] = entry
+            return entry['md5']
+
+        pdf_hash = hash_file(resolved)
+        self._index[resolved] = {'path': resolved, 'stat': fingerprint, 'md5': pdf_hash}
+        self._save_index_entry(self._index[resolved])
+        logger.debug(f"Hashed {Path(pdf_path).name}: {pdf_hash}")
+
+        return pdf_hash
+
+    def set_step_params(self, step: str, params: Dict) -> None:
+        """
+        Set the parameters that a step's cached output depends on
+
+        Args:
+            step: Extraction step
+            params: JSON-serializable parameters (thresholds, tolerances, ...)
+        """
+        self.step_params[step] = dict(params)
+
+    def step_fingerprint(self, step: str) -> str:
+        """
+        Fingerprint of the code and parameters that produce a step
+
+        Args:
+            step: Extraction step
+
+        Returns:
+            Short hex fingerprint
+        """
+        payload = {
+            'version': PIPELINE_VERSION,
+            'step': step,
+            'sources': {name: _source_digest(name) for name in STEP_SOURCES.get(step, [])},
+            'params': self.step_params.get(step, {}),
+            'inputs': {name: self.step_fingerprint(name) for name in STEP_INPUTS.get(step, [])},
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.md5(encoded).hexdigest()[:12]
+
     def get_cache_key(self, pdf_path: str, step: str) -> str:
         """
-        Generate cache key from PDF hash + extraction step
+        Generate cache key from PDF hash + extraction step + step fingerprint
 
         Args:
             pdf_path: Path to PDF file
@@ -54,11 +376,7 @@ class PDFCache:
         Returns:
             Cache key string
         """
-        # Hash PDF content
-        with open(pdf_path, 'rb') as f:
-            pdf_hash = hashlib.md5(f.read()).hexdigest()
-
-        return f"{pdf_hash}_{step}.pkl"
+        return f"{self.get_pdf_hash(pdf_path)}_{step}-{self.step_fingerprint(step)}"
 
     def get(self, pdf_path: str, step: str) -> Optional[Any]:
         """
@@ -71,18 +389,27 @@ class PDFCache:
         Returns:
             Cached data or None if not found
         """
-        cache_file = self.cache_dir / self.get_cache_key(pdf_path, step)
+        entry_dir = self.cache_dir / self.get_cache_key(pdf_path, step)
+        manifest_path = entry_dir / MANIFEST_FILENAME
 
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'rb') as f:
-                    data = pickle.load(f)
-                logger.debug(f"Cache hit: {step}")
-                return data
-            except Exception as e:
-                logger.warning(f"Cache read failed: {e}")
-                return None
+        if manifest_path.exists():
+            if self._is_expired(entry_dir, step):
+                self._remove(entry_dir)
+                self._stats['expired'] += 1
+                logger.debug(f"Cache expired: {step}")
+            else:
+                try:
+                    data = self._read_entry(entry_dir)
+                    self._touch(entry_dir)
+                    self._record(step, 'hits')
+                    logger.debug(f"Cache hit: {step}")
+                    return data
+                except Exception as e:
+                    logger.warning(f"Cache read failed: {e}")
+                    self._record(step, 'misses')
+                    return None
 
+        self._record(step, 'misses')
         logger.debug(f"Cache miss: {step}")
         return None
 
@@ -95,14 +422,24 @@ class PDFCache:
             step: Extraction step
             data: Data to cache
         """
-        cache_file = self.cache_dir / self.get_cache_key(pdf_path, step)
+        entry_dir = self.cache_dir / self.get_cache_key(pdf_path, step)
+        limited = self.max_bytes is not None or self.max_entries is not None
+        if limited and self._usage is None:
+            self._usage = self._scan_usage()
 
         try:
-            with open(cache_file, 'wb') as f:
-                pickle.dump(data, f)
+            self._write_entry(entry_dir, data)  # Replaced entry is subtracted by _remove()
+            self._stats['writes'] += 1
             logger.debug(f"Cached: {step}")
         except Exception as e:
             logger.warning(f"Cache write failed: {e}")
+            return
+
+        if limited:
+            self._usage['bytes'] += self._entry_size(entry_dir)
+            self._usage['entries'] += 1
+            if self._over_limit(self._usage['bytes'], self._usage['entries']):
+                self.evict()
 
     def clear(self, pdf_path: Optional[str] = None) -> None:
         """
@@ -114,12 +451,222 @@ class PDFCache:
         """
         if pdf_path:
             # Clear specific PDF
-            pdf_hash = hashlib.md5(open(pdf_path, 'rb').read()).hexdigest()
-            for cache_file in self.cache_dir.glob(f"{pdf_hash}_*.pkl"):
-                cache_file.unlink()
-                logger.info(f"Cleared cache: {cache_file.name}")
+            pdf_hash = self.get_pdf_hash(pdf_path)
+            for entry in self._entries():
+                if entry['path'].name.startswith(f"{pdf_hash}_"):
+                    self._remove(entry['path'])
+                    logger.info(f"Cleared cache: {entry['path'].name}")
         else:
-            # Clear all cache
-            for cache_file in self.cache_dir.glob("*.pkl"):
-                cache_file.unlink()
+            # Clear all cache (the key index stays valid - it only maps files to digests)
+            for entry in self._entries():
+                self._remove(entry['path'])
             logger.info("Cleared all cache")
+
+    def evict(self) -> int:
+        """
+        Drop expired entries, then least recently used entries until the
+        cache is within EVICT_LOW_WATER of max_bytes / max_entries
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        entries = []
+        self._usage = None  # Recounted below
+
+        for entry in self._entries():
+            if self._is_expired(entry['path'], entry['step'], entry['mtime']):
+                self._remove(entry['path'])
+                self._stats['expired'] += 1
+                removed += 1
+            else:
+                entries.append(entry)
+
+        # Oldest access first
+        entries.sort(key=lambda e: e['atime'])
+        total_bytes = sum(e['size'] for e in entries)
+
+        while entries and self._over_limit(total_bytes, len(entries), EVICT_LOW_WATER):
+            entry = entries.pop(0)
+            self._remove(entry['path'])
+            total_bytes -= entry['size']
+            self._stats['evictions'] += 1
+            removed += 1
+            logger.debug(f"Evicted: {entry['path'].name}")
+
+        self._usage = {'bytes': total_bytes, 'entries': len(entries)}
+        return removed
+
+    def stats(self) -> Dict:
+        """
+        Report cache effectiveness and footprint
+
+        Returns:
+            Dictionary with counters for this process (hits, misses, writes,
+            evictions, expired, hit_rate, per-step counts) plus the current
+            on-disk entries and bytes
+        """
+        entries = self._entries()
+        lookups = self._stats['hits'] + self._stats['misses']
+
+        return {
+            **self._stats,
+            'hit_rate': self._stats['hits'] / lookups if lookups else 0.0,
+            'entries': len(entries),
+            'bytes': sum(e['size'] for e in entries),
+            'max_bytes': self.max_bytes,
+            'max_entries': self.max_entries,
+            'steps': {step: dict(counts) for step, counts in self._step_stats.items()},
+        }
+
+    # Entry storage
+
+    def _write_entry(self, entry_dir: Path, data: Any) -> None:
+        """Write payload to a temp directory, then move it into place"""
+        tmp_dir = self.cache_dir / f".tmp-{entry_dir.name}-{os.getpid()}"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir()
+
+        try:
+            try:
+                manifest = {'payload': _PayloadWriter(tmp_dir).encode(data)}
+            except TypeError as e:
+                # Not describable by the manifest (e.g. custom objects)
+                logger.debug(f"Falling back to pickle: {e}")
+                for stale in tmp_dir.iterdir():
+                    stale.unlink()
+                with open(tmp_dir / 'payload.pkl', 'wb') as f:
+                    pickle.dump(data, f)
+                manifest = {'pickle': 'payload.pkl'}
+
+            with open(tmp_dir / MANIFEST_FILENAME, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f)
+
+            self._remove(entry_dir)
+            os.replace(tmp_dir, entry_dir)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _read_entry(self, entry_dir: Path) -> Any:
+        """Load payload described by an entry's manifest"""
+        with open(entry_dir / MANIFEST_FILENAME, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+        if 'pickle' in manifest:
+            with open(entry_dir / manifest['pickle'], 'rb') as f:
+                return pickle.load(f)
+
+        return _PayloadReader(entry_dir, self.memory_map).decode(manifest['payload'])
+
+    # Eviction helpers
+
+    def _entries(self) -> List[Dict]:
+        """List cache entries with step, size, write time and last access"""
+        entries = []
+        for entry_dir in self.cache_dir.iterdir():
+            manifest_path = entry_dir / MANIFEST_FILENAME
+            try:
+                st = manifest_path.stat()
+                size = sum(f.stat().st_size for f in entry_dir.iterdir())
+            except (FileNotFoundError, NotADirectoryError):
+                continue  # Index, temp dir, or removed by another worker
+            entries.append({
+                'path': entry_dir,
+                'step': entry_dir.name.split('_', 1)[-1].split('-', 1)[0],
+                'size': size,
+                'mtime': st.st_mtime,
+                'atime': st.st_atime,
+            })
+        return entries
+
+    def _entry_size(self, entry_dir: Path) -> int:
+        """Bytes used by one entry (0 if it does not exist)"""
+        try:
+            (entry_dir / MANIFEST_FILENAME).stat()
+            return sum(f.stat().st_size for f in entry_dir.iterdir())
+        except (FileNotFoundError, NotADirectoryError):
+            return 0
+
+    def _scan_usage(self) -> Dict[str, int]:
+        """Current on-disk totals (one directory scan)"""
+        entries = self._entries()
+        return {'bytes': sum(e['size'] for e in entries), 'entries': len(entries)}
+
+    def _over_limit(self, total_bytes: int, n_entries: int, share: float = 1.0) -> bool:
+        """Whether totals exceed `share` of max_bytes / max_entries"""
+        return (
+            (self.max_entries is not None and n_entries > int(self.max_entries * share))
+            or (self.max_bytes is not None and total_bytes > self.max_bytes * share)
+        )
+
+    def _ttl_for(self, step: str) -> Optional[float]:
+        """TTL in seconds for a step (None = never expires)"""
+        if isinstance(self.ttl, dict):
+            return self.ttl.get(step)
+        return self.ttl
+
+    def _is_expired(self, entry_dir: Path, step: str, mtime: Optional[float] = None) -> bool:
+        """Check entry age against the step TTL"""
+        ttl = self._ttl_for(step)
+        if ttl is None:
+            return False
+        if mtime is None:
+            try:
+                mtime = (entry_dir / MANIFEST_FILENAME).stat().st_mtime
+            except FileNotFoundError:
+                return True
+        return time.time() - mtime > ttl
+
+    def _touch(self, entry_dir: Path) -> None:
+        """Mark entry as used now (atime) without changing its write time"""
+        manifest_path = entry_dir / MANIFEST_FILENAME
+        try:
+            st = manifest_path.stat()
+            os.utime(manifest_path, ns=(time.time_ns(), st.st_mtime_ns))
+        except OSError:
+            pass
+
+    def _remove(self, entry_dir: Path) -> None:
+        """Delete an entry, tolerating concurrent removal"""
+        if self._usage is not None:
+            size = self._entry_size(entry_dir)
+            if size:
+                self._usage['bytes'] -= size
+                self._usage['entries'] -= 1
+        shutil.rmtree(entry_dir, ignore_errors=True)
+
+    def _record(self, step: str, outcome: str) -> None:
+        """Count a hit or miss globally and per step"""
+        self._stats[outcome] += 1
+        step_counts = self._step_stats.setdefault(step, {'hits': 0, 'misses': 0})
+        step_counts[outcome] += 1
+
+    # Key index
+
+    def _index_entry_path(self, resolved: str) -> Path:
+        """Index file of one PDF path"""
+        return self.index_dir / f"{hashlib.md5(resolved.encode('utf-8')).hexdigest()}.json"
+
+    def _load_index_entry(self, resolved: str) -> Optional[Dict]:
+        """Load one PDF's key index entry (None if missing or corrupt)"""
+        try:
+            with open(self._index_entry_path(resolved), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            if entry.get('path') == resolved and 'stat' in entry and 'md5' in entry:
+                return entry
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Cache index entry unreadable, rehashing: {e}")
+        return None
+
+    def _save_index_entry(self, entry: Dict) -> None:
+        """Write one PDF's key index entry atomically (other PDFs' entries untouched)"""
+        index_path = self._index_entry_path(entry['path'])
+        tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            logger.warning(f"Cache index write failed: {e}")
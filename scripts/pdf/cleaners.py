@@ -7,8 +7,9 @@ Author: Claude Code
 Created: 2025-11-16
 
 Features:
-- Remove merged header rows
+- Remove merged header rows (single combined pattern)
 - Fix split cells and wrapped rows
+- Fused cell cleaning + numeric conversion (one copy of the frame)
 - Normalize column names
 - Type conversion (string → numeric)
 - Handle special characters (±, ∼, –, <)
@@ -40,23 +41,17 @@ def clean_extracted_table(df: pd.DataFrame, table_type: str) -> pd.DataFrame:
 
     logger.debug(f"Cleaning table (type: {table_type}, rows: {len(df)})")
 
-    # 1. Remove problematic rows
-    df = _remove_header_rows(df)
-    df = _remove_footer_rows(df)
-    df = _remove_continued_rows(df)
+    # 1. Remove problematic rows (header, footer and "continued" rows in one mask)
+    df = _remove_problem_rows(df)
 
-    # 2. Fix structural issues
+    # 2. Fix structural issues (wrapped cells are fixed with the cell values)
     df = _merge_split_rows(df, table_type)
-    df = _fix_wrapped_cells(df)
 
     # 3. Normalize column names
     df.columns = [_normalize_column_name(col) for col in df.columns]
 
-    # 4. Clean cell values
-    df = _clean_cell_values(df)
-
-    # 5. Type conversion
-    df = _convert_numeric_columns(df, table_type)
+    # 4-5. Clean cell values and convert numeric columns (single pass)
+    df = _clean_and_convert(df, table_type)
 
     # 6. Remove empty rows/columns
     df = _remove_empty_rows_cols(df)
@@ -66,87 +61,62 @@ def clean_extracted_table(df: pd.DataFrame, table_type: str) -> pd.DataFrame:
     return df
 
 
-def _remove_header_rows(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Remove merged header rows
+# Merged header rows ("Table X", "continued", ...)
+HEADER_PATTERNS = [
+    r'table\s+\d+',
+    r'continued',
+    r'supplement',
+    r'appendix'
+]
 
-    Common patterns:
-    - Rows containing "Table X" or "continued"
-    - Rows with <50% filled cells
-    - Duplicate header rows
-    """
-    # Find rows that look like headers
-    header_patterns = [
-        r'table\s+\d+',
-        r'continued',
-        r'supplement',
-        r'appendix'
-    ]
+# Footer rows (footnotes, notes, error legends)
+FOOTER_PATTERNS = [
+    r'^[\*a-z]\s',  # Footnote markers
+    r'note:',
+    r'abbreviation',
+    r'±\s*=',  # "± = 1σ error"
+]
 
-    rows_to_drop = []
+PROBLEM_ROW_RE = re.compile('|'.join(f'(?:{p})' for p in HEADER_PATTERNS + FOOTER_PATTERNS), re.IGNORECASE)
 
-    for idx, row in df.iterrows():
-        row_str = ' '.join([str(val).lower() for val in row])
 
-        # Check for header patterns
-        for pattern in header_patterns:
-            if re.search(pattern, row_str, re.IGNORECASE):
-                rows_to_drop.append(idx)
-                break
-
-    if rows_to_drop:
-        df = df.drop(rows_to_drop)
-        logger.debug(f"Removed {len(rows_to_drop)} header rows")
-
-    return df
-
-
-def _remove_footer_rows(df: pd.DataFrame) -> pd.DataFrame:
+def _remove_problem_rows(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Remove footer rows
+    Remove merged header, footer and "continued" rows
 
     Common patterns:
-    - Rows containing footnotes (*,a,b,c)
-    - Rows starting with "Note:"
-    - Rows with mostly empty cells at end of table
-    """
-    footer_patterns = [
-        r'^[\*a-z]\s',  # Footnote markers
-        r'note:',
-        r'abbreviation',
-        r'±\s*=',  # "± = 1σ error"
-    ]
+    - Rows containing "Table X", "continued", "supplement", "appendix"
+    - Rows starting with a footnote marker, or containing "Note:"
+    - Rows where the first cell says "continued" (mid-table)
 
-    rows_to_drop = []
+    Each row is joined into one lowercase string and matched once against
+    a combined pattern.
+    """
+    if len(df) == 0:
+        return df
 
-    for idx, row in df.iterrows():
-        row_str = ' '.join([str(val).lower() for val in row])
+    values = df.to_numpy(dtype=object)
+    row_text = pd.Series([' '.join([str(val).lower() for val in row]) for row in values.tolist()])
+    drop = row_text.str.contains(PROBLEM_ROW_RE, na=False)
 
-        # Check for footer patterns
-        for pattern in footer_patterns:
-            if re.search(pattern, row_str, re.IGNORECASE):
-                rows_to_drop.append(idx)
-                break
+    # "continued" in the first cell
+    first_col = pd.Series(values[:, 0]).astype(str)
+    drop = (drop | first_col.str.contains('continued', case=False, na=False)).to_numpy()
 
-    if rows_to_drop:
-        df = df.drop(rows_to_drop)
-        logger.debug(f"Removed {len(rows_to_drop)} footer rows")
+    if drop.any():
+        df = df[~drop]
+        logger.debug(f"Removed {int(drop.sum())} header/footer/continued rows")
 
     return df
 
 
-def _remove_continued_rows(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Remove "continued" rows that appear mid-table
-    """
-    # Look for rows where first cell contains "continued"
-    mask = df.iloc[:, 0].astype(str).str.contains('continued', case=False, na=False)
-
-    if mask.any():
-        df = df[~mask]
-        logger.debug(f"Removed {mask.sum()} 'continued' rows")
-
-    return df
+# Whether rows with an empty first column are merged into the row above, by table type
+SPLIT_ROW_MERGE = {
+    'AFT_ages': True,
+    'UThHe': True,
+    'track_counts': True,
+    'track_lengths': False,  # One length per row; blank sample cells are normal
+}
 
 
 def _merge_split_rows(df: pd.DataFrame, table_type: str) -> pd.DataFrame:
@@ -159,66 +129,82 @@ def _merge_split_rows(df: pd.DataFrame, table_type: str) -> pd.DataFrame:
     →
     Row 1: "Sample A", "123.4", "±5.6", "20"
 
+    A row with an empty first column continues the row above only if it
+    fills cells that are still empty there; a row repeating filled columns
+    (e.g. the next grain of a sample) is kept as its own row. Rows are
+    grouped by a cumulative sum over anchor rows and each group collapses
+    to its first filled value per column.
+
     Args:
         df: DataFrame
-        table_type: Table type
+        table_type: Table type (see SPLIT_ROW_MERGE)
 
     Returns:
-        DataFrame with merged rows
+        DataFrame with merged rows (index of the anchor rows)
     """
-    # TEMPORARILY DISABLED due to pandas 2.x compatibility issues
-    return df
-
-    # This is complex and table-specific
-    # For now, implement basic version
-
-    # Identify split rows: rows where first column is empty but others have data
-    if len(df) == 0:
+    if len(df) < 2 or len(df.columns) == 0 or not SPLIT_ROW_MERGE.get(table_type, True):
         return df
 
-    first_col = df.iloc[:, 0]
-    is_split = first_col.isna() | (first_col.astype(str).str.strip() == '')
-
-    # Merge with previous row
-    merged_rows = []
-    i = 0
-
-    while i < len(df):
-        current_row = df.iloc[i].copy()
+    values = df.to_numpy(dtype=object)
+    filled = ~pd.isna(values) & (np.char.strip(values.astype(str)) != '')
+
+    # Rows with a first-column value start a group (as does the first row)
+    is_anchor = filled[:, 0].copy()
+    is_anchor[0] = True
+
+    # Continuations overlapping cells already filled in their group start their
+    # own. Overlapping the row directly above is decisive whatever the groups;
+    # otherwise only the first such row per group is certain (the groups of
+    # later ones depend on it), so those are added until none remain
+    is_anchor[1:] |= (filled[1:] & filled[:-1]).any(axis=1)
+    overlaps = _overlaps_group(filled, is_anchor)
+    while overlaps.any():
+        rows = np.flatnonzero(overlaps)
+        group = np.cumsum(is_anchor) - 1
+        is_anchor[rows[np.unique(group[rows], return_index=True)[1]]] = True
+        overlaps = _overlaps_group(filled, is_anchor)
+
+    starts = np.flatnonzero(is_anchor)
+    if len(starts) == len(df):
+        return df
 
-        # Check if next row is a split row
-        if i + 1 < len(df) and is_split.iloc[i + 1]:
-            next_row = df.iloc[i + 1]
+    # First filled row per group and column (anchor row if none are filled)
+    n_rows = len(df)
+    row_idx = np.where(filled, np.arange(n_rows)[:, None], n_rows)
+    first = np.minimum.reduceat(row_idx, starts, axis=0)
+    first = np.where(first == n_rows, starts[:, None], first)
+    merged = values[first, np.arange(len(df.columns))]
 
-            # Merge: fill empty cells in current with values from next
-            for col in df.columns:
-                val = current_row[col]
-                if pd.isna(val) or (isinstance(val, str) and val == ''):
-                    current_row[col] = next_row[col]
+    result = pd.DataFrame(
+        {i: pd.Series(merged[:, i]).astype(df.dtypes.iloc[i]) for i in range(len(df.columns))}
+    )
+    result.index = df.index[starts]
+    result.columns = df.columns
 
-            i += 2  # Skip next row
-        else:
-            i += 1
+    logger.debug(f"Merged split rows: {len(df)} → {len(result)} rows")
 
-        merged_rows.append(current_row)
+    return result
 
-    if len(merged_rows) < len(df):
-        df = pd.DataFrame(merged_rows)
-        logger.debug(f"Merged split rows: {len(df)} rows after merge")
 
-    return df
+def _overlaps_group(filled: np.ndarray, is_anchor: np.ndarray) -> np.ndarray:
+    """
+    Non-anchor rows with a filled cell already filled earlier in their group
 
+    Args:
+        filled: (rows, cols) boolean mask of non-empty cells
+        is_anchor: Rows starting a group
 
-def _fix_wrapped_cells(df: pd.DataFrame) -> pd.DataFrame:
+    Returns:
+        Boolean mask of overlapping rows
     """
-    Fix cells where text wrapped across multiple lines
+    group = np.cumsum(is_anchor) - 1
+    group_start = np.flatnonzero(is_anchor)[group]
 
-    Example: "Sample\nName" → "Sample Name"
-    """
-    # Replace newlines in cells with spaces
-    df = df.replace({r'\n': ' ', r'\r': ' '}, regex=True)
+    # Filled count per column over rows [group start, row)
+    before = np.cumsum(filled, axis=0) - filled
+    seen = (before - before[group_start]) > 0
 
-    return df
+    return ~is_anchor & (filled & seen).any(axis=1)
 
 
 def _normalize_column_name(col: str) -> str:
@@ -272,66 +258,75 @@ def _normalize_column_name(col: str) -> str:
     return col
 
 
-def _clean_cell_values(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Clean individual cell values
+# Whole-cell replacements (a cell equal to the key becomes the value)
+CELL_REPLACEMENTS = {
+    '±': ' ',      # Remove ± (will split on space later)
+    '∼': '~',
+    '–': '-',      # En-dash → hyphen
+    '—': '-',      # Em-dash → hyphen
+    '<': '',       # Remove < (e.g., "<0.01")
+    '>': '',       # Remove >
+    ',': '',       # Remove thousands separator
+}
 
-    - Remove special characters
-    - Normalize whitespace
-    - Handle < and > symbols
-    """
-    # Replace common special characters
-    replacements = {
-        '±': ' ',      # Remove ± (will split on space later)
-        '∼': '~',
-        '–': '-',      # En-dash → hyphen
-        '—': '-',      # Em-dash → hyphen
-        '<': '',       # Remove < (e.g., "<0.01")
-        '>': '',       # Remove >
-        ',': '',       # Remove thousands separator
-    }
+# Any whitespace run (including wrapped-line newlines) → single space
+WHITESPACE_RE = re.compile(r'\s+')
 
-    for old, new in replacements.items():
-        df = df.replace(old, new, regex=False)
+# Column name fragments that mark numeric columns, by table type
+NUMERIC_PATTERNS = {
+    'AFT_ages': ['age', 'error', 'ma', 'dispersion', 'pchi2', 'p_chi2', 'grains', 'n'],
+    'UThHe': ['u', 'th', 'he', 'sm', 'age', 'ma', 'ft', 'mass', 'radius'],
+    'track_counts': ['ns', 'ni', 'nd', 'rho', 'u', 'th', 'eu', 'dpar'],
+    'track_lengths': ['length', 'angle', 'dpar']
+}
 
-    # Normalize whitespace
-    df = df.replace({r'\s+': ' '}, regex=True)
 
-    return df
+def _clean_cell(value):
+    """Clean one cell: whole-cell replacements, then whitespace normalization"""
+    if isinstance(value, str):
+        return WHITESPACE_RE.sub(' ', CELL_REPLACEMENTS.get(value, value))
+    return value
+
 
+_clean_cells = np.frompyfunc(_clean_cell, 1, 1)
 
-def _convert_numeric_columns(df: pd.DataFrame, table_type: str) -> pd.DataFrame:
+
+def _clean_and_convert(df: pd.DataFrame, table_type: str) -> pd.DataFrame:
     """
-    Convert string columns to numeric where appropriate
+    Clean cell values and convert numeric columns in one pass
+
+    - Whole-cell replacement of special characters (CELL_REPLACEMENTS)
+    - Wrapped text and whitespace runs → single space
+    - Columns named like numeric fields (NUMERIC_PATTERNS) → numbers
+
+    The frame is copied once into an object array, cleaned there, and
+    rebuilt column by column.
 
     Args:
         df: DataFrame
         table_type: Table type (for type-specific conversion)
 
     Returns:
-        DataFrame with converted columns
+        Cleaned DataFrame
     """
-    # Identify numeric columns based on table type
-    numeric_patterns = {
-        'AFT_ages': ['age', 'error', 'ma', 'dispersion', 'pchi2', 'p_chi2', 'grains', 'n'],
-        'UThHe': ['u', 'th', 'he', 'sm', 'age', 'ma', 'ft', 'mass', 'radius'],
-        'track_counts': ['ns', 'ni', 'nd', 'rho', 'u', 'th', 'eu', 'dpar'],
-        'track_lengths': ['length', 'angle', 'dpar']
-    }
-
-    patterns = numeric_patterns.get(table_type, [])
-
-    for col in df.columns:
-        col_lower = str(col).lower()
-
-        # Check if column should be numeric
-        should_convert = any(pattern in col_lower for pattern in patterns)
-
-        if should_convert:
-            # Try to convert to numeric
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+    patterns = NUMERIC_PATTERNS.get(table_type, [])
+    cleaned = _clean_cells(df.to_numpy(dtype=object))
+
+    columns = {}
+    for i, col in enumerate(df.columns):
+        dtype = df.dtypes.iloc[i]
+        values = pd.Series(cleaned[:, i], index=df.index)
+
+        if any(pattern in str(col).lower() for pattern in patterns):
+            columns[i] = pd.to_numeric(values, errors='coerce')
+        elif dtype == object or isinstance(dtype, pd.StringDtype):
+            columns[i] = values.astype(dtype)
+        else:
+            columns[i] = df.iloc[:, i]  # Non-text columns are left untouched
 
-    return df
+    result = pd.DataFrame(columns, index=df.index)
+    result.columns = df.columns
+    return result
 
 
 def _remove_empty_rows_cols(df: pd.DataFrame) -> pd.DataFrame:
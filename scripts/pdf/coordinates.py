@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Page Coordinate Frames
+
+Purpose: Keep bboxes consistent across extractors on rotated pages
+Created: 2026-10-17
+
+Frames:
+- Page frame: unrotated page, top-left origin. PyMuPDF text, search_for
+  results and all pipeline bboxes use it.
+- Display frame: the page as viewed (page.rotation applied). pdfplumber
+  uses it.
+- Reading frame: the frame in which a page's text runs left to right,
+  with the page's top-left corner at the origin. Rotated (landscape)
+  tables are laid out there and mapped back.
+- Camelot areas: the reading frame with a bottom-left origin (Camelot
+  turns pages upright itself, so its frame is the reading frame).
+
+Example:
+    matrix = reading_matrix(spans, page)
+    if matrix is not None:
+        spans = spans.transform(matrix)
+"""
+
+import logging
+from typing import Optional, Tuple
+import numpy as np
+import fitz  # pymupdf
+
+from .spans import SpanStore
+
+logger = logging.getLogger(__name__)
+
+# Writing directions within this cosine of (1, 0) count as horizontal
+HORIZONTAL_COS = 0.9
+
+
+def unrotated_rect(page: fitz.Page) -> fitz.Rect:
+    """
+    Page rectangle in the page frame (unrotated)
+
+    Args:
+        page: PyMuPDF page
+
+    Returns:
+        Rect (page.rect is in the display frame)
+    """
+    return page.rect * page.derotation_matrix
+
+
+def transform_bbox(bbox: Tuple[float, float, float, float], matrix: fitz.Matrix) -> Tuple[float, float, float, float]:
+    """
+    Bounding box of a transformed bbox
+
+    Args:
+        bbox: (x0, y0, x1, y1)
+        matrix: Transformation matrix
+
+    Returns:
+        (x0, y0, x1, y1) in the target frame
+    """
+    rect = fitz.Rect(bbox) * matrix
+    return (rect.x0, rect.y0, rect.x1, rect.y1)
+
+
+def to_display(bbox: Tuple[float, float, float, float], page: fitz.Page) -> Tuple[float, float, float, float]:
+    """
+    Page-frame bbox in the display frame (pdfplumber coordinates)
+
+    Args:
+        bbox: (x0, y0, x1, y1) in the page frame
+        page: PyMuPDF page
+
+    Returns:
+        (x0, y0, x1, y1) in the display frame
+    """
+    if page.rotation == 0:
+        return tuple(bbox)
+    return transform_bbox(bbox, page.rotation_matrix)
+
+
+def to_camelot_area(
+    bbox: Tuple[float, float, float, float],
+    page: fitz.Page,
+    matrix: Optional[fitz.Matrix] = None
+) -> str:
+    """
+    Camelot table area ("x1,y1,x2,y2", bottom-left origin) for a page-frame bbox
+
+    Args:
+        bbox: (x0, y0, x1, y1) in the page frame
+        page: PyMuPDF page
+        matrix: Page frame → reading frame of the region (None if upright)
+
+    Returns:
+        Camelot table_areas entry
+    """
+    rect = unrotated_rect(page)
+    if matrix is not None:
+        bbox = transform_bbox(bbox, matrix)
+        rect = rect * matrix
+
+    x1, y1, x2, y2 = bbox
+    page_height = rect.height
+    return f"{x1},{page_height - y2},{x2},{page_height - y1}"
+
+
+def from_camelot_area(
+    area: Tuple[float, float, float, float],
+    page: fitz.Page,
+    matrix: Optional[fitz.Matrix] = None
+) -> Tuple[float, float, float, float]:
+    """
+    Page-frame bbox of a Camelot bbox (inverse of to_camelot_area)
+
+    Args:
+        area: (x1, y1, x2, y2) with bottom-left origin (e.g. table._bbox)
+        page: PyMuPDF page
+        matrix: Page frame → reading frame Camelot read in (None if upright)
+
+    Returns:
+        (x0, y0, x1, y1) in the page frame
+    """
+    rect = unrotated_rect(page)
+    if matrix is not None:
+        rect = rect * matrix
+
+    x1, y1, x2, y2 = area
+    page_height = rect.height
+    bbox = (x1, page_height - y2, x2, page_height - y1)
+    if matrix is not None:
+        bbox = transform_bbox(bbox, ~matrix)
+    return bbox
+
+
+def reading_matrix(spans: SpanStore, page: fitz.Page) -> Optional[fitz.Matrix]:
+    """
+    Matrix taking page-frame coordinates into the spans' reading frame
+
+    Args:
+        spans: Spans in the page frame
+        page: PyMuPDF page (its rotation is preferred when it makes the
+            text horizontal, as for landscape pages)
+
+    Returns:
+        Matrix, or None if the text is already mostly horizontal
+    """
+    if len(spans) == 0:
+        return None
+
+    horizontal = spans.dirs[:, 0] >= HORIZONTAL_COS
+    if horizontal.mean() >= 0.5:
+        return None
+
+    # Dominant writing direction of the rotated text
+    cos, sin = np.median(spans.dirs[~horizontal], axis=0)
+    norm = float(np.hypot(cos, sin)) or 1.0
+    cos, sin = float(cos) / norm, float(sin) / norm
+
+    rotation = page.rotation_matrix
+    if rotation.a * cos + rotation.c * sin >= HORIZONTAL_COS:
+        return fitz.Matrix(rotation)
+
+    # Rotate the dominant direction onto (1, 0), page corner back at the origin
+    matrix = fitz.Matrix(cos, -sin, sin, cos, 0, 0)
+    rect = unrotated_rect(page) * matrix
+    return matrix * fitz.Matrix(1, 0, 0, 1, -rect.x0, -rect.y0)
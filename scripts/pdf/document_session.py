@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Shared PDF Document Session
+
+Purpose: Open a PDF once and share parsed pages across the extraction pipeline
+Created: 2026-10-17
+
+Features:
+- Single PyMuPDF document handle (opened lazily)
+- Single pdfplumber handle (opened lazily, only if a fallback needs it)
+- Per-page geometry (rect, height, rotation) in page and display frames
+- Derotated spans for rotated text (reading frame, cached)
+- Page text index (text + block geometry of every page, built once)
+- One text dict / span parse per page; table regions are cut from it
+- One Camelot parse per page and flavor for all registered table regions
+- Page layouts (grid-indexed spans for table region detection)
+
+Example:
+    with DocumentSession('paper.pdf') as session:
+        structure = DocumentStructure('paper.pdf', session=session)
+        df = extract_table_from_text('paper.pdf', 3, bbox, session=session)
+"""
+
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+import pandas as pd
+import fitz  # pymupdf
+
+from .coordinates import reading_matrix, to_camelot_area, unrotated_rect
+from .layout import PageLayout
+from .spans import SPAN_TEXT_FLAGS, SpanStore
+from .text_index import PageTextIndex
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentSession:
+    """Open-once view of a PDF shared by all extractors"""
+
+    def __init__(self, pdf_path: str):
+        """
+        Initialize session (the PDF is opened on first use)
+
+        Args:
+            pdf_path: Path to PDF file
+        """
+        self.pdf_path = str(Path(pdf_path))
+        self._doc = None
+        self._plumber = None
+        self._pages: Dict[int, fitz.Page] = {}
+        self._text_index: Optional[PageTextIndex] = None
+        self._text_dicts: Dict[Tuple, Dict] = {}
+        self._spans: Dict[Tuple, SpanStore] = {}
+        self._reading_spans: Dict[Tuple, Tuple[SpanStore, Optional[fitz.Matrix]]] = {}
+        self._layouts: Dict[int, PageLayout] = {}
+        self._table_regions: Dict[int, List[Tuple]] = {}
+        self._camelot: Dict[Tuple, Dict[str, Optional[pd.DataFrame]]] = {}
+
+    @property
+    def doc(self) -> fitz.Document:
+        """PyMuPDF document (opened once)"""
+        if self._doc is None:
+            logger.debug(f"Opening {Path(self.pdf_path).name}")
+            self._doc = fitz.open(self.pdf_path)
+        return self._doc
+
+    def __len__(self) -> int:
+        return len(self.doc)
+
+    def page(self, page_num: int) -> fitz.Page:
+        """
+        Get a loaded page (parsed once per session)
+
+        Args:
+            page_num: Page number (0-indexed)
+
+        Returns:
+            PyMuPDF page
+        """
+        if page_num not in self._pages:
+            self._pages[page_num] = self.doc[page_num]
+        return self._pages[page_num]
+
+    def page_rect(self, page_num: int) -> fitz.Rect:
+        """Page rectangle (in rotated/display coordinates)"""
+        return self.page(page_num).rect
+
+    def page_frame_rect(self, page_num: int) -> fitz.Rect:
+        """Page rectangle in the page frame (unrotated, same coordinates as text and bboxes)"""
+        return unrotated_rect(self.page(page_num))
+
+    def page_height(self, page_num: int) -> float:
+        """Unrotated page height in points (for bottom-left origin conversions)"""
+        return self.page_frame_rect(page_num).height
+
+    def page_rotation(self, page_num: int) -> int:
+        """Page rotation in degrees (0, 90, 180, 270)"""
+        return self.page(page_num).rotation
+
+    def text_index(self) -> PageTextIndex:
+        """Text index of every page (built on first use)"""
+        if self._text_index is None:
+            self._text_index = PageTextIndex.from_document(self.doc, self._pages)
+        return self._text_index
+
+    def set_text_index(self, index: PageTextIndex) -> None:
+        """
+        Use an existing text index (e.g. from cache) instead of re-extracting
+
+        Args:
+            index: PageTextIndex of this PDF
+        """
+        self._text_index = index
+
+    def page_text(self, page_num: int) -> str:
+        """
+        Plain text of a page (from the text index)
+
+        Args:
+            page_num: Page number (0-indexed)
+
+        Returns:
+            Page text
+        """
+        return self.text_index().page_text(page_num)
+
+    def full_text(self) -> str:
+        """Concatenated text of all pages"""
+        return self.text_index().full_text
+
+    def text_dict(self, page_num: int, clip: Optional[Tuple] = None) -> Dict:
+        """
+        PyMuPDF text dict for a page region (the page is parsed once)
+
+        Args:
+            page_num: Page number (0-indexed)
+            clip: Optional (x0, y0, x1, y1) region; spans whose centre lies
+                in it are kept (whole spans)
+
+        Returns:
+            Text dict (page.get_text("dict"), text blocks only)
+        """
+        if page_num not in self._text_dicts:
+            self._text_dicts[page_num] = self.page(page_num).get_text("dict", flags=SPAN_TEXT_FLAGS)
+        text_dict = self._text_dicts[page_num]
+        if clip is None:
+            return text_dict
+
+        x0, y0, x1, y1 = clip
+
+        def inside(span):
+            sx0, sy0, sx1, sy1 = span['bbox']
+            return x0 <= (sx0 + sx1) / 2 <= x1 and y0 <= (sy0 + sy1) / 2 <= y1
+
+        blocks = []
+        for block in text_dict['blocks']:
+            lines = []
+            for line in block.get('lines', []):
+                spans = [span for span in line['spans'] if inside(span)]
+                if spans:
+                    lines.append({**line, 'spans': spans})
+            if lines:
+                blocks.append({**block, 'lines': lines})
+        return {**text_dict, 'blocks': blocks}
+
+    def spans(self, page_num: int, clip: Optional[Tuple] = None) -> SpanStore:
+        """
+        Compact text spans for a page region (cut from the page's spans)
+
+        Args:
+            page_num: Page number (0-indexed)
+            clip: Optional (x0, y0, x1, y1) region; spans whose centre lies
+                in it are kept
+
+        Returns:
+            SpanStore of the region's non-blank spans
+        """
+        key = (page_num, tuple(clip) if clip is not None else None)
+        if key not in self._spans:
+            if clip is None:
+                self._spans[key] = SpanStore.from_text_dict(self.text_dict(page_num))
+            else:
+                self._spans[key] = self.spans(page_num).clipped(clip)
+        return self._spans[key]
+
+    def reading_matrix(self, page_num: int, clip: Optional[Tuple] = None) -> Optional[fitz.Matrix]:
+        """
+        Page frame → reading frame of a page region (computed once per page + clip)
+
+        Args:
+            page_num: Page number (0-indexed)
+            clip: Optional (x0, y0, x1, y1) region in the page frame
+
+        Returns:
+            Matrix, or None if the region's text is horizontal
+        """
+        return self._reading_frame(page_num, clip)[1]
+
+    def reading_spans(self, page_num: int, clip: Optional[Tuple] = None) -> SpanStore:
+        """
+        Spans of a page region in their reading frame (derotated once per page + clip)
+
+        Rotated text (e.g. landscape tables) is mapped so it runs left to
+        right; horizontal text is returned unchanged.
+
+        Args:
+            page_num: Page number (0-indexed)
+            clip: Optional (x0, y0, x1, y1) region in the page frame
+
+        Returns:
+            SpanStore in the reading frame
+        """
+        return self._reading_frame(page_num, clip)[0]
+
+    def _reading_frame(self, page_num: int, clip: Optional[Tuple]) -> Tuple[SpanStore, Optional[fitz.Matrix]]:
+        key = (page_num, tuple(clip) if clip is not None else None)
+        if key not in self._reading_spans:
+            spans = self.spans(page_num, clip)
+            matrix = reading_matrix(spans, self.page(page_num))
+            if matrix is not None:
+                logger.debug(f"Derotating {len(spans)} spans on page {page_num}")
+                spans = spans.transform(matrix)
+            self._reading_spans[key] = (spans, matrix)
+        return self._reading_spans[key]
+
+    def layout(self, page_num: int) -> PageLayout:
+        """
+        Layout of a page: all its spans with a grid index (built once per page)
+
+        Args:
+            page_num: Page number (0-indexed)
+
+        Returns:
+            PageLayout (in the page's reading frame, bboxes in the page frame)
+        """
+        if page_num not in self._layouts:
+            spans = self.spans(page_num)
+            rect = self.page_frame_rect(page_num)
+            matrix = reading_matrix(spans, self.page(page_num))
+            self._layouts[page_num] = PageLayout(spans, (rect.x0, rect.y0, rect.x1, rect.y1), matrix)
+        return self._layouts[page_num]
+
+    def add_table_region(self, page_num: int, bbox: Tuple) -> None:
+        """
+        Register a table region (parsed by Camelot with its page's other regions)
+
+        Args:
+            page_num: Page number (0-indexed)
+            bbox: (x0, y0, x1, y1) in the page frame
+        """
+        regions = self._table_regions.setdefault(page_num, [])
+        if tuple(bbox) not in regions:
+            regions.append(tuple(bbox))
+
+    def camelot_table(self, page_num: int, area: str, flavor: str, **params) -> Optional[pd.DataFrame]:
+        """
+        Camelot table of one area, parsed once per page, flavor and params
+
+        The first request for a page runs camelot.read_pdf over the area
+        together with the areas of every registered region on the page;
+        requests for those areas then reuse the parse.
+
+        Args:
+            page_num: Page number (0-indexed)
+            area: Camelot table area ("x1,y1,x2,y2", bottom-left origin)
+            flavor: 'lattice' or 'stream'
+            **params: Further camelot.read_pdf options
+
+        Returns:
+            DataFrame of the area's first table, or None
+        """
+        parsed = self._camelot.setdefault((page_num, flavor, tuple(sorted(params.items()))), {})
+        if area not in parsed:
+            areas = [area] + [
+                other for other in self._region_areas(page_num)
+                if other != area and other not in parsed
+            ]
+            try:
+                parsed.update(_read_camelot_areas(self.pdf_path, page_num, areas, flavor, params))
+            except Exception as e:
+                if len(areas) == 1:
+                    raise
+                logger.debug(f"Camelot {flavor} failed on page {page_num} regions ({e}), parsing area alone")
+                parsed.update(_read_camelot_areas(self.pdf_path, page_num, [area], flavor, params))
+        return parsed[area]
+
+    def _region_areas(self, page_num: int) -> List[str]:
+        """Camelot areas of the registered table regions on a page"""
+        page = self.page(page_num)
+        return [
+            to_camelot_area(bbox, page, self.reading_matrix(page_num, bbox))
+            for bbox in self._table_regions.get(page_num, [])
+        ]
+
+    @property
+    def plumber(self):
+        """pdfplumber document (opened once, only when needed)"""
+        if self._plumber is None:
+            import pdfplumber
+            self._plumber = pdfplumber.open(self.pdf_path)
+        return self._plumber
+
+    def plumber_page(self, page_num: int):
+        """
+        Get a pdfplumber page
+
+        The page's objects are parsed once; crops of it (one per table
+        region) filter that parse.
+
+        Args:
+            page_num: Page number (0-indexed)
+
+        Returns:
+            pdfplumber Page or None if out of range
+        """
+        if page_num >= len(self.plumber.pages):
+            return None
+        return self.plumber.pages[page_num]
+
+    def close(self) -> None:
+        """Release document handles and memoized page data"""
+        self._pages.clear()
+        self._text_index = None
+        self._text_dicts.clear()
+        self._spans.clear()
+        self._reading_spans.clear()
+        self._layouts.clear()
+        self._table_regions.clear()
+        self._camelot.clear()
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+        if self._plumber is not None:
+            self._plumber.close()
+            self._plumber = None
+
+    def __enter__(self) -> 'DocumentSession':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __getstate__(self):
+        """Sessions cross process boundaries as a path only"""
+        return {'pdf_path': self.pdf_path}
+
+    def __setstate__(self, state):
+        self.__init__(state['pdf_path'])
+
+    def __del__(self):
+        """Close handles on cleanup"""
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+def _read_camelot_areas(
+    pdf_path: str,
+    page_num: int,
+    areas: List[str],
+    flavor: str,
+    params: Dict
+) -> Dict[str, Optional[pd.DataFrame]]:
+    """
+    Parse several table areas of a page with one camelot.read_pdf call
+
+    Args:
+        pdf_path: Path to PDF file
+        page_num: Page number (0-indexed)
+        areas: Camelot table areas ("x1,y1,x2,y2")
+        flavor: 'lattice' or 'stream'
+        params: Further camelot.read_pdf options
+
+    Returns:
+        Area → DataFrame of its first table (None if no table was found)
+    """
+    import camelot
+
+    tables = camelot.read_pdf(pdf_path, pages=str(page_num + 1), flavor=flavor, table_areas=areas, **params)
+
+    # Each table belongs to the area it overlaps most
+    boxes = [tuple(float(v) for v in area.split(',')) for area in areas]
+    result = {area: None for area in areas}
+    for table in tables:
+        tx1, ty1, tx2, ty2 = table._bbox
+        overlaps = [
+            max(0.0, min(tx2, x2) - max(tx1, x1)) * max(0.0, min(ty2, y2) - max(ty1, y1))
+            for x1, y1, x2, y2 in boxes
+        ]
+        best = max(range(len(areas)), key=overlaps.__getitem__)
+        if overlaps[best] > 0 and result[areas[best]] is None:
+            result[areas[best]] = table.df
+
+    logger.debug(f"Camelot {flavor}: {len(tables)} tables from {len(areas)} areas on page {page_num}")
+    return result
+
+
+@contextmanager
+def open_session(pdf_path: str, session: Optional[DocumentSession] = None) -> Iterator[DocumentSession]:
+    """
+    Use the caller's session, or a temporary one closed on exit
+
+    Args:
+        pdf_path: Path to PDF file
+        session: Existing session to reuse (left open)
+
+    Yields:
+        DocumentSession
+    """
+    if session is not None:
+        yield session
+        return
+
+    owned = DocumentSession(pdf_path)
+    try:
+        yield owned
+    finally:
+        owned.close()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Extracted Table Container
+
+Purpose: Carry an extracted table with its classification and provenance
+Created: 2026-10-17
+
+Features:
+- Table type from DocumentStructure (no re-detection downstream)
+- Provenance: page, bbox, extraction method, quality score
+- Plain-dict provenance for caching alongside the DataFrame
+
+Example:
+    table = ExtractedTable('Table 1', 'AFT_ages', df, page=3, method='text_extraction')
+    fair_data = FAIRTransformer().transform({table.table_id: table}, metadata)
+"""
+
+from dataclasses import dataclass, fields
+from typing import Dict, Optional, Tuple
+import pandas as pd
+
+
+@dataclass
+class ExtractedTable:
+    """One extracted (and cleaned) table with its type and provenance"""
+
+    table_id: str
+    table_type: str
+    df: pd.DataFrame
+    page: Optional[int] = None
+    bbox: Optional[Tuple[float, float, float, float]] = None
+    method: Optional[str] = None
+    quality: Optional[float] = None
+
+    def provenance(self) -> Dict:
+        """Everything except the DataFrame, as a plain dict (the DataFrame is not copied)"""
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.name != 'df'}
+
+    @classmethod
+    def from_provenance(cls, df: pd.DataFrame, info: Dict) -> 'ExtractedTable':
+        """
+        Rebuild from a DataFrame and its provenance() dict
+
+        Args:
+            df: Table data
+            info: Result of provenance()
+
+        Returns:
+            ExtractedTable
+        """
+        bbox = info.get('bbox')
+        return cls(
+            table_id=info['table_id'],
+            table_type=info['table_type'],
+            df=df,
+            page=info.get('page'),
+            bbox=tuple(bbox) if bbox is not None else None,
+            method=info.get('method'),
+            quality=info.get('quality')
+        )
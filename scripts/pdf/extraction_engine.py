@@ -12,19 +12,26 @@ Features:
 - Semantic table classification (AFT/AHe/counts/lengths)
 - FAIR schema transformation
 - Methods section metadata mining
-- Multi-threaded processing
+- Multi-process table extraction (one job per page, optional)
+- Page-level parse sharing (tables on one page reuse one parse per method)
+- Method racing (all fallback methods concurrently, first good result wins)
 - Caching layer
 """
 
 import logging
+import multiprocessing
+import queue
+import signal
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple, Union
 import pandas as pd
 
 # Core extraction libraries
 try:
     import camelot
-    import fitz  # pymupdf
     import pdfplumber
 except ImportError as e:
     logging.error(f"Missing required package: {e}")
@@ -32,13 +39,18 @@ except ImportError as e:
 
 # Local imports
 from .cache import PDFCache
+from .document_session import DocumentSession
+from .text_index import PageTextIndex
+from .extracted_table import ExtractedTable
 from .semantic_analysis import DocumentStructure
 from .table_extractors import (
     extract_table_from_text,  # PRIMARY text-based extraction
     extract_with_camelot_lattice,
     extract_with_camelot_stream,
     extract_with_pdfplumber,
-    evaluate_extraction_quality
+    evaluate_extraction_quality,
+    TEXT_X_TOLERANCE,
+    TEXT_Y_TOLERANCE
 )
 from .fair_transformer import FAIRTransformer
 from .methods_parser import MethodsParser
@@ -53,6 +65,57 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Seconds a page worker gets on top of (tables on page × table_timeout) before it is killed
+PAGE_TIMEOUT_SLACK = 30.0
+
+# Seconds between checks on page workers (deadlines, crashed workers)
+PAGE_POLL_INTERVAL = 1.0
+
+# Default per-method time budgets (seconds) for race mode
+RACE_METHOD_BUDGETS = {
+    'text_extraction': 15.0,
+    'camelot_lattice': 60.0,
+    'camelot_stream': 60.0,
+    'pdfplumber': 45.0
+}
+
+
+class TableTimeout(BaseException):
+    """
+    A table exceeded its extraction time budget
+
+    Derives from BaseException so the per-method `except Exception`
+    fallbacks cannot swallow it and keep trying slower methods.
+    """
+
+
+@contextmanager
+def _time_limit(seconds: Optional[float]):
+    """
+    Raise TableTimeout if the block runs longer than `seconds`
+
+    Uses SIGALRM, so the limit only applies on Unix in a main thread
+    (always true for process-pool workers); elsewhere it is a no-op.
+    """
+    if (
+        not seconds
+        or not hasattr(signal, 'setitimer')
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    def _expire(signum, frame):
+        raise TableTimeout(f"exceeded {seconds:g}s")
+
+    previous = signal.signal(signal.SIGALRM, _expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
 
 class UniversalThermoExtractor:
     """
@@ -64,15 +127,34 @@ class UniversalThermoExtractor:
     3. Transform to FAIR schema
     4. Validate data quality
 
+    The PDF is opened once per extractor (DocumentSession) and shared by
+    structure analysis, metadata/text extraction and every table extractor.
+    Call close() (or use the extractor as a context manager) to release it.
+
     Example:
-        extractor = UniversalThermoExtractor('paper.pdf')
-        extractor.analyze()
-        data = extractor.extract_all()
-        fair_data = extractor.transform_to_fair()
-        validation = extractor.validate(fair_data)
+        with UniversalThermoExtractor('paper.pdf') as extractor:
+            extractor.analyze()
+            data = extractor.extract_all()
+            fair_data = extractor.transform_to_fair()
+            validation = extractor.validate(fair_data)
     """
 
-    def __init__(self, pdf_path: str, cache_dir: str = './cache', paper_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        pdf_path: str,
+        cache_dir: str = './cache',
+        paper_dir: Optional[Path] = None,
+        quality_threshold: float = 0.6,
+        x_tolerance: float = TEXT_X_TOLERANCE,
+        y_tolerance: float = TEXT_Y_TOLERANCE,
+        workers: int = 1,
+        table_timeout: Optional[float] = None,
+        race: bool = False,
+        method_budgets: Optional[Dict[str, float]] = None,
+        cache_max_bytes: Optional[int] = None,
+        cache_max_entries: Optional[int] = None,
+        cache_ttl: Optional[Union[float, Dict[str, float]]] = None
+    ):
         """
         Initialize extractor
 
@@ -80,20 +162,63 @@ class UniversalThermoExtractor:
             pdf_path: Path to PDF file
             cache_dir: Directory for caching results
             paper_dir: Optional path to paper directory (for thermoanalysis integration)
+            quality_threshold: Minimum quality score to accept an extraction (0.0-1.0)
+            x_tolerance: Column clustering tolerance for text extraction (points)
+            y_tolerance: Row grouping tolerance for text extraction (points)
+            workers: Worker processes for extract_all (1 = serial in this process)
+            table_timeout: Per-table extraction time budget in seconds (None = unlimited)
+            race: Run the fallback methods concurrently, first good result wins
+            method_budgets: Per-method time budgets in seconds for race mode
+                (keys from RACE_METHOD_BUDGETS; ValueError otherwise)
+            cache_max_bytes: Evict least recently used cache entries above this total size
+            cache_max_entries: Evict least recently used cache entries above this count
+            cache_ttl: Cache entry lifetime in seconds (one value, or {step: seconds})
         """
         self.pdf_path = Path(pdf_path)
         if not self.pdf_path.exists():
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
         self.paper_dir = Path(paper_dir) if paper_dir else None
-        self.cache = PDFCache(cache_dir)
+        self.quality_threshold = quality_threshold
+        self.x_tolerance = x_tolerance
+        self.y_tolerance = y_tolerance
+        self.workers = workers
+        self.table_timeout = table_timeout
+        self.race = race
+        self.method_budgets = method_budgets
+        _race_budgets(method_budgets)  # Unknown methods fail here, not mid-run
+        self.session = DocumentSession(str(self.pdf_path))  # Opened on first use
+
+        # Cached steps are keyed by the parameters that shape them
+        self.cache = PDFCache(cache_dir, max_bytes=cache_max_bytes, max_entries=cache_max_entries, ttl=cache_ttl)
+        self.cache.set_step_params('structure', {
+            'thermoanalysis': bool(self.paper_dir and (self.paper_dir / 'text' / 'text-index.md').exists())
+        })
+        self.cache.set_step_params('tables', {
+            'quality_threshold': quality_threshold,
+            'x_tolerance': x_tolerance,
+            'y_tolerance': y_tolerance,
+            'race': race
+        })
+        self.text_index = None # Page text index (PageTextIndex, loaded once)
         self.structure = None  # Document structure (DocumentStructure object)
         self.metadata = None   # Paper metadata (dict)
         self.tables = {}       # Extracted tables (dict of DataFrames)
+        self.extracted = {}    # Same tables with type + provenance (dict of ExtractedTable)
         self.fair_data = {}    # FAIR-transformed data
 
         logger.info(f"Initialized extractor for: {self.pdf_path.name}")
 
+    def close(self) -> None:
+        """Release the shared PDF handles"""
+        self.session.close()
+
+    def __enter__(self) -> 'UniversalThermoExtractor':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
     def analyze(self) -> 'UniversalThermoExtractor':
         """
         Step 1: Analyze document structure
@@ -116,7 +241,8 @@ class UniversalThermoExtractor:
         cached = self.cache.get(str(self.pdf_path), 'structure')
         if cached:
             logger.info("✓ Using cached document structure")
-            self.structure, self.metadata = cached
+            self.structure = DocumentStructure.from_tables(str(self.pdf_path), cached['tables'])
+            self.metadata = cached['metadata']
             return self
 
         # Check for thermoanalysis outputs (IDEA-012 integration)
@@ -129,7 +255,10 @@ class UniversalThermoExtractor:
             self._analyze_pdf_directly()
 
         # Cache results
-        self.cache.set(str(self.pdf_path), 'structure', (self.structure, self.metadata))
+        self.cache.set(str(self.pdf_path), 'structure', {
+            'tables': self.structure.tables,
+            'metadata': self.metadata
+        })
 
         return self
 
@@ -139,9 +268,12 @@ class UniversalThermoExtractor:
 
         This is the original analyze() logic, used when thermoanalysis not available.
         """
+        # Text of every page (shared by captions, metadata and methods parsing)
+        self._load_text_index()
+
         # Build document structure
         logger.info("→ Building document structure...")
-        self.structure = DocumentStructure(str(self.pdf_path))
+        self.structure = DocumentStructure(str(self.pdf_path), session=self.session)
         self.structure.build_reference_map()
 
         logger.info(f"✓ Found {len(self.structure.tables)} tables")
@@ -200,7 +332,7 @@ class UniversalThermoExtractor:
         logger.info(f"✓ Found {len(discovered)} tables from thermoanalysis")
 
         # Initialize structure (need this for bbox detection)
-        self.structure = DocumentStructure(str(self.pdf_path))
+        self.structure = DocumentStructure(str(self.pdf_path), session=self.session)
 
         # Build structure.tables from discovered metadata
         for table_info in discovered:
@@ -221,10 +353,8 @@ class UniversalThermoExtractor:
             }
             logger.info(f"  - {table_name}: {table_type} (page {page_1indexed})")
 
-        # Close PDF after bbox detection
-        if self.structure.pdf:
-            self.structure.pdf.close()
-            self.structure.pdf = None
+        # Release PDF after bbox detection (the shared session stays open)
+        self.structure.close()
 
         logger.info(f"✓ Loaded {len(self.structure.tables)} tables from thermoanalysis")
 
@@ -268,7 +398,11 @@ class UniversalThermoExtractor:
 
         return metadata
 
-    def extract_all(self) -> Dict[str, pd.DataFrame]:
+    def extract_all(
+        self,
+        workers: Optional[int] = None,
+        table_timeout: Optional[float] = None
+    ) -> Dict[str, pd.DataFrame]:
         """
         Step 2: Extract all tables using multi-method voting
 
@@ -277,6 +411,19 @@ class UniversalThermoExtractor:
         - Vote on best result based on quality metrics
         - Clean and validate extracted data
 
+        With workers > 1 the tables of each page are extracted and cleaned
+        in a separate process (one document session per page, so tables on
+        a page share its parses), and a paper finishes in roughly the time
+        of its slowest page. Results keep the document order.
+        Tables exceeding table_timeout are skipped and the result is not
+        cached (in parallel mode a hung page worker is killed once its
+        tables' combined budget runs out). Each table's type, page, bbox, winning method and quality
+        are kept in self.extracted (ExtractedTable) for transform_to_fair().
+
+        Args:
+            workers: Override the extractor's worker count
+            table_timeout: Override the extractor's per-table timeout (seconds)
+
         Returns:
             Dictionary of table_id → DataFrame
         """
@@ -291,29 +438,37 @@ class UniversalThermoExtractor:
         cached = self.cache.get(str(self.pdf_path), 'tables')
         if cached:
             logger.info("✓ Using cached table extractions")
-            self.tables = cached
+            self.tables = cached['tables']
+            self.extracted = {
+                table_id: ExtractedTable.from_provenance(self.tables[table_id], info)
+                for table_id, info in cached['provenance'].items()
+            }
             return self.tables
 
-        # Extract each table
-        for table_id, table_info in self.structure.tables.items():
-            logger.info(f"\n→ Extracting {table_id} ({table_info['type']})...")
+        workers = self.workers if workers is None else workers
+        table_timeout = self.table_timeout if table_timeout is None else table_timeout
 
-            # Multi-method extraction with progressive fallback
-            df = self._extract_table_with_progressive_fallback(
-                table_info['page'],
-                table_info['bbox'],
-                table_info['type']
-            )
+        # Extract and clean each table (multi-method, progressive fallback)
+        if workers > 1 and len(self.structure.tables) > 1:
+            extracted, timed_out = self._extract_tables_parallel(workers, table_timeout)
+        else:
+            extracted, timed_out = self._extract_tables_serial(table_timeout)
+
+        # Validate and collect in document order
+        for table_id, table_info in self.structure.tables.items():
+            table = extracted.get(table_id)
 
-            if df is not None:
-                # Clean data
-                df = clean_extracted_table(df, table_info['type'])
+            if table_id in timed_out:
+                logger.warning(f"✗ Extraction timed out for {table_id} (>{table_timeout:g}s)")
+            elif table is not None:
+                df = table.df
 
                 # Validate (for reporting only, don't block extraction)
                 validation = validate_by_type(df, table_info['type'])
 
                 # ALWAYS save the table regardless of validation
                 self.tables[table_id] = df
+                self.extracted[table_id] = table
 
                 # Log validation results
                 if validation['valid']:
@@ -323,12 +478,133 @@ class UniversalThermoExtractor:
             else:
                 logger.warning(f"✗ Extraction failed for {table_id}")
 
-        # Cache results
-        self.cache.set(str(self.pdf_path), 'tables', self.tables)
+        # Cache results (a run with timeouts is incomplete - don't persist it)
+        if not timed_out:
+            self.cache.set(str(self.pdf_path), 'tables', {
+                'tables': self.tables,
+                'provenance': {table_id: table.provenance() for table_id, table in self.extracted.items()}
+            })
 
         logger.info(f"\n✓ Successfully extracted {len(self.tables)} tables")
         return self.tables
 
+    def _extraction_options(self) -> Dict:
+        """Keyword arguments for extract_table_progressive()"""
+        return {
+            'quality_threshold': self.quality_threshold,
+            'x_tolerance': self.x_tolerance,
+            'y_tolerance': self.y_tolerance,
+            'race': self.race,
+            'method_budgets': self.method_budgets,
+        }
+
+    def _extract_tables_serial(
+        self,
+        table_timeout: Optional[float]
+    ) -> Tuple[Dict[str, Optional[ExtractedTable]], Set[str]]:
+        """Extract tables one after another in this process (shared session)"""
+        extracted = {}
+        timed_out = set()
+
+        # Tables on the same page share its parses
+        for table_info in self.structure.tables.values():
+            self.session.add_table_region(table_info['page'], table_info['bbox'])
+
+        for table_id, table_info in self.structure.tables.items():
+            logger.info(f"\n→ Extracting {table_id} ({table_info['type']})...")
+            try:
+                extracted[table_id] = _extract_and_clean_table(
+                    str(self.pdf_path), table_id, table_info, self._extraction_options(),
+                    session=self.session, timeout=table_timeout
+                )
+            except TableTimeout:
+                timed_out.add(table_id)
+
+        return extracted, timed_out
+
+    def _extract_tables_parallel(
+        self,
+        workers: int,
+        table_timeout: Optional[float]
+    ) -> Tuple[Dict[str, Optional[ExtractedTable]], Set[str]]:
+        """
+        Extract tables in worker processes, one per page (its tables share one session)
+
+        At most `workers` pages run at once. With a table_timeout, a page
+        worker still running after (tables on page × table_timeout +
+        PAGE_TIMEOUT_SLACK) is killed and its tables count as timed out -
+        this catches hangs inside C code (camelot/ghostscript, PyMuPDF)
+        that the per-table SIGALRM cannot interrupt. A worker that dies
+        fails only its own page.
+        """
+        pages = {}
+        for table_id, table_info in self.structure.tables.items():
+            pages.setdefault(table_info['page'], []).append((table_id, table_info))
+
+        n_workers = min(workers, len(pages))
+        logger.info(
+            f"→ Extracting {len(self.structure.tables)} tables on {len(pages)} pages "
+            f"with {n_workers} worker processes..."
+        )
+
+        extracted = {}
+        timed_out = set()
+        options = self._extraction_options()
+        result_queue = multiprocessing.Queue()
+        waiting = list(pages)  # Document order
+        running = {}           # page → (process, deadline or None)
+
+        try:
+            while waiting or running:
+                while waiting and len(running) < n_workers:
+                    page = waiting.pop(0)
+                    process = multiprocessing.Process(
+                        target=_page_process,
+                        args=(page, str(self.pdf_path), pages[page], options, table_timeout, result_queue)
+                    )  # Not daemonic: race mode starts its own child processes
+                    process.start()
+                    deadline = None
+                    if table_timeout:
+                        deadline = time.monotonic() + len(pages[page]) * table_timeout + PAGE_TIMEOUT_SLACK
+                    running[page] = (process, deadline)
+
+                deadlines = [deadline for _, deadline in running.values() if deadline is not None]
+                wait = min([PAGE_POLL_INTERVAL] + [d - time.monotonic() for d in deadlines])
+                try:
+                    page, page_extracted, page_timed_out, error = result_queue.get(timeout=max(wait, 0.01))
+                except queue.Empty:
+                    page = None
+
+                if page is not None and page in running:
+                    running.pop(page)[0].join()
+                    if error is not None:
+                        logger.warning(f"✗ Worker failed for page {page}: {error}")
+                        page_extracted = {table_id: None for table_id, _ in pages[page]}
+                    extracted.update(page_extracted)
+                    timed_out |= page_timed_out
+
+                now = time.monotonic()
+                for page, (process, deadline) in list(running.items()):
+                    if deadline is not None and now > deadline:
+                        budget = len(pages[page]) * table_timeout + PAGE_TIMEOUT_SLACK
+                        logger.warning(f"✗ Worker for page {page} exceeded {budget:g}s, killing it")
+                        process.kill()
+                        process.join()
+                        del running[page]
+                        timed_out |= {table_id for table_id, _ in pages[page]}
+                    elif process.exitcode not in (None, 0):
+                        # Died without reporting (crash in native code); a clean exit has its result queued
+                        logger.warning(f"✗ Worker for page {page} died (exit code {process.exitcode})")
+                        del running[page]
+                        extracted.update({table_id: None for table_id, _ in pages[page]})
+        finally:
+            for process, _ in running.values():
+                process.kill()
+                process.join()
+            result_queue.close()
+
+        return extracted, timed_out
+
     def transform_to_fair(self) -> Dict[str, pd.DataFrame]:
         """
         Step 3: Transform to FAIR-compliant schema
@@ -357,8 +633,10 @@ class UniversalThermoExtractor:
             return self.fair_data
 
         # Transform
+        # Typed tables carry their classification; plain DataFrames are typed by the transformer
         transformer = FAIRTransformer()
-        self.fair_data = transformer.transform(self.tables, self.metadata)
+        tables = {table_id: self.extracted.get(table_id, df) for table_id, df in self.tables.items()}
+        self.fair_data = transformer.transform(tables, self.metadata)
 
         # Log results
         logger.info("✓ FAIR transformation complete:")
@@ -434,107 +712,54 @@ class UniversalThermoExtractor:
         """
         Extract table using progressive fallback strategy
 
-        Strategy:
-        1. Try text_extraction first (fastest, our bulletproof method)
-        2. If quality < threshold → try Camelot methods (lattice + stream)
-        3. If still poor → try pdfplumber (slowest fallback)
-        4. Return best result from all attempted methods
-
-        Args:
-            page: Page number (0-indexed)
-            bbox: Bounding box (x0, y0, x1, y1)
-            table_type: Table type for type-specific extraction
-            quality_threshold: Minimum quality score to accept (0.0-1.0)
+        See extract_table_progressive() - this binds the extractor's PDF,
+        tolerances and shared session.
 
         Returns:
             Best DataFrame or None if all methods fail
         """
-        results = []
-
-        # LEVEL 1: Try text extraction (fastest)
-        logger.info(f"  → Trying text extraction (fast)...")
-        try:
-            df = extract_table_from_text(str(self.pdf_path), page, bbox, table_type)
-            if df is not None and not df.empty:
-                score = evaluate_extraction_quality(df, table_type)
-                results.append(('text_extraction', df, score))
-                logger.info(f"    ✓ Text extraction: quality {score:.2f}")
-
-                # Accept if quality is good enough
-                if score >= quality_threshold:
-                    logger.info(f"  → Quality threshold met ({score:.2f} >= {quality_threshold}), using text extraction")
-                    return df
-                else:
-                    logger.info(f"  → Quality below threshold ({score:.2f} < {quality_threshold}), trying more methods...")
-            else:
-                logger.info(f"    ✗ Text extraction returned no data")
-        except Exception as e:
-            logger.warning(f"    ✗ Text extraction failed: {e}")
-
-        # LEVEL 2: Try Camelot methods (medium speed)
-        logger.info(f"  → Trying Camelot methods (medium speed)...")
-        camelot_methods = [
-            ('camelot_lattice', extract_with_camelot_lattice),
-            ('camelot_stream', extract_with_camelot_stream)
-        ]
-
-        for method_name, extractor in camelot_methods:
-            try:
-                df = extractor(str(self.pdf_path), page, bbox, table_type)
-                if df is not None and not df.empty:
-                    score = evaluate_extraction_quality(df, table_type)
-                    results.append((method_name, df, score))
-                    logger.info(f"    ✓ {method_name}: quality {score:.2f}")
-                else:
-                    logger.info(f"    ✗ {method_name}: no data")
-            except Exception as e:
-                logger.debug(f"    ✗ {method_name}: {e}")
-
-        # Check if we have a good result from Camelot
-        if results:
-            best_so_far = max(results, key=lambda x: x[2])
-            if best_so_far[2] >= quality_threshold:
-                logger.info(f"  → Quality threshold met with {best_so_far[0]} ({best_so_far[2]:.2f})")
-                return best_so_far[1]
-
-        # LEVEL 3: Try pdfplumber (slowest, last resort)
-        logger.info(f"  → Trying pdfplumber (slowest fallback)...")
-        try:
-            df = extract_with_pdfplumber(str(self.pdf_path), page, bbox, table_type)
-            if df is not None and not df.empty:
-                score = evaluate_extraction_quality(df, table_type)
-                results.append(('pdfplumber', df, score))
-                logger.info(f"    ✓ pdfplumber: quality {score:.2f}")
-            else:
-                logger.info(f"    ✗ pdfplumber: no data")
-        except Exception as e:
-            logger.debug(f"    ✗ pdfplumber: {e}")
+        return extract_table_progressive(
+            str(self.pdf_path), page, bbox, table_type,
+            quality_threshold=quality_threshold,
+            x_tolerance=self.x_tolerance,
+            y_tolerance=self.y_tolerance,
+            session=self.session
+        )
+
+    def _load_text_index(self) -> PageTextIndex:
+        """
+        Page text index of the PDF (cached, so text is extracted once per PDF)
 
-        # Return best result from all methods
-        if not results:
-            logger.warning(f"  ✗ All extraction methods failed")
-            return None
+        Returns:
+            PageTextIndex (also installed in the shared session)
+        """
+        if self.text_index is not None:
+            return self.text_index
 
-        best_method, best_df, best_score = max(results, key=lambda x: x[2])
-        logger.info(f"  → Best method: {best_method} (quality: {best_score:.2f})")
+        cached = self.cache.get(str(self.pdf_path), 'text_index')
+        if cached:
+            logger.debug("✓ Using cached page text index")
+            self.text_index = PageTextIndex.from_payload(cached)
+            self.session.set_text_index(self.text_index)
+        else:
+            self.text_index = self.session.text_index()
+            self.cache.set(str(self.pdf_path), 'text_index', self.text_index.to_payload())
 
-        return best_df
+        return self.text_index
 
     def _extract_metadata(self) -> Dict:
         """Extract paper metadata from PDF"""
         metadata = {}
-
-        # Open PDF
-        doc = fitz.open(str(self.pdf_path))
+        index = self._load_text_index()
 
         # Extract from PDF metadata
-        pdf_meta = doc.metadata
+        pdf_meta = index.metadata
         if pdf_meta:
             metadata['title'] = pdf_meta.get('title', '')
             metadata['author'] = pdf_meta.get('author', '')
 
         # Extract from first page text
-        first_page = doc[0].get_text()
+        first_page = index.page_text(0)
 
         # Extract DOI
         import re
@@ -547,44 +772,488 @@ class UniversalThermoExtractor:
         if year_match:
             metadata['year'] = int(year_match.group(0))
 
-        doc.close()
-
         return metadata
 
     def _get_full_text(self) -> str:
-        """Extract full text from PDF"""
-        doc = fitz.open(str(self.pdf_path))
-        text = ""
-        for page in doc:
-            text += page.get_text()
-        doc.close()
-        return text
+        """Full text of the PDF (from the page text index)"""
+        return self._load_text_index().full_text
+
+
+def extract_table_progressive(
+    pdf_path: str,
+    page: int,
+    bbox: Tuple[float, float, float, float],
+    table_type: str,
+    **options
+) -> Optional[pd.DataFrame]:
+    """
+    Extract table using progressive fallback strategy
+
+    See extract_table_progressive_scored() for the strategy and options.
+
+    Returns:
+        Best DataFrame or None if all methods fail
+    """
+    best = extract_table_progressive_scored(pdf_path, page, bbox, table_type, **options)
+    return best[1] if best else None
+
+
+def extract_table_progressive_scored(
+    pdf_path: str,
+    page: int,
+    bbox: Tuple[float, float, float, float],
+    table_type: str,
+    quality_threshold: float = 0.6,
+    x_tolerance: float = TEXT_X_TOLERANCE,
+    y_tolerance: float = TEXT_Y_TOLERANCE,
+    session: Optional[DocumentSession] = None,
+    race: bool = False,
+    method_budgets: Optional[Dict[str, float]] = None
+) -> Optional[Tuple[str, pd.DataFrame, float]]:
+    """
+    Extract table using progressive fallback strategy, reporting the winner
+
+    Strategy:
+    1. Try text_extraction first (fastest, our bulletproof method)
+    2. If quality < threshold → try Camelot methods (lattice + stream)
+    3. If still poor → try pdfplumber (slowest fallback)
+    4. Return best result from all attempted methods
+
+    Args:
+        pdf_path: Path to PDF file
+        page: Page number (0-indexed)
+        bbox: Bounding box (x0, y0, x1, y1)
+        table_type: Table type for type-specific extraction
+        quality_threshold: Minimum quality score to accept (0.0-1.0)
+        x_tolerance: Column clustering tolerance for text extraction
+        y_tolerance: Row grouping tolerance for text extraction
+        session: Shared document session
+        race: Run all methods concurrently instead (see _race_methods)
+        method_budgets: Per-method time budgets in seconds for race mode
+
+    Returns:
+        (method, DataFrame, quality score) of the best result, or None if all methods fail
+    """
+    if race:
+        if not multiprocessing.current_process().daemon:
+            return _race_methods(
+                pdf_path, page, bbox, table_type, quality_threshold,
+                x_tolerance, y_tolerance, method_budgets
+            )
+        # Daemonic workers cannot start children of their own
+        logger.debug("  → Race mode unavailable in daemonic worker, running sequentially")
+
+    results = []
+
+    # LEVEL 1: Try text extraction (fastest)
+    logger.info("  → Trying text extraction (fast)...")
+    try:
+        df = extract_table_from_text(
+            pdf_path, page, bbox, table_type,
+            x_tolerance=x_tolerance,
+            y_tolerance=y_tolerance,
+            session=session
+        )
+        if df is not None and not df.empty:
+            score = evaluate_extraction_quality(df, table_type)
+            results.append(('text_extraction', df, score))
+            logger.info(f"    ✓ Text extraction: quality {score:.2f}")
+
+            # Accept if quality is good enough
+            if score >= quality_threshold:
+                logger.info(f"  → Quality threshold met ({score:.2f} >= {quality_threshold}), using text extraction")
+                return 'text_extraction', df, score
+            else:
+                logger.info(f"  → Quality below threshold ({score:.2f} < {quality_threshold}), trying more methods...")
+        else:
+            logger.info("    ✗ Text extraction returned no data")
+    except Exception as e:
+        logger.warning(f"    ✗ Text extraction failed: {e}")
+
+    # LEVEL 2: Try Camelot methods (medium speed)
+    logger.info("  → Trying Camelot methods (medium speed)...")
+    camelot_methods = [
+        ('camelot_lattice', extract_with_camelot_lattice),
+        ('camelot_stream', extract_with_camelot_stream)
+    ]
+
+    for method_name, extractor in camelot_methods:
+        try:
+            df = extractor(pdf_path, page, bbox, table_type, session=session)
+            if df is not None and not df.empty:
+                score = evaluate_extraction_quality(df, table_type)
+                results.append((method_name, df, score))
+                logger.info(f"    ✓ {method_name}: quality {score:.2f}")
+            else:
+                logger.info(f"    ✗ {method_name}: no data")
+        except Exception as e:
+            logger.debug(f"    ✗ {method_name}: {e}")
+
+    # Check if we have a good result from Camelot
+    if results:
+        best_so_far = max(results, key=lambda x: x[2])
+        if best_so_far[2] >= quality_threshold:
+            logger.info(f"  → Quality threshold met with {best_so_far[0]} ({best_so_far[2]:.2f})")
+            return best_so_far
+
+    # LEVEL 3: Try pdfplumber (slowest, last resort)
+    logger.info("  → Trying pdfplumber (slowest fallback)...")
+    try:
+        df = extract_with_pdfplumber(pdf_path, page, bbox, table_type, session=session)
+        if df is not None and not df.empty:
+            score = evaluate_extraction_quality(df, table_type)
+            results.append(('pdfplumber', df, score))
+            logger.info(f"    ✓ pdfplumber: quality {score:.2f}")
+        else:
+            logger.info("    ✗ pdfplumber: no data")
+    except Exception as e:
+        logger.debug(f"    ✗ pdfplumber: {e}")
+
+    # Return best result from all methods
+    if not results:
+        logger.warning("  ✗ All extraction methods failed")
+        return None
+
+    best = max(results, key=lambda x: x[2])
+    logger.info(f"  → Best method: {best[0]} (quality: {best[2]:.2f})")
+
+    return best
+
+
+def _run_extraction_method(
+    method_name: str,
+    pdf_path: str,
+    page: int,
+    bbox: Tuple[float, float, float, float],
+    table_type: str,
+    x_tolerance: float,
+    y_tolerance: float,
+    session: DocumentSession
+) -> Optional[pd.DataFrame]:
+    """Run one of the progressive fallback methods by name"""
+    if method_name == 'text_extraction':
+        return extract_table_from_text(
+            pdf_path, page, bbox, table_type,
+            x_tolerance=x_tolerance,
+            y_tolerance=y_tolerance,
+            session=session
+        )
+
+    extractors = {
+        'camelot_lattice': extract_with_camelot_lattice,
+        'camelot_stream': extract_with_camelot_stream,
+        'pdfplumber': extract_with_pdfplumber
+    }
+    return extractors[method_name](pdf_path, page, bbox, table_type, session=session)
+
+
+def _race_worker(
+    method_name: str,
+    pdf_path: str,
+    page: int,
+    bbox: Tuple[float, float, float, float],
+    table_type: str,
+    x_tolerance: float,
+    y_tolerance: float,
+    results: multiprocessing.Queue
+) -> None:
+    """Race mode child process: run one method and report (method, df, score, error)"""
+    try:
+        with DocumentSession(pdf_path) as session:
+            df = _run_extraction_method(
+                method_name, pdf_path, page, bbox, table_type,
+                x_tolerance, y_tolerance, session
+            )
+        if df is None or df.empty:
+            results.put((method_name, None, None, None))
+        else:
+            results.put((method_name, df, evaluate_extraction_quality(df, table_type), None))
+    except Exception as e:
+        results.put((method_name, None, None, str(e)))
 
 
-def extract_from_pdf(pdf_path: str, cache_dir: str = './cache') -> Dict:
+def _race_budgets(method_budgets: Optional[Dict[str, float]]) -> Dict[str, float]:
+    """
+    RACE_METHOD_BUDGETS with the caller's budgets applied
+
+    Args:
+        method_budgets: Per-method time budgets in seconds (or None)
+
+    Returns:
+        Budget for every race method
+
+    Raises:
+        ValueError: If a key is not a race method (a typo would otherwise
+            start an extra worker that fails on an unknown method)
+    """
+    unknown = sorted(set(method_budgets or {}) - set(RACE_METHOD_BUDGETS))
+    if unknown:
+        raise ValueError(
+            f"Unknown race method(s) in method_budgets: {', '.join(unknown)} "
+            f"(expected {', '.join(RACE_METHOD_BUDGETS)})"
+        )
+    budgets = dict(RACE_METHOD_BUDGETS)
+    budgets.update(method_budgets or {})
+    return budgets
+
+
+def _race_methods(
+    pdf_path: str,
+    page: int,
+    bbox: Tuple[float, float, float, float],
+    table_type: str,
+    quality_threshold: float,
+    x_tolerance: float,
+    y_tolerance: float,
+    method_budgets: Optional[Dict[str, float]] = None
+) -> Optional[Tuple[str, pd.DataFrame, float]]:
+    """
+    Run all fallback methods concurrently, one child process each
+
+    The first result meeting quality_threshold wins and the remaining
+    methods are terminated. A method still running past its budget is
+    terminated as well. If no result meets the threshold, the best of the
+    finished ones is returned, as in sequential mode.
+
+    Race mode does not share the page parse: each method opens the PDF
+    and parses the page in its own process (DocumentSession caches cannot
+    cross processes), so a race costs one page parse per method.
+
+    Args:
+        pdf_path: Path to PDF file
+        page: Page number (0-indexed)
+        bbox: Bounding box (x0, y0, x1, y1)
+        table_type: Table type for type-specific extraction
+        quality_threshold: Minimum quality score to accept (0.0-1.0)
+        x_tolerance: Column clustering tolerance for text extraction
+        y_tolerance: Row grouping tolerance for text extraction
+        method_budgets: Per-method time budgets in seconds (merged over RACE_METHOD_BUDGETS)
+
+    Returns:
+        (method, DataFrame, quality score) of the winner, or None if all methods fail
+
+    Raises:
+        ValueError: If method_budgets names a method not in RACE_METHOD_BUDGETS
+    """
+    budgets = _race_budgets(method_budgets)
+
+    logger.info(f"  → Racing {len(budgets)} extraction methods...")
+    result_queue = multiprocessing.Queue()
+    processes = {
+        method_name: multiprocessing.Process(
+            target=_race_worker,
+            args=(method_name, pdf_path, page, bbox, table_type,
+                  x_tolerance, y_tolerance, result_queue),
+            daemon=True
+        )
+        for method_name in budgets
+    }
+
+    start = time.monotonic()
+    for process in processes.values():
+        process.start()
+
+    pending = set(processes)
+    results = []
+    try:
+        while pending:
+            elapsed = time.monotonic() - start
+            for method_name in sorted(pending):
+                if elapsed >= budgets[method_name]:
+                    logger.info(f"    ✗ {method_name}: exceeded {budgets[method_name]:.0f}s budget")
+                    processes[method_name].terminate()
+                    pending.discard(method_name)
+            if not pending:
+                break
+
+            wait = min(budgets[m] for m in pending) - elapsed
+            try:
+                method_name, df, score, error = result_queue.get(timeout=max(wait, 0.01))
+            except queue.Empty:
+                continue
+            pending.discard(method_name)
+
+            if error is not None:
+                logger.debug(f"    ✗ {method_name}: {error}")
+                continue
+            if df is None:
+                logger.info(f"    ✗ {method_name}: no data")
+                continue
+
+            results.append((method_name, df, score))
+            logger.info(f"    ✓ {method_name}: quality {score:.2f} ({time.monotonic() - start:.1f}s)")
+
+            if score >= quality_threshold:
+                logger.info(f"  → Quality threshold met with {method_name} ({score:.2f}), cancelling {len(pending)} other method(s)")
+                return method_name, df, score
+    finally:
+        for process in processes.values():
+            if process.is_alive():
+                process.terminate()
+            process.join()
+        result_queue.close()
+
+    if not results:
+        logger.warning("  ✗ All extraction methods failed")
+        return None
+
+    best = max(results, key=lambda x: x[2])
+    logger.info(f"  → Best method: {best[0]} (quality: {best[2]:.2f})")
+
+    return best
+
+
+def _extract_and_clean_table(
+    pdf_path: str,
+    table_id: str,
+    table_info: Dict,
+    options: Dict,
+    session: Optional[DocumentSession] = None,
+    timeout: Optional[float] = None
+) -> Optional[ExtractedTable]:
+    """
+    Extract one table with progressive fallback, then clean it
+
+    Args:
+        pdf_path: Path to PDF file
+        table_id: Table identifier (e.g. "Table 1")
+        table_info: Reference map entry (type, page, bbox)
+        options: Keyword arguments for extract_table_progressive_scored()
+        session: Shared document session
+        timeout: Time budget in seconds (raises TableTimeout)
+
+    Returns:
+        Cleaned table with its type and provenance, or None
+    """
+    with _time_limit(timeout):
+        best = extract_table_progressive_scored(
+            pdf_path,
+            table_info['page'],
+            table_info['bbox'],
+            table_info['type'],
+            session=session,
+            **options
+        )
+
+        if best is None:
+            return None
+
+        method, df, quality = best
+        df = clean_extracted_table(df, table_info['type'])
+
+    return ExtractedTable(
+        table_id=table_id,
+        table_type=table_info['type'],
+        df=df,
+        page=table_info['page'],
+        bbox=tuple(table_info['bbox']),
+        method=method,
+        quality=quality
+    )
+
+
+def _page_worker(
+    pdf_path: str,
+    tables: List[Tuple[str, Dict]],
+    options: Dict,
+    timeout: Optional[float]
+) -> Tuple[Dict[str, Optional[ExtractedTable]], Set[str]]:
+    """
+    Process-pool entry point: the tables of one page in one document session
+
+    Args:
+        pdf_path: Path to PDF file
+        tables: (table_id, reference map entry) of each table on the page
+        options: Keyword arguments for extract_table_progressive_scored()
+        timeout: Per-table time budget in seconds
+
+    Returns:
+        (table_id → cleaned table or None, IDs of tables that timed out)
+    """
+    extracted = {}
+    timed_out = set()
+
+    with DocumentSession(pdf_path) as session:
+        for _, table_info in tables:
+            session.add_table_region(table_info['page'], table_info['bbox'])
+
+        for table_id, table_info in tables:
+            try:
+                extracted[table_id] = _extract_and_clean_table(
+                    pdf_path, table_id, table_info, options, session, timeout
+                )
+            except TableTimeout:
+                timed_out.add(table_id)
+            except Exception as e:
+                logger.warning(f"✗ Worker failed for {table_id}: {e}")
+                extracted[table_id] = None
+
+    return extracted, timed_out
+
+
+def _page_process(
+    page: int,
+    pdf_path: str,
+    tables: List[Tuple[str, Dict]],
+    options: Dict,
+    timeout: Optional[float],
+    results: multiprocessing.Queue
+) -> None:
+    """Page worker process: extract one page's tables and report (page, extracted, timed_out, error)"""
+    try:
+        extracted, timed_out = _page_worker(pdf_path, tables, options, timeout)
+        results.put((page, extracted, timed_out, None))
+    except Exception as e:
+        results.put((page, {}, set(), str(e)))
+
+
+def extract_from_pdf(
+    pdf_path: str,
+    cache_dir: str = './cache',
+    workers: int = 1,
+    table_timeout: Optional[float] = None,
+    race: bool = False,
+    cache_max_bytes: Optional[int] = None,
+    cache_max_entries: Optional[int] = None,
+    cache_ttl: Optional[Union[float, Dict[str, float]]] = None
+) -> Dict:
     """
     Convenience function for full extraction workflow
 
     Args:
         pdf_path: Path to PDF file
         cache_dir: Cache directory
+        workers: Worker processes for table extraction
+        table_timeout: Per-table extraction time budget in seconds
+        race: Run the fallback methods concurrently for each table
+        cache_max_bytes: Cache size limit in bytes (LRU eviction)
+        cache_max_entries: Cache entry limit (LRU eviction)
+        cache_ttl: Cache entry lifetime in seconds (one value, or {step: seconds})
 
     Returns:
         Dictionary with all extraction results
     """
-    extractor = UniversalThermoExtractor(pdf_path, cache_dir)
+    # Run full workflow (PDF opened once, released on exit)
+    with UniversalThermoExtractor(pdf_path, cache_dir, workers=workers,
+                                  table_timeout=table_timeout, race=race,
+                                  cache_max_bytes=cache_max_bytes,
+                                  cache_max_entries=cache_max_entries,
+                                  cache_ttl=cache_ttl) as extractor:
+        extractor.analyze()
+        tables = extractor.extract_all()
+        fair_data = extractor.transform_to_fair()
+        validation = extractor.validate()
 
-    # Run full workflow
-    extractor.analyze()
-    tables = extractor.extract_all()
-    fair_data = extractor.transform_to_fair()
-    validation = extractor.validate()
+    cache_stats = extractor.cache.stats()
+    logger.info(f"Cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+                f"{cache_stats['entries']} entries ({cache_stats['bytes'] / 1e6:.1f} MB)")
 
     return {
         'metadata': extractor.metadata,
         'tables': tables,
         'fair_data': fair_data,
-        'validation': validation
+        'validation': validation,
+        'cache_stats': cache_stats
     }
 
 
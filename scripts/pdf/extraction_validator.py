@@ -11,31 +11,191 @@ Created: 2025-11-16
 Features:
 - Multi-method comparison
 - Discrepancy detection (structure, values, quality)
-- Smart reconciliation strategies
+- Vectorized cell comparison (all methods and cells as NumPy masks)
+- Row alignment when row counts differ (cells still compared and merged)
+- Consensus merge: per-cell vote across methods, weighted by each method's
+  accuracy for the table type (audit of every contested cell)
+- Method accuracy: fixed priors, updated only from human-reviewed tables
+- Smart reconciliation strategies (fallback when no vote is possible)
 - Audit trail generation
 """
 
 import logging
+import json
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 import pandas as pd
 import numpy as np
 from collections import Counter
 
+from .row_alignment import Fingerprint, align_rows, row_fingerprints
+
 logger = logging.getLogger(__name__)
 
+# Prior cell accuracy per method family and table type (before any reviewed
+# tables). Camelot/pdfplumber orders follow the per-type method strategies in
+# table_extractors; text methods are not part of those strategies, so with no
+# evidence for them they rank below every strategy method
+METHOD_ACCURACY_PRIORS = {
+    'default': {'camelot_lattice': 0.70, 'camelot_stream': 0.65, 'pdfplumber': 0.60, 'text': 0.55},
+    'AFT_ages': {'camelot_lattice': 0.75, 'camelot_stream': 0.70, 'pdfplumber': 0.60, 'text': 0.55},
+    'UThHe': {'camelot_stream': 0.75, 'camelot_lattice': 0.70, 'pdfplumber': 0.60, 'text': 0.55},
+    'track_counts': {'camelot_lattice': 0.75, 'camelot_stream': 0.70, 'pdfplumber': 0.60, 'text': 0.55},
+    'track_lengths': {'camelot_stream': 0.75, 'pdfplumber': 0.65, 'camelot_lattice': 0.60, 'text': 0.55},
+}
+
+# Accuracy of methods outside the known families
+UNKNOWN_METHOD_ACCURACY = 0.5
+
+# The prior counts as this many reviewed cells
+PRIOR_STRENGTH = 50
+
+# Accuracy history file name (kept next to the paper folders)
+METHOD_ACCURACY_FILENAME = 'method-accuracy.json'
+
+# Method families, matched as substrings of method names
+# (e.g. 'method_3_camelot_lattice', 'text_extraction')
+METHOD_FAMILIES = ['camelot_lattice', 'camelot_stream', 'pdfplumber', 'text']
+
+
+class MethodAccuracy:
+    """
+    Cell accuracy of each extraction method per table type
+
+    Accuracy is the share of a method's cells that matched a human-reviewed
+    reference table, smoothed towards METHOD_ACCURACY_PRIORS. Outcomes are
+    never learned from the consensus vote itself (its winners would
+    reinforce their own weights). Each (reference, method) outcome is kept
+    under a source key, so re-running a reviewed paper replaces its counts
+    instead of adding them again. History is kept as JSON
+    ({"<table_type>/<family>": {"<source>": [agreed, compared]}}) when a
+    path is given.
+    """
+
+    def __init__(self, path: Optional[Path] = None, priors: Optional[Dict[str, Dict[str, float]]] = None):
+        """
+        Args:
+            path: JSON history file (loaded if it exists, written by save())
+            priors: Prior accuracies by table type (default: METHOD_ACCURACY_PRIORS)
+        """
+        self.path = Path(path) if path else None
+        self.priors = priors or METHOD_ACCURACY_PRIORS
+        self.counts: Dict[str, Dict[str, List[int]]] = {}
+
+        if self.path and self.path.exists():
+            with open(self.path, 'r') as f:
+                self.counts = {
+                    key: {source: list(value) for source, value in sources.items()}
+                    for key, sources in json.load(f).items()
+                }
+            logger.debug(f"Loaded method accuracy history ({len(self.counts)} entries)")
+
+    @staticmethod
+    def family(method: str) -> str:
+        """Method family of a method name (the name itself if unknown)"""
+        return next((family for family in METHOD_FAMILIES if family in method), method)
+
+    def _key(self, method: str, table_type: Optional[str]) -> str:
+        return f"{table_type or 'default'}/{self.family(method)}"
+
+    def accuracy(self, method: str, table_type: Optional[str] = None) -> float:
+        """
+        Smoothed cell accuracy of a method for a table type
+
+        Args:
+            method: Method name
+            table_type: Table type (None → default priors)
+
+        Returns:
+            Accuracy in (0, 1)
+        """
+        priors = self.priors.get(table_type, self.priors['default'])
+        prior = priors.get(self.family(method), UNKNOWN_METHOD_ACCURACY)
+        outcomes = self.counts.get(self._key(method, table_type), {}).values()
+        agreed = sum(a for a, _ in outcomes)
+        compared = sum(c for _, c in outcomes)
+        return (agreed + prior * PRIOR_STRENGTH) / (compared + PRIOR_STRENGTH)
+
+    def record(self, method: str, table_type: Optional[str], source: str, agreed: int, compared: int) -> None:
+        """
+        Set one reviewed table's outcome for a method
+
+        Args:
+            method: Method name
+            table_type: Table type
+            source: Reference + method identifier (a repeated source replaces its counts)
+            agreed: Cells that matched the reviewed table
+            compared: Non-empty cells of the reviewed table
+        """
+        self.counts.setdefault(self._key(method, table_type), {})[source] = [int(agreed), int(compared)]
+
+    def record_reference(
+        self,
+        method: str,
+        table_type: Optional[str],
+        source: str,
+        extracted: Optional[pd.DataFrame],
+        reference: pd.DataFrame,
+        tolerance: float = 0.01
+    ) -> Optional[float]:
+        """
+        Score a method's extraction against a human-reviewed table and record it
+
+        Rows are aligned to the reference; every non-empty reference cell
+        counts, so dropped rows and misread values both lower the accuracy.
+        Extractions with a different column count are not cell-comparable
+        and are skipped.
+
+        Args:
+            method: Method name
+            table_type: Table type
+            source: Reference + method identifier (see record())
+            extracted: The method's table
+            reference: Reviewed table
+            tolerance: Relative numeric tolerance for a match
+
+        Returns:
+            Share of reference cells matched, or None if not comparable
+        """
+        if extracted is None or extracted.empty or len(extracted.columns) != len(reference.columns):
+            return None
+
+        row_maps = [np.arange(len(reference)), align_rows(reference, extracted)]
+        ref_cells, ext_cells = _aligned_cells([reference, extracted], len(reference), len(reference.columns), row_maps)
+        compared = ref_cells['valid'] & ~ref_cells['na']
+        both = compared & ext_cells['valid']
+        agreed = _cells_equivalent(ref_cells, ext_cells, tolerance, both)[0] & both
+
+        self.record(method, table_type, source, agreed.sum(), compared.sum())
+        return float(agreed.sum() / compared.sum()) if compared.any() else None
+
+    def save(self) -> None:
+        """Write the history to the JSON file (no-op without a path)"""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump(self.counts, f, indent=2, sort_keys=True)
+
 
 class ExtractionValidator:
     """
     Validate and merge extraction results from multiple methods
     """
 
-    def __init__(self):
+    def __init__(self, accuracy: Optional[MethodAccuracy] = None):
+        """
+        Args:
+            accuracy: Method accuracies (vote weights); fixed priors if None
+        """
         self.audit_log = []
+        self.accuracy = accuracy or MethodAccuracy()
 
     def validate_and_merge(
         self,
         table_id: str,
-        extractions: Dict[str, Dict[str, Any]]
+        extractions: Dict[str, Dict[str, Any]],
+        table_type: Optional[str] = None
     ) -> Tuple[pd.DataFrame, Dict]:
         """
         Compare extractions and merge to best result
@@ -43,6 +203,7 @@ class ExtractionValidator:
         Args:
             table_id: Table identifier (e.g., "Table 1")
             extractions: Dict of {method_name: {'data': DataFrame, 'quality': float}}
+            table_type: Table type (selects the method accuracies used as vote weights)
 
         Returns:
             (merged_dataframe, audit_entry)
@@ -63,8 +224,10 @@ class ExtractionValidator:
                 'confidence': result['quality']
             }
 
-        # Compare all extraction methods
-        discrepancies = self._detect_discrepancies(table_id, extractions)
+        # Compare all extraction methods (row fingerprints are computed once
+        # per method and shared by discrepancy detection and the vote)
+        fingerprints = {}
+        discrepancies = self._detect_discrepancies(table_id, extractions, fingerprints)
 
         # Choose reconciliation strategy
         if not discrepancies:
@@ -90,7 +253,9 @@ class ExtractionValidator:
             merged_df, resolution = self._reconcile_discrepancies(
                 table_id,
                 extractions,
-                discrepancies
+                discrepancies,
+                table_type,
+                fingerprints
             )
 
             audit_entry = {
@@ -107,11 +272,18 @@ class ExtractionValidator:
     def _detect_discrepancies(
         self,
         table_id: str,
-        extractions: Dict[str, Dict]
+        extractions: Dict[str, Dict],
+        fingerprints: Optional[Dict[str, List[Fingerprint]]] = None
     ) -> List[Dict]:
         """
         Detect differences between extraction methods
 
+        Args:
+            table_id: Table identifier
+            extractions: Extraction results by method
+            fingerprints: Row fingerprints by method, filled in as computed
+                (shared with _consensus_merge())
+
         Returns:
             List of discrepancy dictionaries
         """
@@ -151,61 +323,88 @@ class ExtractionValidator:
                 'message': 'Column headers differ between methods'
             })
 
-        # 3. Cell value discrepancies (if same dimensions)
-        if len(set(row_counts)) == 1 and len(set(col_counts)) == 1:
-            cell_diffs = self._compare_cell_values(dfs, methods)
+        # 3. Cell value discrepancies (if same columns; rows aligned if counts differ)
+        if len(set(col_counts)) == 1:
+            row_maps = None
+            if len(set(row_counts)) > 1:
+                prints = [_fingerprints(fingerprints, m, df) for m, df in zip(methods, dfs)]
+                row_maps = [np.arange(len(dfs[0]))] + [
+                    align_rows(dfs[0], df, prints[0], fp) for df, fp in zip(dfs[1:], prints[1:])
+                ]
+                row_disc = next(d for d in discrepancies if d['type'] == 'row_count')
+                row_disc['aligned_rows'] = {
+                    m: int((row_map >= 0).sum()) for m, row_map in zip(methods, row_maps)
+                }
+
+            cell_diffs = self._compare_cell_values(dfs, methods, row_maps=row_maps)
             if cell_diffs:
-                discrepancies.append({
+                discrepancy = {
                     'type': 'cell_values',
                     'severity': 'low',
                     'differences': cell_diffs,
                     'message': f'Found {len(cell_diffs)} cells with different values'
-                })
+                }
+                if row_maps is not None:
+                    discrepancy['row_maps'] = dict(zip(methods, row_maps))
+                discrepancies.append(discrepancy)
 
         return discrepancies
 
     def _compare_cell_values(
         self,
         dfs: List[pd.DataFrame],
-        methods: List[str]
+        methods: List[str],
+        tolerance: float = 0.01,
+        row_maps: Optional[List[np.ndarray]] = None
     ) -> List[Dict]:
         """
         Compare cell-by-cell values between DataFrames
 
+        All frames are aligned to a common shape once; numeric tolerance
+        and string equality are then evaluated as masks over every
+        (method, row, column) at once, with the same rules as
+        _values_equivalent().
+
+        Args:
+            dfs: Extracted DataFrames (the first is the reference)
+            methods: Method name of each DataFrame
+            tolerance: Numeric tolerance (1% by default)
+            row_maps: Per DataFrame, its row matching each reference row
+                (-1 if none; see align_rows()). None compares rows by position.
+
         Returns:
-            List of cell differences
+            List of cell differences (by method, then reference row, then
+            column); 'compare_row' is the row in the compared DataFrame
         """
         if len(dfs) < 2:
             return []
 
-        # Use first DataFrame as reference
-        ref_df = dfs[0]
-        differences = []
+        # Align to the reference; each pair compares over the shape both have
+        cells = _aligned_cells(dfs, len(dfs[0]), len(dfs[0].columns), row_maps)
+        ref, others = cells[0], cells[1:]
+        compared = np.stack([c['valid'] for c in others])
+
+        # Reference (1, rows, cols) against the stacked other methods
+        equivalent, numeric, abs_diff = _cells_equivalent(
+            {key: ref[key][None] for key in CELL_KEYS},
+            {key: np.stack([c[key] for c in others]) for key in CELL_KEYS},
+            tolerance,
+            compared
+        )
 
-        for i, compare_df in enumerate(dfs[1:], 1):
-            method_name = methods[i]
-
-            # Compare each cell
-            for row_idx in range(min(len(ref_df), len(compare_df))):
-                for col_idx in range(min(len(ref_df.columns), len(compare_df.columns))):
-                    ref_val = ref_df.iloc[row_idx, col_idx]
-                    comp_val = compare_df.iloc[row_idx, col_idx]
-
-                    # Skip if both are NaN
-                    if pd.isna(ref_val) and pd.isna(comp_val):
-                        continue
-
-                    # Compare values
-                    if not self._values_equivalent(ref_val, comp_val):
-                        differences.append({
-                            'row': row_idx,
-                            'col': col_idx,
-                            'reference_method': methods[0],
-                            'reference_value': ref_val,
-                            'compare_method': method_name,
-                            'compare_value': comp_val,
-                            'numeric_diff': self._numeric_difference(ref_val, comp_val)
-                        })
+        differences = []
+        for k, row, col in zip(*(idx.tolist() for idx in np.nonzero(compared & ~equivalent))):
+            compare_row = int(others[k]['rows'][row])
+            differences.append({
+                'row': row,
+                'compare_row': compare_row,
+                'col': col,
+                'reference_method': methods[0],
+                'reference_value': ref['df'].iat[row, col],
+                'compare_method': methods[k + 1],
+                'compare_value': others[k]['df'].iat[compare_row, col],
+                'numeric_diff': float(abs_diff[k, row, col]) if numeric[k, row, col] else None
+            })
 
         return differences
 
@@ -262,22 +461,52 @@ class ExtractionValidator:
         self,
         table_id: str,
         extractions: Dict[str, Dict],
-        discrepancies: List[Dict]
+        discrepancies: List[Dict],
+        table_type: Optional[str] = None,
+        fingerprints: Optional[Dict[str, List[Fingerprint]]] = None
     ) -> Tuple[pd.DataFrame, Dict]:
         """
         Reconcile discrepancies using intelligent strategies
 
+        A per-cell consensus vote is used whenever two or more methods
+        agree on the column count; the per-table strategies below are the
+        fallback.
+
+        Args:
+            table_id: Table identifier
+            extractions: Extraction results by method
+            discrepancies: Output of _detect_discrepancies()
+            table_type: Table type (selects method accuracies)
+            fingerprints: Row fingerprints by method (see _consensus_merge())
+
         Returns:
             (merged_dataframe, resolution_info)
         """
         logger.info(f"Reconciling {len(discrepancies)} discrepancies for {table_id}")
 
+        # Strategy 0: Cell-level consensus vote
+        consensus = self._consensus_merge(table_id, extractions, table_type, fingerprints=fingerprints)
+        if consensus is not None:
+            return consensus
+
         # Get discrepancy types
         disc_types = {d['type'] for d in discrepancies}
 
-        # Strategy 1: Row count discrepancy
+        # Strategy 1: Row count discrepancy (then patch cells over aligned rows)
         if 'row_count' in disc_types:
-            return self._resolve_row_count_discrepancy(extractions, discrepancies)
+            merged_df, resolution = self._resolve_row_count_discrepancy(extractions, discrepancies)
+            if 'cell_values' in disc_types:
+                merged_df, cell_resolution = self._resolve_cell_value_discrepancy(
+                    extractions, discrepancies, base_method=resolution['winning_method']
+                )
+                resolution['strategy'] += '+cell_merge'
+                resolution['details'] = {
+                    'changes_made': cell_resolution['changes_made'],
+                    'flagged_cells': cell_resolution['flagged_cells'],
+                    **cell_resolution['details']
+                }
+                resolution['needs_review'] = resolution.get('needs_review', False) or cell_resolution['needs_review']
+            return merged_df, resolution
 
         # Strategy 2: Column discrepancy
         if 'column_count' in disc_types or 'headers' in disc_types:
@@ -299,6 +528,133 @@ class ExtractionValidator:
             'winning_method': best_method
         }
 
+    def _consensus_merge(
+        self,
+        table_id: str,
+        extractions: Dict[str, Dict],
+        table_type: Optional[str] = None,
+        tolerance: float = 0.01,
+        fingerprints: Optional[Dict[str, List[Fingerprint]]] = None
+    ) -> Optional[Tuple[pd.DataFrame, Dict]]:
+        """
+        Merge extractions by weighted majority vote per cell
+
+        Voters are the methods sharing the most-supported column count;
+        each votes with its accuracy for the table type. Rows
+        are aligned to a base table (most rows, then highest weight) and
+        each cell takes the value with the largest total weight of
+        equivalent votes (_values_equivalent() rules; ties go to the base,
+        then to higher weights).
+
+        Args:
+            table_id: Table identifier
+            extractions: Extraction results by method
+            table_type: Table type (selects method accuracies)
+            tolerance: Numeric tolerance for equivalent votes
+            fingerprints: Row fingerprints by method, reused and filled in
+                (each voter is fingerprinted once, the base included)
+
+        Returns:
+            (merged_dataframe, resolution_info), or None if fewer than two
+            methods can vote
+        """
+        candidates = {
+            m: r for m, r in extractions.items()
+            if r.get('data') is not None and not r['data'].empty
+        }
+        weights = {m: self.accuracy.accuracy(m, table_type) for m in candidates}
+
+        # Voters: the column count with the most total weight
+        groups = {}
+        for m, r in candidates.items():
+            groups.setdefault(len(r['data'].columns), []).append(m)
+        voters = max(groups.values(), key=lambda group: sum(weights[m] for m in group), default=[])
+        if len(voters) < 2:
+            return None
+
+        base_method = max(
+            voters,
+            key=lambda m: (len(candidates[m]['data']), weights[m], candidates[m].get('quality', 0.0))
+        )
+        methods = [base_method] + sorted(
+            (m for m in voters if m != base_method), key=lambda m: weights[m], reverse=True
+        )
+        dfs = [candidates[m]['data'] for m in methods]
+        base = dfs[0]
+
+        prints = [_fingerprints(fingerprints, m, df) for m, df in zip(methods, dfs)]
+        row_maps = [np.arange(len(base))] + [
+            align_rows(base, df, prints[0], fp) for df, fp in zip(dfs[1:], prints[1:])
+        ]
+        cells = _aligned_cells(dfs, len(base), len(base.columns), row_maps)
+        valid = np.stack([c['valid'] for c in cells])
+        w = np.array([weights[m] for m in methods])
+
+        # Pairwise equivalence of the votes, then each vote's weighted support
+        k = len(methods)
+        agrees = np.zeros((k, k) + base.shape, dtype=bool)
+        for i in range(k):
+            agrees[i, i] = valid[i]
+            for j in range(i + 1, k):
+                both = valid[i] & valid[j]
+                equivalent, _, _ = _cells_equivalent(cells[i], cells[j], tolerance, both)
+                agrees[i, j] = agrees[j, i] = equivalent & both
+
+        support = np.tensordot(w, agrees, axes=(0, 1))  # (k, rows, cols)
+        support[~valid] = -np.inf
+        winner = np.argmax(support, axis=0)  # First maximum: base, then by weight
+
+        total = np.tensordot(w, valid, axes=1)
+        winner_support = np.take_along_axis(support, winner[None], axis=0)[0]
+        share = winner_support / total
+        with_winner = np.take_along_axis(agrees, winner[None, None], axis=1)[:, 0]  # (k, rows, cols)
+        contested = (valid & ~with_winner).any(axis=0)
+
+        # Merged table: base values, replaced where another vote won
+        merged_df = base.copy()
+        changed = winner != 0
+        for col in np.flatnonzero(changed.any(axis=0)).tolist():
+            rows = np.flatnonzero(changed[:, col])
+            column = merged_df.iloc[:, col].to_numpy(dtype=object).copy()
+            column[rows] = [cells[winner[row, col]]['values'][row, col] for row in rows.tolist()]
+            merged_df.isetitem(col, pd.Series(column, index=merged_df.index).infer_objects())
+
+        voted_cells = []
+        for row, col in zip(*(idx.tolist() for idx in np.nonzero(contested))):
+            voted_cells.append({
+                'row': row,
+                'col': col,
+                'value': cells[winner[row, col]]['values'][row, col],
+                'winning_method': methods[winner[row, col]],
+                'support': float(share[row, col]),
+                'votes': {
+                    m: cells[i]['values'][row, col]
+                    for i, m in enumerate(methods) if valid[i, row, col]
+                }
+            })
+
+        weak = contested & (share <= 0.5)
+        excluded = [m for m in extractions if m not in voters]
+        logger.info(
+            f"  → Consensus vote for {table_id}: {len(voted_cells)} contested cells, "
+            f"{int(changed.sum())} changed from {base_method}"
+        )
+
+        return merged_df, {
+            'strategy': 'consensus_vote',
+            'confidence': float(share.mean()) if share.size else 0.0,
+            'base_method': base_method,
+            'changes_made': int(changed.sum()),
+            'flagged_cells': int(weak.sum()),
+            'needs_review': bool(weak.any()),
+            'details': {
+                'weights': {m: weights[m] for m in methods},
+                'excluded_methods': excluded,
+                'aligned_rows': {m: int((row_map >= 0).sum()) for m, row_map in zip(methods, row_maps)},
+                'voted_cells': voted_cells
+            }
+        }
+
     def _resolve_row_count_discrepancy(
         self,
         extractions: Dict[str, Dict],
@@ -422,7 +778,8 @@ class ExtractionValidator:
     def _resolve_cell_value_discrepancy(
         self,
         extractions: Dict[str, Dict],
-        discrepancies: List[Dict]
+        discrepancies: List[Dict],
+        base_method: Optional[str] = None
     ) -> Tuple[pd.DataFrame, Dict]:
         """
         Resolve cell value discrepancies
@@ -431,14 +788,21 @@ class ExtractionValidator:
         1. For each differing cell, use value from higher-quality method
         2. If numeric difference > 10%, flag for review
         3. Create merged DataFrame with best values
+
+        Args:
+            extractions: Extraction results by method
+            discrepancies: Detected discrepancies (with 'cell_values')
+            base_method: Method whose table is patched (default: highest quality)
         """
         # Get cell value discrepancy
         cell_disc = next(d for d in discrepancies if d['type'] == 'cell_values')
         differences = cell_disc['differences']
+        row_maps = cell_disc.get('row_maps')
 
-        # Use highest quality method as base
+        # Use highest quality method as base (unless already chosen)
         qualities = {m: extractions[m]['quality'] for m in extractions.keys()}
-        base_method = max(qualities.keys(), key=lambda m: qualities[m])
+        if base_method is None:
+            base_method = max(qualities.keys(), key=lambda m: qualities[m])
         merged_df = extractions[base_method]['data'].copy()
 
         # Track which cells were changed
@@ -446,8 +810,11 @@ class ExtractionValidator:
         flagged_cells = []
 
         for diff in differences:
-            row = diff['row']
+            # Reference row → row of the base table (aligned rows)
+            row = diff['row'] if row_maps is None else int(row_maps[base_method][diff['row']])
             col = diff['col']
+            if row < 0:
+                continue
 
             # Determine which value to use
             ref_method = diff['reference_method']
@@ -497,24 +864,166 @@ class ExtractionValidator:
         }
 
 
+def _fingerprints(
+    cache: Optional[Dict[str, List[Fingerprint]]],
+    method: str,
+    df: pd.DataFrame
+) -> List[Fingerprint]:
+    """Row fingerprints of a method's table, from the cache if there"""
+    if cache is None:
+        return row_fingerprints(df)
+    if method not in cache:
+        cache[method] = row_fingerprints(df)
+    return cache[method]
+
+
+def _to_float(value: Any) -> Tuple[float, bool]:
+    """float(value) and whether it converted"""
+    try:
+        return float(value), True
+    except (ValueError, TypeError):
+        return np.nan, False
+
+
+# Per-cell matrices of an _aligned_cells() entry used for comparison
+CELL_KEYS = ('values', 'na', 'num', 'num_ok')
+
+_to_floats = np.frompyfunc(_to_float, 1, 2)
+_normalize_text = np.frompyfunc(lambda value: str(value).strip().lower(), 1, 1)
+
+
+def _cells_equivalent(
+    a: Dict[str, np.ndarray],
+    b: Dict[str, np.ndarray],
+    tolerance: float,
+    mask: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Cell-wise equivalence of two aligned cell sets (rules of _values_equivalent())
+
+    Args:
+        a: CELL_KEYS matrices (broadcastable against b)
+        b: CELL_KEYS matrices
+        tolerance: Relative numeric tolerance
+        mask: Cells being compared (text is only normalized there)
+
+    Returns:
+        (equivalent, numeric, abs_diff) matrices
+    """
+    numeric = a['num_ok'] & b['num_ok']
+
+    # Numeric comparison: relative difference (absolute if either is zero)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        abs_diff = np.abs(a['num'] - b['num'])
+        scale = np.maximum(np.abs(a['num']), np.abs(b['num']))
+        either_zero = (a['num'] == 0) | (b['num'] == 0)
+        num_equal = np.where(either_zero, abs_diff < tolerance, abs_diff / scale < tolerance)
+        num_equal |= (a['num'] == 0) & (b['num'] == 0)
+
+    # String comparison only where a value is not numeric
+    both_na = a['na'] & b['na']
+    one_na = a['na'] ^ b['na']
+    text = mask & ~both_na & ~one_na & ~numeric
+    str_equal = np.zeros(text.shape, dtype=bool)
+    if text.any():
+        cells = np.nonzero(text)
+        a_text = _normalize_text(np.broadcast_to(a['values'], text.shape)[cells])
+        b_text = _normalize_text(np.broadcast_to(b['values'], text.shape)[cells])
+        str_equal[cells] = (a_text == b_text).astype(bool)
+
+    equivalent = both_na | (~one_na & np.where(numeric, num_equal, str_equal))
+    return equivalent, numeric, abs_diff
+
+
+def _aligned_cells(
+    dfs: List[pd.DataFrame],
+    n_rows: int,
+    n_cols: int,
+    row_maps: Optional[List[np.ndarray]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Cells of each DataFrame aligned to a common (n_rows, n_cols) shape
+
+    Frames are truncated or padded (or their rows placed by row_maps);
+    padded and unmatched cells are marked invalid.
+
+    Args:
+        dfs: DataFrames
+        n_rows: Rows of the common shape
+        n_cols: Columns of the common shape
+        row_maps: Per DataFrame, its row for each common row (-1 if none)
+
+    Returns:
+        Per DataFrame: 'df', 'rows' (source row per common row, -1 if none),
+        'values' (object matrix), 'valid', 'na', 'num' (float value or NaN)
+        and 'num_ok' (converted to float) matrices
+    """
+    aligned = []
+    for k, df in enumerate(dfs):
+        if row_maps is None:
+            source = np.full(n_rows, -1, dtype=np.int64)
+            source[:min(len(df), n_rows)] = np.arange(min(len(df), n_rows))
+        else:
+            source = np.asarray(row_maps[k], dtype=np.int64)
+        targets = np.flatnonzero(source >= 0)
+        sources = source[targets]
+
+        cols = min(len(df.columns), n_cols)
+        values = np.full((n_rows, n_cols), None, dtype=object)
+        valid = np.zeros((n_rows, n_cols), dtype=bool)
+        num = np.full((n_rows, n_cols), np.nan)
+        num_ok = np.zeros((n_rows, n_cols), dtype=bool)
+        valid[targets, :cols] = True
+
+        for col in range(cols):
+            column = df.iloc[sources, col]
+            if isinstance(column.dtype, np.dtype) and column.dtype.kind in 'biuf':
+                # Plain numeric columns convert as a whole
+                values[targets, col] = column.to_numpy()
+                num[targets, col] = column.to_numpy(dtype=float)
+                num_ok[targets, col] = True
+            elif len(targets):
+                values[targets, col] = column.to_numpy(dtype=object)
+                converted, ok = _to_floats(values[targets, col])
+                num[targets, col] = converted.astype(float)
+                num_ok[targets, col] = ok.astype(bool)
+
+        aligned.append({
+            'df': df,
+            'rows': source,
+            'values': values,
+            'valid': valid,
+            'na': pd.isna(values).reshape(n_rows, n_cols),
+            'num': num,
+            'num_ok': num_ok
+        })
+
+    return aligned
+
+
 def validate_extraction_batch(
-    tables: Dict[str, Dict[str, Dict]]
+    tables: Dict[str, Dict[str, Dict]],
+    table_types: Optional[Dict[str, str]] = None,
+    accuracy: Optional[MethodAccuracy] = None
 ) -> Tuple[Dict[str, pd.DataFrame], List[Dict]]:
     """
     Validate and merge multiple table extractions
 
     Args:
         tables: Dict of {table_id: {method: {'data': df, 'quality': score}}}
+        table_types: Table type per table_id (selects vote weights)
+        accuracy: Method accuracies (vote weights); fixed priors if None
 
     Returns:
         (validated_tables, audit_log)
     """
-    validator = ExtractionValidator()
+    validator = ExtractionValidator(accuracy)
+    table_types = table_types or {}
     validated_tables = {}
     audit_log = []
 
     for table_id, extractions in tables.items():
-        merged_df, audit_entry = validator.validate_and_merge(table_id, extractions)
+        merged_df, audit_entry = validator.validate_and_merge(table_id, extractions, table_types.get(table_id))
 
         if merged_df is not None:
             validated_tables[table_id] = merged_df
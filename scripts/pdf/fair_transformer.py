@@ -11,6 +11,7 @@ Features:
 - Add metadata fields from methods section
 - Generate required IDs (grain_id, sample_mount_id, IGSN)
 - Split combined tables into separate FAIR tables
+- Columnar transformation (each output column built in one vectorized step)
 
 Output tables:
 - samples (1 record per sample)
@@ -21,31 +22,220 @@ Output tables:
 """
 
 import logging
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 from datetime import datetime
 import pandas as pd
 import numpy as np
 
+from .extracted_table import ExtractedTable
+
 logger = logging.getLogger(__name__)
 
+# FAIR table types, in tie-break order for header-based classification
+TABLE_TYPES = ['AFT_ages', 'UThHe', 'track_counts', 'track_lengths']
+
+# Column-header fragments indicating each table type (≥2 must match)
+TYPE_PATTERNS = {
+    'AFT_ages': ['age', 'ma', 'dispersion', 'p(χ²)'],
+    'UThHe': ['u', 'th', 'he', 'ft'],
+    'track_counts': ['ns', 'ni', 'rho_s', 'rho_i'],
+    'track_lengths': ['length', 'mtl']
+}
+
+# Candidate column-name fragments per FAIR field, in priority order
+# (a column matches if its lowercased name contains the fragment)
+SAMPLE_ID_NAMES = ['sample', 'sample id', 'sample no', 'id', 'name']
+
+SAMPLE_FIELDS = {
+    'latitude': ['lat', 'latitude'],
+    'longitude': ['lon', 'long', 'longitude'],
+    'elevation_m': ['elev', 'elevation', 'altitude'],
+    'lithology': ['lith', 'lithology', 'rock'],
+}
+
+FT_AGE_FIELDS = {
+    'central_age_ma': ['central age', 'age', 'ma'],
+    'central_age_error_ma': ['±', 'error', '1σ'],
+    'pooled_age_ma': ['pooled age'],
+    'pooled_age_error_ma': ['pooled error'],
+    'n_grains': ['n', 'grains', 'no. of grains'],
+    'dispersion_pct': ['disp', 'dispersion'],
+    'p_chi2_pct': ['p(χ²)', 'pχ2', 'p chi2'],
+}
+
+FT_COUNT_FIELDS = {
+    'Ns': ['ns'],
+    'Ni': ['ni'],
+    'Nd': ['nd'],
+    'rho_s_cm2': ['ρs', 'rho_s', 'rhos'],
+    'rho_i_cm2': ['ρi', 'rho_i', 'rhoi'],
+    'rho_d_cm2': ['ρd', 'rho_d', 'rhod'],
+    'U_ppm': ['u', '238u', 'uranium'],
+    'Th_ppm': ['th', '232th', 'thorium'],
+    'eU_ppm': ['eu', 'effective u'],
+    'Dpar_um': ['dpar'],
+}
+
+TRACK_LENGTH_FIELDS = {
+    'length_um': ['length', 'l', 'track length'],
+    'angle_to_c_axis_deg': ['angle', 'c-axis'],
+    'Dpar_um': ['dpar'],
+}
+
+AHE_FIELDS = {
+    'U_ppm': ['u', '238u'],
+    'Th_ppm': ['th', '232th'],
+    'Sm_ppm': ['sm', '147sm'],
+    'He_nmol_g': ['he', '4he'],
+    'raw_age_ma': ['raw age', 'uncorrected age'],
+    'corrected_age_ma': ['corrected age', 'age', 'ma'],
+    'ft_correction': ['ft', 'ft correction'],
+    'mass_ug': ['mass', 'weight'],
+    'radius_um': ['radius', 'r'],
+    'grain_geometry': ['geometry', 'shape'],
+}
+
+
+def _field_value(value):
+    """
+    Convert a table cell to a field value
+
+    "12.3 ± 1.2" → 12.3; numbers → float; anything unconvertible is
+    returned as is (after dropping the ± part).
+    """
+    try:
+        # Handle ± notation (e.g., "12.3 ± 1.2")
+        if isinstance(value, str) and '±' in value:
+            value = value.split('±')[0].strip()
+        return float(value)
+    except (ValueError, TypeError):
+        # Return string if can't convert
+        return value
+
+
+def _sample_id_value(value) -> str:
+    """Convert a sample-ID cell to a stripped string"""
+    return str(value).strip()
+
+
+_field_values = np.frompyfunc(_field_value, 1, 1)
+_sample_id_values = np.frompyfunc(_sample_id_value, 1, 1)
+
+
+class ColumnResolver:
+    """
+    FAIR field → column mapping for one DataFrame, resolved once
+
+    Column names are lowercased once; each field's candidate column
+    positions are computed on first use and reused for every row.
+    Values are taken from the first candidate column that is not null.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Args:
+            df: Extracted table
+        """
+        self.df = df
+        self._columns = [str(col).lower() for col in df.columns]
+        self._positions: Dict[tuple, List[int]] = {}
+        self._values = df.to_numpy(dtype=object)
+        self._notna = pd.notna(self._values)
+
+    def positions(self, field_names: List[str]) -> List[int]:
+        """
+        Candidate column positions for a field, in priority order
+
+        Args:
+            field_names: Name fragments in priority order
+
+        Returns:
+            Column positions (name order first, then column order)
+        """
+        key = tuple(field_names)
+        if key not in self._positions:
+            positions = []
+            for field in field_names:
+                field = field.lower()
+                for i, col in enumerate(self._columns):
+                    if field in col and i not in positions:
+                        positions.append(i)
+            self._positions[key] = positions
+        return self._positions[key]
+
+    def _select(self, field_names: List[str]):
+        """First non-null candidate value per row, and whether one was found"""
+        values = np.full(len(self.df), None, dtype=object)
+        positions = self.positions(field_names)
+        if not positions or len(self.df) == 0:
+            return values, np.zeros(len(self.df), dtype=bool)
+
+        notna = self._notna[:, positions]
+        first = notna.argmax(axis=1)
+        found = notna[np.arange(len(self.df)), first]
+        values[found] = self._values[found, np.asarray(positions)[first[found]]]
+        return values, found
+
+    def field(self, field_names: List[str]) -> np.ndarray:
+        """
+        Field values per row (first non-null candidate, ± split, numeric where possible)
+
+        Args:
+            field_names: Name fragments in priority order
+
+        Returns:
+            Object array of floats, strings or None (no candidate value)
+        """
+        values, found = self._select(field_names)
+        values[found] = _field_values(values[found])
+        return values
+
+    def fields(self, schema: Dict[str, List[str]]) -> Dict[str, np.ndarray]:
+        """
+        Resolve every field of a schema
+
+        Args:
+            schema: Output column → name fragments (e.g. FT_AGE_FIELDS)
+
+        Returns:
+            Output column → per-row values
+        """
+        return {name: self.field(field_names) for name, field_names in schema.items()}
+
+    def sample_ids(self) -> np.ndarray:
+        """Per-row sample ID (stripped string, or None)"""
+        values, found = self._select(SAMPLE_ID_NAMES)
+        values[found] = _sample_id_values(values[found])
+        return values
+
 
 class FAIRTransformer:
     """Transform extracted data to FAIR-compliant schema"""
 
-    def __init__(self):
-        """Initialize transformer"""
-        pass
+    def __init__(self, columnar: bool = True):
+        """
+        Initialize transformer
+
+        Args:
+            columnar: Build output tables column-wise (False = row-by-row
+                      reference path; both produce identical output)
+        """
+        self.columnar = columnar
 
     def transform(
         self,
-        extracted_tables: Dict[str, pd.DataFrame],
+        extracted_tables: Dict[str, Union[ExtractedTable, pd.DataFrame]],
         metadata: Dict
     ) -> Dict[str, pd.DataFrame]:
         """
         Transform publication format → FAIR database format
 
+        Each table is transformed under exactly one type: its classified
+        type for ExtractedTable inputs, or the best header match for plain
+        DataFrames (and for tables classified 'unknown').
+
         Args:
-            extracted_tables: Dictionary of table_id → DataFrame (from extraction)
+            extracted_tables: Dictionary of table_id → ExtractedTable or DataFrame (from extraction)
             metadata: Paper metadata (from methods section + DOI)
 
         Returns:
@@ -55,16 +245,17 @@ class FAIRTransformer:
 
         fair_data = {}
 
-        # Identify table types
-        aft_tables = self._find_tables_by_type(extracted_tables, 'AFT_ages')
-        ahe_tables = self._find_tables_by_type(extracted_tables, 'UThHe')
-        count_tables = self._find_tables_by_type(extracted_tables, 'track_counts')
-        length_tables = self._find_tables_by_type(extracted_tables, 'track_lengths')
+        # Identify table types (one per table)
+        typed_tables = self._assign_table_types(extracted_tables)
+        aft_tables = self._find_tables_by_type(typed_tables, 'AFT_ages')
+        ahe_tables = self._find_tables_by_type(typed_tables, 'UThHe')
+        count_tables = self._find_tables_by_type(typed_tables, 'track_counts')
+        length_tables = self._find_tables_by_type(typed_tables, 'track_lengths')
 
-        # 1. Create samples table (from all tables)
+        # 1. Create samples table (from the first AFT table)
         if aft_tables or ahe_tables:
             fair_data['samples'] = self._create_samples_table(
-                extracted_tables, metadata
+                aft_tables, metadata
             )
             logger.info(f"  ✓ samples: {len(fair_data['samples'])} records")
 
@@ -98,42 +289,62 @@ class FAIRTransformer:
 
         return fair_data
 
+    def _assign_table_types(
+        self,
+        tables: Dict[str, Union[ExtractedTable, pd.DataFrame]]
+    ) -> Dict[str, tuple]:
+        """
+        Resolve one type per table
+
+        Args:
+            tables: Dictionary of table_id → ExtractedTable or DataFrame
+
+        Returns:
+            Dictionary of table_id → (table_type, DataFrame), in input order
+        """
+        typed = {}
+        for table_id, table in tables.items():
+            if isinstance(table, ExtractedTable):
+                df = table.df
+                table_type = table.table_type if table.table_type in TABLE_TYPES else self._classify_table(df)
+            else:
+                df = table
+                table_type = self._classify_table(df)
+            typed[table_id] = (table_type, df)
+            logger.debug(f"  {table_id}: {table_type}")
+        return typed
+
     def _find_tables_by_type(
         self,
-        tables: Dict[str, pd.DataFrame],
+        typed_tables: Dict[str, tuple],
         table_type: str
     ) -> List[pd.DataFrame]:
-        """Find all tables of a specific type"""
-        # This is a simplified version - in reality, we'd track table types from semantic_analysis
-        # For now, we'll use table IDs and content heuristics
-        result = []
-        for table_id, df in tables.items():
-            # Heuristic: check if table contains type-specific columns
-            if self._is_table_type(df, table_type):
-                result.append(df)
-        return result
-
-    def _is_table_type(self, df: pd.DataFrame, table_type: str) -> bool:
-        """Check if DataFrame is of a specific type"""
-        columns_str = ' '.join([str(col).lower() for col in df.columns])
+        """Find all tables of a specific type (in input order)"""
+        return [df for t_type, df in typed_tables.values() if t_type == table_type]
 
-        type_patterns = {
-            'AFT_ages': ['age', 'ma', 'dispersion', 'p(χ²)'],
-            'UThHe': ['u', 'th', 'he', 'ft'],
-            'track_counts': ['ns', 'ni', 'rho_s', 'rho_i'],
-            'track_lengths': ['length', 'mtl']
-        }
+    def _classify_table(self, df: pd.DataFrame) -> str:
+        """
+        Best-matching table type from column headers
+
+        Returns:
+            Type with the most header pattern matches (≥2 required), else 'unknown'
+        """
+        columns_str = ' '.join([str(col).lower() for col in df.columns])
 
-        patterns = type_patterns.get(table_type, [])
-        return sum(1 for p in patterns if p in columns_str) >= 2
+        best_type, best_score = 'unknown', 1
+        for table_type in TABLE_TYPES:
+            score = sum(1 for p in TYPE_PATTERNS[table_type] if p in columns_str)
+            if score > best_score:
+                best_type, best_score = table_type, score
+        return best_type
 
     def _create_samples_table(
         self,
-        extracted_tables: Dict[str, pd.DataFrame],
+        aft_tables: List[pd.DataFrame],
         metadata: Dict
     ) -> pd.DataFrame:
         """
-        Create samples table
+        Create samples table (from the first AFT table, which usually has sample metadata)
 
         Required fields:
         - sample_id (PK)
@@ -143,32 +354,49 @@ class FAIRTransformer:
         - lithology, mineral
         - description
         """
+        if not aft_tables:
+            return pd.DataFrame()
+
+        df = aft_tables[0]
+
+        if self.columnar:
+            return self._columnar_table(
+                [df], SAMPLE_FIELDS,
+                leading=lambda ids, labels: {
+                    'sample_id': ids,
+                    'igsn': self._generate_igsns(ids),
+                    'dataset_id': metadata.get('dataset_id', 1),
+                },
+                trailing={
+                    'mineral': metadata.get('mineral', 'apatite'),
+                    'description': f"Sample from {metadata.get('title', 'Unknown paper')}",
+                }
+            )
+
         samples = []
 
-        # Get first AFT table (usually has sample metadata)
-        for table_id, df in extracted_tables.items():
-            if self._is_table_type(df, 'AFT_ages'):
-                # Extract sample info from each row
-                for idx, row in df.iterrows():
-                    sample_id = self._extract_sample_id(row)
-                    if not sample_id:
-                        continue
-
-                    sample = {
-                        'sample_id': sample_id,
-                        'igsn': self._generate_igsn(sample_id, metadata),
-                        'dataset_id': metadata.get('dataset_id', 1),
-                        'latitude': self._extract_field(row, ['lat', 'latitude']),
-                        'longitude': self._extract_field(row, ['lon', 'long', 'longitude']),
-                        'elevation_m': self._extract_field(row, ['elev', 'elevation', 'altitude']),
-                        'lithology': self._extract_field(row, ['lith', 'lithology', 'rock']),
-                        'mineral': metadata.get('mineral', 'apatite'),  # From methods or table
-                        'description': f"Sample from {metadata.get('title', 'Unknown paper')}",
-                    }
-
-                    samples.append(sample)
-
-                break  # Only process first AFT table
+        # Resolve columns once, then read each row's values
+        resolver = ColumnResolver(df)
+        sample_ids = resolver.sample_ids()
+        fields = resolver.fields(SAMPLE_FIELDS)
+
+        for pos, sample_id in enumerate(sample_ids):
+            if not sample_id:
+                continue
+
+            sample = {
+                'sample_id': sample_id,
+                'igsn': self._generate_igsn(sample_id, metadata),
+                'dataset_id': metadata.get('dataset_id', 1),
+                'latitude': fields['latitude'][pos],
+                'longitude': fields['longitude'][pos],
+                'elevation_m': fields['elevation_m'][pos],
+                'lithology': fields['lithology'][pos],
+                'mineral': metadata.get('mineral', 'apatite'),  # From methods or table
+                'description': f"Sample from {metadata.get('title', 'Unknown paper')}",
+            }
+
+            samples.append(sample)
 
         return pd.DataFrame(samples)
 
@@ -187,27 +415,35 @@ class FAIRTransformer:
         - n_grains, dispersion_pct, p_chi2_pct
         - zeta, zeta_error, dosimeter_glass
         """
+        if self.columnar:
+            return self._columnar_table(
+                aft_tables, FT_AGE_FIELDS,
+                leading=lambda ids, labels: {'sample_id': ids},
+                trailing={
+                    'zeta': metadata.get('zeta'),
+                    'zeta_error': metadata.get('zeta_error'),
+                    'dosimeter_glass': metadata.get('dosimeter'),
+                }
+            )
+
         ages = []
 
         for df in aft_tables:
-            for idx, row in df.iterrows():
-                sample_id = self._extract_sample_id(row)
+            resolver = ColumnResolver(df)
+            sample_ids = resolver.sample_ids()
+            fields = resolver.fields(FT_AGE_FIELDS)
+
+            for pos, sample_id in enumerate(sample_ids):
                 if not sample_id:
                     continue
 
-                age = {
-                    'sample_id': sample_id,
-                    'central_age_ma': self._extract_field(row, ['central age', 'age', 'ma']),
-                    'central_age_error_ma': self._extract_field(row, ['±', 'error', '1σ']),
-                    'pooled_age_ma': self._extract_field(row, ['pooled age']),
-                    'pooled_age_error_ma': self._extract_field(row, ['pooled error']),
-                    'n_grains': self._extract_field(row, ['n', 'grains', 'no. of grains']),
-                    'dispersion_pct': self._extract_field(row, ['disp', 'dispersion']),
-                    'p_chi2_pct': self._extract_field(row, ['p(χ²)', 'pχ2', 'p chi2']),
+                age = {'sample_id': sample_id}
+                age.update((name, values[pos]) for name, values in fields.items())
+                age.update({
                     'zeta': metadata.get('zeta'),
                     'zeta_error': metadata.get('zeta_error'),
                     'dosimeter_glass': metadata.get('dosimeter'),
-                }
+                })
 
                 ages.append(age)
 
@@ -230,11 +466,28 @@ class FAIRTransformer:
         - Dpar_um (etch pit diameter)
         - analyst, laboratory, microscope
         """
+        if self.columnar:
+            return self._columnar_table(
+                count_tables, FT_COUNT_FIELDS,
+                leading=lambda ids, labels: {
+                    'grain_id': ids + '_grain_' + (labels + 1).astype(str).str.zfill(2),
+                    'sample_id': ids,
+                },
+                trailing={
+                    key: metadata.get(key)
+                    for key in ['analyst', 'laboratory', 'microscope', 'objective', 'etching_conditions',
+                                'dosimeter', 'ft_algorithm', 'ft_counting_method', 'ft_software']
+                }
+            )
+
         counts = []
 
         for df in count_tables:
-            for idx, row in df.iterrows():
-                sample_id = self._extract_sample_id(row)
+            resolver = ColumnResolver(df)
+            sample_ids = resolver.sample_ids()
+            fields = resolver.fields(FT_COUNT_FIELDS)
+
+            for pos, (idx, sample_id) in enumerate(zip(df.index, sample_ids)):
                 if not sample_id:
                     continue
 
@@ -242,19 +495,9 @@ class FAIRTransformer:
                 grain_num = idx + 1
                 grain_id = f"{sample_id}_grain_{grain_num:02d}"
 
-                count = {
-                    'grain_id': grain_id,
-                    'sample_id': sample_id,
-                    'Ns': self._extract_field(row, ['ns']),
-                    'Ni': self._extract_field(row, ['ni']),
-                    'Nd': self._extract_field(row, ['nd']),
-                    'rho_s_cm2': self._extract_field(row, ['ρs', 'rho_s', 'rhos']),
-                    'rho_i_cm2': self._extract_field(row, ['ρi', 'rho_i', 'rhoi']),
-                    'rho_d_cm2': self._extract_field(row, ['ρd', 'rho_d', 'rhod']),
-                    'U_ppm': self._extract_field(row, ['u', '238u', 'uranium']),
-                    'Th_ppm': self._extract_field(row, ['th', '232th', 'thorium']),
-                    'eU_ppm': self._extract_field(row, ['eu', 'effective u']),
-                    'Dpar_um': self._extract_field(row, ['dpar']),
+                count = {'grain_id': grain_id, 'sample_id': sample_id}
+                count.update((name, values[pos]) for name, values in fields.items())
+                count.update({
                     # Metadata from methods section
                     'analyst': metadata.get('analyst'),
                     'laboratory': metadata.get('laboratory'),
@@ -265,7 +508,7 @@ class FAIRTransformer:
                     'ft_algorithm': metadata.get('ft_algorithm'),
                     'ft_counting_method': metadata.get('ft_counting_method'),
                     'ft_software': metadata.get('ft_software'),
-                }
+                })
 
                 counts.append(count)
 
@@ -286,22 +529,29 @@ class FAIRTransformer:
         - angle_to_c_axis_deg
         - Dpar_um
         """
+        if self.columnar:
+            return self._columnar_table(
+                length_tables, TRACK_LENGTH_FIELDS,
+                leading=lambda ids, labels: {
+                    'track_id': 'TRK_' + pd.Series(np.arange(1, len(ids) + 1)).astype(str).str.zfill(6),
+                    'sample_id': ids,
+                }
+            )
+
         tracks = []
         track_counter = 1
 
         for df in length_tables:
-            for idx, row in df.iterrows():
-                sample_id = self._extract_sample_id(row)
+            resolver = ColumnResolver(df)
+            sample_ids = resolver.sample_ids()
+            fields = resolver.fields(TRACK_LENGTH_FIELDS)
+
+            for pos, sample_id in enumerate(sample_ids):
                 if not sample_id:
                     continue
 
-                track = {
-                    'track_id': f"TRK_{track_counter:06d}",
-                    'sample_id': sample_id,
-                    'length_um': self._extract_field(row, ['length', 'l', 'track length']),
-                    'angle_to_c_axis_deg': self._extract_field(row, ['angle', 'c-axis']),
-                    'Dpar_um': self._extract_field(row, ['dpar']),
-                }
+                track = {'track_id': f"TRK_{track_counter:06d}", 'sample_id': sample_id}
+                track.update((name, values[pos]) for name, values in fields.items())
 
                 tracks.append(track)
                 track_counter += 1
@@ -323,11 +573,27 @@ class FAIRTransformer:
         - raw_age_ma, corrected_age_ma, ft_correction
         - mass_ug, radius_um, grain_geometry
         """
+        if self.columnar:
+            return self._columnar_table(
+                ahe_tables, AHE_FIELDS,
+                leading=lambda ids, labels: {
+                    'grain_id': ids + '_ahe_' + (labels + 1).astype(str).str.zfill(2),
+                    'sample_id': ids,
+                },
+                trailing={
+                    'analyst': metadata.get('analyst'),
+                    'laboratory': metadata.get('laboratory'),
+                }
+            )
+
         grains = []
 
         for df in ahe_tables:
-            for idx, row in df.iterrows():
-                sample_id = self._extract_sample_id(row)
+            resolver = ColumnResolver(df)
+            sample_ids = resolver.sample_ids()
+            fields = resolver.fields(AHE_FIELDS)
+
+            for pos, (idx, sample_id) in enumerate(zip(df.index, sample_ids)):
                 if not sample_id:
                     continue
 
@@ -335,67 +601,76 @@ class FAIRTransformer:
                 grain_num = idx + 1
                 grain_id = f"{sample_id}_ahe_{grain_num:02d}"
 
-                grain = {
-                    'grain_id': grain_id,
-                    'sample_id': sample_id,
-                    'U_ppm': self._extract_field(row, ['u', '238u']),
-                    'Th_ppm': self._extract_field(row, ['th', '232th']),
-                    'Sm_ppm': self._extract_field(row, ['sm', '147sm']),
-                    'He_nmol_g': self._extract_field(row, ['he', '4he']),
-                    'raw_age_ma': self._extract_field(row, ['raw age', 'uncorrected age']),
-                    'corrected_age_ma': self._extract_field(row, ['corrected age', 'age', 'ma']),
-                    'ft_correction': self._extract_field(row, ['ft', 'ft correction']),
-                    'mass_ug': self._extract_field(row, ['mass', 'weight']),
-                    'radius_um': self._extract_field(row, ['radius', 'r']),
-                    'grain_geometry': self._extract_field(row, ['geometry', 'shape']),
+                grain = {'grain_id': grain_id, 'sample_id': sample_id}
+                grain.update((name, values[pos]) for name, values in fields.items())
+                grain.update({
                     # Metadata
                     'analyst': metadata.get('analyst'),
                     'laboratory': metadata.get('laboratory'),
-                }
+                })
 
                 grains.append(grain)
 
         return pd.DataFrame(grains)
 
-    # Helper methods
+    # Columnar path
 
-    def _extract_sample_id(self, row: pd.Series) -> Optional[str]:
-        """Extract sample ID from row"""
-        # Try common column names
-        for col in ['sample', 'sample id', 'sample no', 'id', 'name']:
-            for actual_col in row.index:
-                if col in str(actual_col).lower():
-                    value = row[actual_col]
-                    if pd.notna(value):
-                        return str(value).strip()
-        return None
-
-    def _extract_field(self, row: pd.Series, field_names: List[str]) -> Optional[float]:
+    def _columnar_table(
+        self,
+        tables: List[pd.DataFrame],
+        schema: Dict[str, List[str]],
+        leading: Callable[[pd.Series, pd.Series], Dict[str, Any]],
+        trailing: Optional[Dict[str, Any]] = None
+    ) -> pd.DataFrame:
         """
-        Extract field value from row by trying multiple column names
+        Build a FAIR table column-wise from one or more source tables
+
+        Rows without a sample ID are dropped; every remaining column is a
+        single vectorized selection over all source rows.
 
         Args:
-            row: DataFrame row
-            field_names: List of possible column names (lowercase)
+            tables: Source DataFrames (rows are concatenated in order)
+            schema: Field columns → candidate name fragments
+            leading: Builds the ID columns from (sample IDs, row index labels)
+            trailing: Constant columns appended after the fields (metadata)
 
         Returns:
-            Numeric value or None
+            FAIR DataFrame (empty, without columns, if no rows have a sample ID)
         """
-        for field in field_names:
-            for actual_col in row.index:
-                if field.lower() in str(actual_col).lower():
-                    value = row[actual_col]
-                    if pd.notna(value):
-                        # Try to convert to numeric
-                        try:
-                            # Handle ± notation (e.g., "12.3 ± 1.2")
-                            if isinstance(value, str) and '±' in value:
-                                value = value.split('±')[0].strip()
-                            return float(value)
-                        except (ValueError, TypeError):
-                            # Return string if can't convert
-                            return value
-        return None
+        sample_ids = []
+        labels = []
+        fields = {name: [] for name in schema}
+
+        for df in tables:
+            resolver = ColumnResolver(df)
+            ids = resolver.sample_ids()
+            keep = np.not_equal(ids, None) & np.not_equal(ids, '')  # Missing or blank IDs are skipped
+
+            sample_ids.append(ids[keep])
+            labels.append(np.asarray(df.index)[keep])
+            for name, values in resolver.fields(schema).items():
+                fields[name].append(values[keep])
+
+        n_rows = sum(len(ids) for ids in sample_ids)
+        if n_rows == 0:
+            return pd.DataFrame()
+
+        ids = pd.Series(np.concatenate(sample_ids), dtype=object)
+        columns = leading(ids, pd.Series(np.concatenate(labels)))
+        columns.update((name, np.concatenate(parts)) for name, parts in fields.items())
+        columns.update(trailing or {})
+
+        # Lists get the same per-column type inference as the row path's records
+        return pd.DataFrame({
+            name: (values.tolist() if isinstance(values, (np.ndarray, pd.Series)) else [values] * n_rows)
+            for name, values in columns.items()
+        })
+
+    def _generate_igsns(self, sample_ids: pd.Series) -> pd.Series:
+        """Vectorized _generate_igsn()"""
+        return 'IECUR' + sample_ids.str.replace('-', '', regex=False).str.replace(' ', '', regex=False)
+
+    # Helper methods
 
     def _generate_igsn(self, sample_id: str, metadata: Dict) -> str:
         """
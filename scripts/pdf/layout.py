@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Page Layout Analysis
+
+Purpose: Detect table regions from positioned text instead of fixed boxes
+Created: 2026-10-17
+
+Features:
+- Uniform grid index over span bboxes (fast region queries per page)
+- Text rows assembled from spans (y grouping), split into cells at wide gaps
+- Caption column: bounded by prose paragraphs beside the caption, so a
+  caption in a two-column layout only looks down its own column
+- Table region below a caption: consecutive rows whose column gaps line up
+  with a neighbouring row's, up to a large vertical gap, the next caption
+  or a notes line
+- Tight bboxes (fewer spans per extractor, smaller Camelot areas)
+- Rotated pages laid out in their reading frame
+
+Example:
+    layout = session.layout(page_num)
+    bbox = layout.table_region(caption_bbox)  # None → use the fixed fallback box
+"""
+
+import logging
+import re
+from typing import List, Optional, Tuple
+import numpy as np
+import fitz  # pymupdf
+
+from .coordinates import transform_bbox
+from .spans import SpanStore
+
+logger = logging.getLogger(__name__)
+
+# Grid cell size in points
+GRID_CELL = 48.0
+
+# Spans whose tops differ by less than this share a row (points)
+ROW_TOLERANCE = 3.0
+
+# A vertical gap larger than this many median row heights ends a table
+GAP_FACTOR = 2.0
+
+# Whitespace wider than this many span heights separates two cells (word spaces are ~0.25)
+CELL_GAP_FACTOR = 0.5
+
+# Rows need at least this many cell gaps lined up with a neighbouring row's to count as table rows
+MIN_ROW_GAPS = 2
+
+# Text blocks with at least this many lines and share of the page width are prose paragraphs
+MIN_PARAGRAPH_LINES = 3
+MIN_PARAGRAPH_WIDTH = 0.25
+
+# Paragraphs starting within this many caption heights below the caption sit beside it
+COLUMN_PROBE_FACTOR = 3.0
+
+# Tables need at least this many multi-cell rows
+MIN_TABLE_ROWS = 2
+
+# Padding around the detected region (points)
+REGION_PADDING = 2.0
+
+# Rows that end a table region: the next caption or the table notes
+REGION_STOP_RE = re.compile(r'^(?:table|fig(?:ure)?\.?)\s*[A-Z]?\d|^notes?\b|^abbreviations?\b', re.IGNORECASE)
+
+
+class GridIndex:
+    """Uniform grid over bboxes: each cell lists the items overlapping it"""
+
+    def __init__(self, coords: np.ndarray, cell: float = GRID_CELL):
+        """
+        Args:
+            coords: (n, 4) array of item bboxes (x0, y0, x1, y1)
+            cell: Grid cell size in points
+        """
+        self.coords = coords
+        self.cell = cell
+        self.buckets = {}
+
+        if len(coords) == 0:
+            return
+
+        cx0, cy0 = self._cells(coords[:, 0]), self._cells(coords[:, 1])
+        cx1, cy1 = self._cells(coords[:, 2]), self._cells(coords[:, 3])
+        widths = cx1 - cx0 + 1
+        counts = widths * (cy1 - cy0 + 1)
+
+        # One (cell, item) pair per covered cell, grouped by cell
+        items = np.repeat(np.arange(len(coords)), counts)
+        k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        cells = zip((cx0[items] + k % widths[items]).tolist(), (cy0[items] + k // widths[items]).tolist())
+        for cell_key, item in zip(cells, items.tolist()):
+            self.buckets.setdefault(cell_key, []).append(item)
+
+    def _cells(self, values: np.ndarray) -> np.ndarray:
+        return np.floor(values / self.cell).astype(np.int64)
+
+    def query(self, bbox: Tuple[float, float, float, float]) -> np.ndarray:
+        """
+        Items whose bbox intersects a region
+
+        Args:
+            bbox: (x0, y0, x1, y1) region
+
+        Returns:
+            Sorted item indices
+        """
+        x0, y0, x1, y1 = bbox
+        gx0, gy0, gx1, gy1 = (int(np.floor(v / self.cell)) for v in bbox)
+        candidates = [
+            item
+            for gx in range(gx0, gx1 + 1)
+            for gy in range(gy0, gy1 + 1)
+            for item in self.buckets.get((gx, gy), ())
+        ]
+        if not candidates:
+            return np.empty(0, dtype=np.int64)
+
+        ids = np.unique(candidates)
+        c = self.coords[ids]
+        hit = (c[:, 2] > x0) & (c[:, 0] < x1) & (c[:, 3] > y0) & (c[:, 1] < y1)
+        return ids[hit]
+
+
+class PageLayout:
+    """
+    Text geometry of one page with a grid index over its spans
+
+    Rows and regions are found in the page's reading frame; table_region()
+    takes and returns page-frame bboxes.
+    """
+
+    def __init__(
+        self,
+        spans: SpanStore,
+        page_rect: Tuple[float, float, float, float],
+        matrix: Optional[fitz.Matrix] = None
+    ):
+        """
+        Args:
+            spans: All text spans of the page (page frame)
+            page_rect: Page rectangle (x0, y0, x1, y1) in the page frame
+            matrix: Page frame → reading frame (None if text is horizontal)
+        """
+        self.matrix = matrix
+        self.inverse = ~matrix if matrix is not None else None
+        if matrix is not None:
+            spans = spans.transform(matrix)
+            page_rect = transform_bbox(page_rect, matrix)
+
+        self.spans = spans
+        self.page_rect = tuple(page_rect)
+        self.grid = GridIndex(spans.coords)
+
+    def rows(self, bbox: Tuple[float, float, float, float]) -> List[dict]:
+        """
+        Text rows of the spans starting inside a region
+
+        A span belongs to the region if its top is below the region's top and
+        its horizontal centre lies within the region. Within a row, spans
+        separated by more than CELL_GAP_FACTOR span heights are separate cells.
+
+        Args:
+            bbox: (x0, y0, x1, y1) region
+
+        Returns:
+            Rows top to bottom: {'bbox', 'cells', 'gaps', 'text'} ('gaps' are
+            the (x0, x1) whitespace intervals between cells, 'text' the
+            leftmost span's)
+        """
+        ids = self.grid.query(bbox)
+        centres = (self.spans.coords[ids, 0] + self.spans.coords[ids, 2]) / 2
+        ids = ids[(self.spans.y0[ids] >= bbox[1]) & (centres >= bbox[0]) & (centres <= bbox[2])]
+        if len(ids) == 0:
+            return []
+
+        coords = self.spans.coords[ids]
+        order = np.argsort(coords[:, 1], kind='stable')
+        row_ids = np.concatenate([[0], np.cumsum(np.diff(coords[order, 1]) >= ROW_TOLERANCE)])
+        row_of = np.empty(len(ids), dtype=np.int64)
+        row_of[order] = row_ids
+
+        # Left to right within each row
+        order = np.lexsort((coords[:, 0], row_of))
+        ids, coords, row_of = ids[order], coords[order], row_of[order]
+        starts = np.flatnonzero(np.diff(row_of, prepend=-1))
+        ends = np.append(starts[1:], len(ids))
+
+        rows = []
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            c = coords[start:end]
+            # Whitespace before each span: its left edge minus the furthest right edge so far
+            reach = np.maximum.accumulate(c[:, 2])
+            gap_width = c[1:, 0] - reach[:-1]
+            split = np.flatnonzero(gap_width > CELL_GAP_FACTOR * float(np.median(c[:, 3] - c[:, 1])))
+            rows.append({
+                'bbox': (float(c[:, 0].min()), float(c[:, 1].min()), float(reach[-1]), float(c[:, 3].max())),
+                'cells': len(split) + 1,
+                'gaps': [(float(reach[k]), float(c[k + 1, 0])) for k in split.tolist()],
+                'text': self.spans.text(ids[start])
+            })
+        return rows
+
+    def column(self, caption_bbox: Tuple[float, float, float, float]) -> Tuple[float, float]:
+        """
+        Horizontal extent of the text column holding a caption
+
+        The column runs between the nearest prose paragraphs left and right
+        of the caption's text block that start beside or just below it (the
+        neighbouring columns of a multi-column layout), or to the page edge.
+
+        Args:
+            caption_bbox: Caption bounding box (x0, y0, x1, y1), reading frame
+
+        Returns:
+            (x0, x1) of the column, reading frame
+        """
+        px0, _, px1, _ = self.page_rect
+        caption_ids = self.grid.query(caption_bbox)
+        if len(caption_ids) == 0:
+            return px0, px1
+
+        coords = self.spans.coords
+        in_caption = np.isin(self.spans.block_ids, self.spans.block_ids[caption_ids])
+        bx0, by0 = coords[in_caption, 0].min(), coords[in_caption, 1].min()
+        bx1, by1 = coords[in_caption, 2].max(), coords[in_caption, 3].max()
+
+        # Per-block extent and line count
+        blocks, block_of = np.unique(self.spans.block_ids, return_inverse=True)
+        x0 = np.full(len(blocks), np.inf)
+        y0 = np.full(len(blocks), np.inf)
+        x1 = np.full(len(blocks), -np.inf)
+        y1 = np.full(len(blocks), -np.inf)
+        np.minimum.at(x0, block_of, coords[:, 0])
+        np.minimum.at(y0, block_of, coords[:, 1])
+        np.maximum.at(x1, block_of, coords[:, 2])
+        np.maximum.at(y1, block_of, coords[:, 3])
+        block_lines = np.unique(np.stack([block_of, self.spans.line_ids]), axis=1)[0]
+        n_lines = np.bincount(block_lines, minlength=len(blocks))
+
+        probe = by1 + COLUMN_PROBE_FACTOR * float(by1 - by0)
+        beside = (
+            (n_lines >= MIN_PARAGRAPH_LINES)
+            & (x1 - x0 >= MIN_PARAGRAPH_WIDTH * (px1 - px0))
+            & (y0 < probe) & (y1 > by0)
+        )
+        left = beside & (x1 <= bx0)
+        right = beside & (x0 >= bx1)
+
+        return (
+            max(px0, float(x1[left].max())) if left.any() else px0,
+            min(px1, float(x0[right].min())) if right.any() else px1,
+        )
+
+    def table_region(self, caption_bbox: Tuple[float, float, float, float]) -> Optional[Tuple]:
+        """
+        Region of the table below a caption
+
+        Only rows in the caption's column are considered. A table row has at
+        least MIN_ROW_GAPS cell gaps that line up with gaps of the row above
+        or below (prose, even set in two columns, has at most one). Leading
+        non-table rows (caption continuation lines) are skipped; the table
+        then runs over consecutive rows until a vertical gap of more than
+        GAP_FACTOR median row heights, the next caption or a notes line.
+
+        Args:
+            caption_bbox: Caption bounding box (x0, y0, x1, y1) in the page frame
+
+        Returns:
+            Table bounding box (x0, y0, x1, y1) in the page frame, or None
+            if no table-like rows follow the caption
+        """
+        if self.matrix is not None:
+            caption_bbox = transform_bbox(caption_bbox, self.matrix)
+
+        px0, py0, px1, py1 = self.page_rect
+        cx0, cx1 = self.column(caption_bbox)
+        rows = self.rows((cx0, caption_bbox[3] - 1, cx1, py1))
+        is_table = _aligned_rows(rows)
+
+        # Skip caption continuation lines
+        first = next((i for i, table_row in enumerate(is_table) if table_row), None)
+        if first is None or sum(is_table) < MIN_TABLE_ROWS:
+            return None
+        rows, is_table = rows[first:], is_table[first:]
+
+        row_height = float(np.median([row['bbox'][3] - row['bbox'][1] for row, t in zip(rows, is_table) if t]))
+        max_gap = GAP_FACTOR * row_height
+
+        end = 1
+        while end < len(rows):
+            gap = rows[end]['bbox'][1] - rows[end - 1]['bbox'][3]
+            if gap > max_gap or REGION_STOP_RE.match(rows[end]['text']):
+                break
+            end += 1
+
+        if sum(is_table[:end]) < MIN_TABLE_ROWS:
+            return None
+
+        boxes = np.array([row['bbox'] for row in rows[:end]])
+        bbox = (
+            max(px0, float(boxes[:, 0].min()) - REGION_PADDING),
+            max(py0, float(boxes[:, 1].min()) - REGION_PADDING),
+            min(px1, float(boxes[:, 2].max()) + REGION_PADDING),
+            min(py1, float(boxes[:, 3].max()) + REGION_PADDING),
+        )
+        if self.inverse is not None:
+            bbox = transform_bbox(bbox, self.inverse)
+        return bbox
+
+
+def _aligned_rows(rows: List[dict]) -> List[bool]:
+    """
+    Flag table rows: at least MIN_ROW_GAPS of a row's cell gaps overlap a
+    gap of the row above or below
+
+    Args:
+        rows: Result of PageLayout.rows()
+
+    Returns:
+        One flag per row
+    """
+    flags = []
+    for i, row in enumerate(rows):
+        neighbour_gaps = [
+            gap for j in (i - 1, i + 1) if 0 <= j < len(rows) for gap in rows[j]['gaps']
+        ]
+        aligned = sum(
+            any(g0 < n1 and n0 < g1 for n0, n1 in neighbour_gaps)
+            for g0, g1 in row['gaps']
+        )
+        flags.append(aligned >= MIN_ROW_GAPS)
+    return flags
@@ -12,15 +12,186 @@ Features:
 - Extract dosimeter and irradiation info
 - Extract software and algorithms
 - Extract constants (λ_D, λ_f, zeta)
+- Keyword prefilter decides which field patterns run, and where (PatternScanner)
 """
 
 import logging
 import re
-from typing import Dict, Optional, List
+from typing import Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+class PatternScanner:
+    """
+    Fill many fields from a text, skipping patterns that cannot match
+
+    Each pattern carries prefilter keywords: literals (lowercase) of which
+    at least one appears in every match. Keywords are looked up in the
+    lowercased text only when a pattern is reached (fields stop at their
+    first match), and a pattern only runs if one of its keywords is
+    present. A pattern whose matches all start with a keyword is matched
+    at the keyword positions instead of searched over the whole text
+    (case-insensitive searches are the expensive part). Each field takes
+    the first (leftmost) match of its highest-priority pattern, the same
+    result as re.search() over its patterns in order.
+    """
+
+    def __init__(self, fields: Dict[str, List[Tuple[str, List[str], Callable]]], flags: int = re.IGNORECASE):
+        """
+        Args:
+            fields: field → [(pattern, keywords, formatter), ...] in priority
+                order; a formatter turns a match into a value (None moves on
+                to the next pattern)
+            flags: re flags for every pattern
+        """
+        self.fields = {
+            field: [
+                (re.compile(pattern, flags), keywords, _starts_with_keyword(pattern, keywords), formatter)
+                for pattern, keywords, formatter in patterns
+            ]
+            for field, patterns in fields.items()
+        }
+
+    def scan(self, text: str) -> Dict:
+        """
+        Run each field's patterns in priority order until one gives a value
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Dictionary of field → value (fields without a match are absent)
+        """
+        lowered = text.lower()
+        same_length = len(lowered) == len(text)  # Positions in lowered index text
+        first_hits = {}
+
+        found = {}
+        for field, patterns in self.fields.items():
+            for regex, keywords, leading, formatter in patterns:
+                hits = {}
+                for kw in keywords:
+                    if kw not in first_hits:
+                        first_hits[kw] = lowered.find(kw)
+                    if first_hits[kw] >= 0:
+                        hits[kw] = first_hits[kw]
+                if not hits:
+                    continue
+
+                if leading and same_length:
+                    match = _match_at_keywords(regex, text, lowered, hits)
+                else:
+                    match = regex.search(text)
+                if match is None:
+                    continue
+                value = formatter(match)
+                if value is not None:
+                    found[field] = value
+                    break
+
+        return found
+
+
+def _match_at_keywords(regex: re.Pattern, text: str, lowered: str, hits: Dict[str, int]) -> Optional[re.Match]:
+    """
+    Leftmost match of a pattern whose matches all start with a keyword
+
+    Tries the keyword occurrences in text order instead of every position.
+
+    Args:
+        regex: Compiled pattern
+        text: Text to match in
+        lowered: text.lower() (same length)
+        hits: keyword → its first position in lowered (present keywords only)
+
+    Returns:
+        Same match as regex.search(text), or None
+    """
+    hits = dict(hits)
+    while hits:
+        kw = min(hits, key=hits.get)
+        match = regex.match(text, hits[kw])
+        if match is not None:
+            return match
+        hits[kw] = lowered.find(kw, hits[kw] + 1)
+        if hits[kw] < 0:
+            del hits[kw]
+    return None
+
+
+def _starts_with_keyword(pattern: str, keywords: List[str]) -> bool:
+    """
+    Whether every match of pattern starts with one of its keywords
+
+    Conservative: the pattern must begin with a keyword (literally or
+    re.escape()d, not followed by a quantifier), or with a group whose
+    alternatives all do; any other alternation disqualifies it.
+
+    Args:
+        pattern: Regex source
+        keywords: Its prefilter keywords (lowercase)
+
+    Returns:
+        True if matches can be tried at keyword positions only
+    """
+    def leads(source: str) -> bool:
+        for kw in keywords:
+            for literal in (kw, re.escape(kw)):
+                if source.startswith(literal) and source[len(literal):len(literal) + 1] not in ('?', '*', '+', '{'):
+                    return True
+        return False
+
+    source = pattern.lower()
+    group = re.match(r'\((?:\?:)?([^()\[\]\\]*)\)(?![?*+{])', source)
+    if group:
+        rest = source[group.end():]
+        return '|' not in rest and all(leads(alternative + rest) for alternative in group.group(1).split('|'))
+    return '|' not in source and leads(source)
+
+
+def _keyed(patterns: List[str], keywords: List[List[str]], formatter: Callable) -> List[Tuple]:
+    """Pair each pattern with its prefilter keywords and a formatter"""
+    return [(pattern, kws, formatter) for pattern, kws in zip(patterns, keywords)]
+
+
+def _first_group(match: re.Match) -> str:
+    """First captured group"""
+    return match.group(1).strip()
+
+
+def _any_group(match: re.Match) -> Optional[str]:
+    """First non-empty captured group"""
+    for group in match.groups():
+        if group:
+            return group.strip()
+    return None
+
+
+def _whole_match(match: re.Match) -> str:
+    """Entire matched text"""
+    return match.group(0).strip()
+
+
+def _constant(value: str) -> Callable:
+    """Formatter returning a fixed value (keyword patterns)"""
+    return lambda match: value
+
+
+def _etching_conditions(match: re.Match) -> str:
+    """Normalized etching description from acid concentration, temperature, duration"""
+    acid_conc, temp, duration = match.group(1), match.group(2), match.group(3)
+    return f"{acid_conc}% HNO3 at {temp}°C for {duration}s"
+
+
+def _zeta(match: re.Match) -> Optional[Dict]:
+    """Zeta value and error"""
+    try:
+        return {'value': float(match.group(1)), 'error': float(match.group(2))}
+    except ValueError:
+        return None
+
+
 class MethodsParser:
     """Extract metadata from methods section"""
 
@@ -71,6 +242,48 @@ class MethodsParser:
             r'ζ[:\s]+(\d+\.?\d*)\s*±\s*(\d+\.?\d*)',
         ]
 
+        # Objective magnification ("100×", "dry objective", "oil immersion")
+        self.objective_patterns = [
+            r'(\d+)×\s+(?:dry|oil)?\s*(?:immersion\s+)?objective',
+            r'(dry|oil)\s+immersion\s+objective',
+        ]
+
+        # Etching conditions, e.g. "5.5% HNO3 at 21°C for 20 seconds" (full
+        # description first, then partial ones)
+        self.etching_condition_patterns = [
+            r'(\d+\.?\d*)\s*(?:%|M)\s+HNO[₃3]\s+(?:at\s+)?(\d+)\s*°C\s+for\s+(\d+)\s*(?:s|sec|seconds)',
+            r'(\d+\.?\d*)\s*(?:%|M)\s+HNO[₃3]',
+            r'etching\s+(?:at\s+)?(\d+)\s*°C',
+        ]
+
+        # Keywords (first listed keyword present wins)
+        self.counting_methods = ['EDM', 'LA-ICP-MS', 'external detector', 'laser ablation']
+        self.algorithms = ['zeta', 'absolute age', 'isochron']
+
+        # Every field's patterns, in priority order, with prefilter keywords
+        # (lowercase literals found in any match) and how a match becomes a value
+        self.scanner = PatternScanner({
+            'analyst': _keyed(self.analyst_patterns, [['analyzed by'], ['analyst']], _first_group),
+            'laboratory': _keyed(self.lab_patterns, [
+                ['universit'], ['university', 'institute', 'laboratory'], ['geosep services'], ['apatite to zircon'],
+            ], _first_group),
+            'microscope': _keyed(self.microscope_patterns, [
+                ['zeiss', 'nikon', 'olympus', 'leica'], ['objective'], ['objective'],
+            ], _any_group),
+            'objective': _keyed(self.objective_patterns, [['objective'], ['objective']], _first_group),
+            'etching_conditions': _keyed(self.etching_condition_patterns[:1], [['hno']], _etching_conditions)
+                + _keyed(self.etching_condition_patterns[1:], [['hno'], ['etching']], _whole_match),
+            'dosimeter': _keyed(self.dosimeter_patterns, [['dosimeter'], ['dosimeter']], _first_group),
+            'ft_software': _keyed(self.software_patterns, [
+                ['trackkey', 'trackworks', 'fasttracks', 'radialplotter'], ['icp', 'edm'],
+            ], _first_group),
+            'ft_counting_method': [
+                (re.escape(m), [m.lower()], _constant(m.upper() if m.isupper() else m)) for m in self.counting_methods
+            ],
+            'ft_algorithm': [(re.escape(a), [a.lower()], _constant(a.capitalize())) for a in self.algorithms],
+            'zeta': _keyed(self.zeta_patterns, [['zeta'], ['ζ']], _zeta),
+        })
+
     def parse_methods(self, full_text: str) -> Dict:
         """
         Extract metadata from methods section
@@ -92,19 +305,14 @@ class MethodsParser:
             logger.warning("Could not find methods section")
             methods_text = full_text  # Fallback to full text
 
-        # Extract fields
-        metadata['analyst'] = self._extract_analyst(methods_text)
-        metadata['laboratory'] = self._extract_laboratory(methods_text)
-        metadata['microscope'] = self._extract_microscope(methods_text)
-        metadata['objective'] = self._extract_objective(methods_text)
-        metadata['etching_conditions'] = self._extract_etching(methods_text)
-        metadata['dosimeter'] = self._extract_dosimeter(methods_text)
-        metadata['ft_software'] = self._extract_software(methods_text)
-        metadata['ft_counting_method'] = self._extract_counting_method(methods_text)
-        metadata['ft_algorithm'] = self._extract_algorithm(methods_text)
+        # Extract fields (one scan of the methods text fills every field)
+        found = self.scanner.scan(methods_text)
+        for field in ('analyst', 'laboratory', 'microscope', 'objective', 'etching_conditions',
+                      'dosimeter', 'ft_software', 'ft_counting_method', 'ft_algorithm'):
+            metadata[field] = found.get(field)
 
         # Extract zeta
-        zeta_info = self._extract_zeta(methods_text)
+        zeta_info = found.get('zeta')
         if zeta_info:
             metadata['zeta'] = zeta_info['value']
             metadata['zeta_error'] = zeta_info['error']
@@ -158,126 +366,6 @@ class MethodsParser:
 
         return None
 
-    def _extract_analyst(self, text: str) -> Optional[str]:
-        """Extract analyst name"""
-        for pattern in self.analyst_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-        return None
-
-    def _extract_laboratory(self, text: str) -> Optional[str]:
-        """Extract laboratory name"""
-        for pattern in self.lab_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-        return None
-
-    def _extract_microscope(self, text: str) -> Optional[str]:
-        """Extract microscope type"""
-        for pattern in self.microscope_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                # Return first captured group
-                for group in match.groups():
-                    if group:
-                        return group.strip()
-        return None
-
-    def _extract_objective(self, text: str) -> Optional[str]:
-        """Extract objective magnification"""
-        # Look for patterns like "100×", "dry objective", "oil immersion"
-        patterns = [
-            r'(\d+)×\s+(?:dry|oil)?\s*(?:immersion\s+)?objective',
-            r'(dry|oil)\s+immersion\s+objective',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-        return None
-
-    def _extract_etching(self, text: str) -> Optional[str]:
-        """Extract etching conditions"""
-        # Example: "5.5% HNO3 at 21°C for 20 seconds"
-        pattern = r'(\d+\.?\d*)\s*(?:%|M)\s+HNO[₃3]\s+(?:at\s+)?(\d+)\s*°C\s+for\s+(\d+)\s*(?:s|sec|seconds)'
-
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            acid_conc = match.group(1)
-            temp = match.group(2)
-            duration = match.group(3)
-            return f"{acid_conc}% HNO3 at {temp}°C for {duration}s"
-
-        # Try simpler patterns
-        simple_patterns = [
-            r'(\d+\.?\d*)\s*(?:%|M)\s+HNO[₃3]',
-            r'etching\s+(?:at\s+)?(\d+)\s*°C',
-        ]
-
-        for pattern in simple_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0).strip()
-
-        return None
-
-    def _extract_dosimeter(self, text: str) -> Optional[str]:
-        """Extract dosimeter glass type"""
-        for pattern in self.dosimeter_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-        return None
-
-    def _extract_software(self, text: str) -> Optional[str]:
-        """Extract software used"""
-        for pattern in self.software_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-        return None
-
-    def _extract_counting_method(self, text: str) -> Optional[str]:
-        """Extract FT counting method"""
-        methods = ['EDM', 'LA-ICP-MS', 'external detector', 'laser ablation']
-
-        text_lower = text.lower()
-        for method in methods:
-            if method.lower() in text_lower:
-                return method.upper() if method.isupper() else method
-        return None
-
-    def _extract_algorithm(self, text: str) -> Optional[str]:
-        """Extract FT age calculation algorithm"""
-        algorithms = ['zeta', 'absolute age', 'isochron']
-
-        text_lower = text.lower()
-        for algo in algorithms:
-            if algo.lower() in text_lower:
-                return algo.capitalize()
-        return None
-
-    def _extract_zeta(self, text: str) -> Optional[Dict]:
-        """
-        Extract zeta calibration value
-
-        Returns:
-            Dict with 'value' and 'error' or None
-        """
-        for pattern in self.zeta_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    value = float(match.group(1))
-                    error = float(match.group(2))
-                    return {'value': value, 'error': error}
-                except ValueError:
-                    continue
-        return None
-
     def extract_mineral_type(self, text: str) -> Optional[str]:
         """Extract mineral type (apatite, zircon)"""
         minerals = ['apatite', 'zircon']
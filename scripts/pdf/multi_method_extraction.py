@@ -9,27 +9,32 @@ Created: 2025-11-17 (IDEA-012 Phase 2)
 Features:
 - Read discovered tables from /thermoanalysis output
 - Extract each table using 5 methods
+- Method registry with memoized page-level results (pdf hash, page, bbox,
+  method, params): aliases run once, tables crop the shared page result
 - Score extractions with type-aware quality metrics
 - Save all attempts to RAW/ folder
 - Generate comparison report showing method scores
 - Auto-select best method per table
+- Consensus table per table: cell vote across the distinct methods,
+  weighted by method accuracy learned from human-reviewed tables
+  (RAW/table-N-reviewed.csv, history in method-accuracy.json)
 """
 
 import logging
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 import re
+import camelot
 
-# Import extraction methods
-from .table_extractors import (
-    extract_table_from_text,
-    extract_with_camelot_lattice,
-    extract_with_camelot_stream,
-    extract_with_pdfplumber,
-    evaluate_extraction_quality
-)
+from .cache import hash_file
+from .coordinates import from_camelot_area, transform_bbox
+from .document_session import DocumentSession, open_session
+from .extraction_validator import METHOD_ACCURACY_FILENAME, ExtractionValidator, MethodAccuracy
+from .semantic_analysis import DocumentStructure
+from .table_extractors import evaluate_extraction_quality_batch
 
 logger = logging.getLogger(__name__)
 
@@ -218,13 +223,183 @@ def read_discovered_tables(paper_dir: Path) -> List[Dict]:
     return tables
 
 
+# Extraction method registry: result name → (extractor, params).
+# Entries with the same extractor and params are aliases and run once.
+EXTRACTION_METHODS = {
+    'method_1_text': ('plain_text', {}),
+    'method_2_pdfplumber': ('pdfplumber', {}),
+    'method_3_camelot_lattice': ('camelot', {'flavor': 'lattice'}),
+    'method_4_camelot_stream': ('camelot', {'flavor': 'stream', 'edge_tol': 50}),
+    'method_5_page_specific': ('pdfplumber', {}),  # Whole-page pdfplumber (alias of method 2)
+}
+
+
+class ExtractionMemo:
+    """
+    Extraction results keyed by (pdf hash, page, bbox, method, params)
+
+    One memo is shared by all tables of a run: aliased methods and tables
+    on the same page reuse one computation.
+    """
+
+    def __init__(self):
+        self._results = {}
+        self._hashes = {}
+        self.hits = 0
+        self.misses = 0
+
+    def pdf_hash(self, pdf_path: Path) -> str:
+        """Content hash of a PDF (hashed once per run)"""
+        path = str(pdf_path)
+        if path not in self._hashes:
+            self._hashes[path] = hash_file(path)
+        return self._hashes[path]
+
+    def key(
+        self,
+        pdf_path: Path,
+        page: Optional[int],
+        bbox: Optional[Tuple[float, float, float, float]],
+        method: str,
+        params: Dict
+    ) -> Tuple:
+        """Memo key (bbox rounded to 0.1 pt, params JSON-encoded)"""
+        bbox_key = tuple(round(float(v), 1) for v in bbox) if bbox is not None else None
+        return (self.pdf_hash(pdf_path), page, bbox_key, method, json.dumps(params, sort_keys=True, default=str))
+
+    def get_or_compute(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        """Memoized result for key, computed on first request"""
+        if key in self._results:
+            self.hits += 1
+            return self._results[key]
+        self.misses += 1
+        result = self._results[key] = compute()
+        return result
+
+
+def distinct_methods() -> List[str]:
+    """Method names of EXTRACTION_METHODS without aliases (first name of each kept)"""
+    seen = {}
+    for method_name, (extractor, params) in EXTRACTION_METHODS.items():
+        seen.setdefault((extractor, json.dumps(params, sort_keys=True)), method_name)
+    return list(seen.values())
+
+
+def _page_tables_pdfplumber(session: DocumentSession, page: int, params: Dict) -> List[Dict]:
+    """All pdfplumber tables on a page, with page-frame table and row bboxes"""
+    plumber_page = session.plumber_page(page)
+    if plumber_page is None:
+        return []
+
+    # pdfplumber works in the displayed frame
+    derotate = session.page(page).derotation_matrix
+    tables = []
+    for table in plumber_page.find_tables(**params):
+        rows = table.extract()
+        if not rows:
+            continue
+        tables.append({
+            'bbox': transform_bbox(table.bbox, derotate),
+            'rows': np.array([transform_bbox(row.bbox, derotate) for row in table.rows[1:]]).reshape(-1, 4),
+            'data': pd.DataFrame(rows[1:], columns=rows[0])  # First row as header
+        })
+    return tables
+
+
+def _page_tables_camelot(session: DocumentSession, page: int, params: Dict) -> List[Dict]:
+    """All Camelot tables on a page, with page-frame table and row bboxes"""
+    fitz_page = session.page(page)
+    matrix = session.reading_matrix(page)
+
+    tables = []
+    for table in camelot.read_pdf(session.pdf_path, pages=str(page + 1), **params):
+        x1, _, x2, _ = table._bbox
+        row_boxes = [
+            from_camelot_area((x1, min(c.y1 for c in row), x2, max(c.y2 for c in row)), fitz_page, matrix)
+            for row in table.cells
+        ]
+        tables.append({
+            'bbox': from_camelot_area(table._bbox, fitz_page, matrix),
+            'rows': np.array(row_boxes).reshape(-1, 4),
+            'data': table.df
+        })
+    return tables
+
+
+PAGE_EXTRACTORS = {
+    'pdfplumber': _page_tables_pdfplumber,
+    'camelot': _page_tables_camelot,
+}
+
+
+def _crop_to_region(
+    page_tables: List[Dict],
+    region: Optional[Tuple[float, float, float, float]]
+) -> Optional[pd.DataFrame]:
+    """
+    One table's part of a whole-page result
+
+    The page table overlapping the region most is kept, with only the rows
+    whose centre lies inside the region. Without a region, the largest
+    page table is returned.
+
+    Args:
+        page_tables: Page-level tables ({'bbox', 'rows', 'data'}, page frame)
+        region: Table region (x0, y0, x1, y1) in the page frame, or None
+
+    Returns:
+        DataFrame or None if no page table covers the region
+    """
+    if not page_tables:
+        return None
+    if region is None:
+        return max(page_tables, key=lambda t: t['data'].size)['data']
+
+    def overlap(bbox):
+        width = min(bbox[2], region[2]) - max(bbox[0], region[0])
+        height = min(bbox[3], region[3]) - max(bbox[1], region[1])
+        return max(width, 0.0) * max(height, 0.0)
+
+    best = max(page_tables, key=lambda t: overlap(t['bbox']))
+    if overlap(best['bbox']) <= 0:
+        return None
+
+    rows = best['rows']
+    if len(rows) != len(best['data']):
+        return best['data']
+    cx, cy = (rows[:, 0] + rows[:, 2]) / 2, (rows[:, 1] + rows[:, 3]) / 2
+    inside = (cx >= region[0]) & (cx <= region[2]) & (cy >= region[1]) & (cy <= region[3])
+    if not inside.any():
+        return None
+    return best['data'].iloc[np.flatnonzero(inside)].reset_index(drop=True)
+
+
+def _locate_table(
+    table_info: Dict,
+    structure: Optional[DocumentStructure]
+) -> Tuple[int, Optional[Tuple[float, float, float, float]]]:
+    """
+    Page (0-indexed) and region of a discovered table
+
+    The caption located by DocumentStructure is preferred over the
+    discovered page estimate; the region is None if the caption was not found.
+    """
+    info = structure.resolve_reference(table_info['name']) if structure is not None else None
+    if info is not None:
+        return info['page'], tuple(info['bbox'])
+    return table_info['page_estimate'] - 1, None
+
+
 def extract_table_all_methods(
     table_info: Dict,
     pdf_path: Path,
-    text_file: Optional[Path] = None
+    text_file: Optional[Path] = None,
+    session: Optional[DocumentSession] = None,
+    structure: Optional[DocumentStructure] = None,
+    memo: Optional[ExtractionMemo] = None
 ) -> Dict[str, Optional[pd.DataFrame]]:
     """
-    Extract table using all 5 methods
+    Extract table using all registered methods (EXTRACTION_METHODS)
 
     Methods:
     1. text - Parse from plain-text.txt
@@ -233,10 +408,17 @@ def extract_table_all_methods(
     4. camelot_stream - Borderless table extraction
     5. page_specific - Direct page text extraction (fallback)
 
+    Page-level methods run once per page (memoized by pdf hash, page,
+    method and params) and each table takes its part of the result, so
+    aliased methods and tables sharing a page are not re-extracted.
+
     Args:
         table_info: Table metadata from discovery
         pdf_path: Path to PDF file
         text_file: Path to plain-text.txt (optional)
+        session: Shared document session (opened here if not provided)
+        structure: Analyzed document structure (caption-based table regions)
+        memo: Result memo shared across tables (fresh if not provided)
 
     Returns:
         Dict mapping method_name -> DataFrame (or None if failed)
@@ -244,87 +426,41 @@ def extract_table_all_methods(
     results = {}
     table_name = table_info['name']
     table_type = table_info['type']
-    page = table_info['page_estimate']
+    memo = memo if memo is not None else ExtractionMemo()
 
-    logger.info(f"Extracting {table_name} ({table_type}) using 5 methods...")
+    logger.info(f"Extracting {table_name} ({table_type}) using {len(EXTRACTION_METHODS)} methods...")
 
-    # METHOD 1: Text-based extraction
-    if text_file and text_file.exists():
-        try:
-            logger.debug(f"  Method 1: text-based extraction...")
-            # Note: extract_table_from_text needs table caption and page range
-            df = extract_table_from_text(
-                str(pdf_path),
-                str(text_file),
-                table_name,  # caption
-                page - 1, page + 1  # page_range
-            )
-            results['method_1_text'] = df
+    with open_session(str(pdf_path), session) as doc_session:
+        page, region = _locate_table(table_info, structure)
+
+        for method_name, (extractor, params) in EXTRACTION_METHODS.items():
+            logger.debug(f"  {method_name}: {extractor} {params or ''}")
+
+            if extractor == 'plain_text':
+                if not (text_file and text_file.exists()):
+                    logger.debug(f"    → Skipped (no text file)")
+                    results[method_name] = None
+                    continue
+                key = memo.key(pdf_path, page, None, extractor, {'table': table_name, 'text_file': str(text_file)})
+                df = memo.get_or_compute(
+                    key, lambda: extract_table_from_plain_text(text_file, table_name, table_info['page_estimate'])
+                )
+            else:
+                def run_page(extractor=extractor, params=params):
+                    try:
+                        return PAGE_EXTRACTORS[extractor](doc_session, page, params)
+                    except Exception as e:
+                        logger.warning(f"  {extractor} failed on page {page + 1}: {e}")
+                        return []
+
+                page_tables = memo.get_or_compute(memo.key(pdf_path, page, None, extractor, params), run_page)
+                df = _crop_to_region(page_tables, region)
+
+            results[method_name] = df
             if df is not None:
                 logger.debug(f"    → Success ({len(df)} rows × {len(df.columns)} cols)")
             else:
                 logger.debug(f"    → No data extracted")
-        except Exception as e:
-            logger.warning(f"  Method 1 (text) failed: {e}")
-            results['method_1_text'] = None
-    else:
-        logger.debug(f"  Method 1: skipped (no text file)")
-        results['method_1_text'] = None
-
-    # METHOD 2: pdfplumber
-    try:
-        logger.debug(f"  Method 2: pdfplumber...")
-        # Note: extract_with_pdfplumber needs bbox
-        # For now, extract whole page (we'll refine bbox detection later)
-        df = extract_with_pdfplumber(str(pdf_path), page - 1, None)  # None = whole page
-        results['method_2_pdfplumber'] = df
-        if df is not None:
-            logger.debug(f"    → Success ({len(df)} rows × {len(df.columns)} cols)")
-        else:
-            logger.debug(f"    → No data extracted")
-    except Exception as e:
-        logger.warning(f"  Method 2 (pdfplumber) failed: {e}")
-        results['method_2_pdfplumber'] = None
-
-    # METHOD 3: camelot lattice
-    try:
-        logger.debug(f"  Method 3: camelot lattice...")
-        df = extract_with_camelot_lattice(str(pdf_path), page - 1, None)
-        results['method_3_camelot_lattice'] = df
-        if df is not None:
-            logger.debug(f"    → Success ({len(df)} rows × {len(df.columns)} cols)")
-        else:
-            logger.debug(f"    → No data extracted")
-    except Exception as e:
-        logger.warning(f"  Method 3 (camelot lattice) failed: {e}")
-        results['method_3_camelot_lattice'] = None
-
-    # METHOD 4: camelot stream
-    try:
-        logger.debug(f"  Method 4: camelot stream...")
-        df = extract_with_camelot_stream(str(pdf_path), page - 1, None)
-        results['method_4_camelot_stream'] = df
-        if df is not None:
-            logger.debug(f"    → Success ({len(df)} rows × {len(df.columns)} cols)")
-        else:
-            logger.debug(f"    → No data extracted")
-    except Exception as e:
-        logger.warning(f"  Method 4 (camelot stream) failed: {e}")
-        results['method_4_camelot_stream'] = None
-
-    # METHOD 5: page-specific (fallback - same as method 2 for now)
-    try:
-        logger.debug(f"  Method 5: page-specific fallback...")
-        # This is a placeholder - in production would use different strategy
-        df = extract_with_pdfplumber(str(pdf_path), page - 1, None)
-        results['method_5_page_specific'] = df
-        if df is not None:
-            logger.debug(f"    → Success ({len(df)} rows × {len(df.columns)} cols)")
-        else:
-            logger.debug(f"    → No data extracted")
-    except Exception as e:
-        logger.warning(f"  Method 5 (page-specific) failed: {e}")
-        results['method_5_page_specific'] = None
 
     return results
 
@@ -343,16 +479,9 @@ def score_extraction_results(
     Returns:
         Dict mapping method_name -> quality_score (0.0-1.2)
     """
-    scores = {}
-
-    for method_name, df in results.items():
-        if df is None or len(df) == 0:
-            scores[method_name] = 0.0
-        else:
-            score = evaluate_extraction_quality(df, table_type)
-            scores[method_name] = score
-
-    return scores
+    # Empty results score 0.0; all candidates share one vectorized pass
+    batch_scores = evaluate_extraction_quality_batch(list(results.values()), table_type)
+    return dict(zip(results, batch_scores))
 
 
 def select_best_method(
@@ -443,6 +572,7 @@ def generate_comparison_report(
             - results: Extraction results
             - scores: Quality scores
             - best_method: Best method name
+            - consensus_audit: Validator audit entry of the consensus (optional)
         output_dir: Path to RAW/ folder
     """
     report_path = output_dir / 'comparison-report.md'
@@ -500,6 +630,14 @@ def generate_comparison_report(
             f.write(f"**Page:** {table_info['page_estimate']}\n\n")
             f.write(f"**Best Method:** `{best_method}` (score: {best_score:.2f})\n\n")
 
+            consensus_audit = result.get('consensus_audit')
+            if consensus_audit:
+                f.write(
+                    f"**Consensus:** {consensus_audit['resolution']} across "
+                    f"{consensus_audit['methods_compared']} methods "
+                    f"(confidence: {consensus_audit['confidence']:.2f})\n\n"
+                )
+
             f.write("**All Method Scores:**\n\n")
             f.write("| Method | Score | Status |\n")
             f.write("|--------|-------|--------|\n")
@@ -514,10 +652,68 @@ def generate_comparison_report(
     logger.info(f"✓ Comparison report saved: {report_path}")
 
 
+def merge_consensus(
+    table_info: Dict,
+    results: Dict[str, Optional[pd.DataFrame]],
+    scores: Dict[str, float],
+    output_dir: Path,
+    accuracy: MethodAccuracy,
+    pdf_hash: str
+) -> Tuple[Optional[pd.DataFrame], Optional[Dict]]:
+    """
+    Learn from a reviewed table (if any), then merge the methods by cell vote
+
+    A human-reviewed copy of the table (RAW/table-N-reviewed.csv) scores
+    every distinct method against it; those outcomes are the only input to
+    the method accuracies. The consensus table is saved as
+    RAW/table-N-consensus.csv.
+
+    Args:
+        table_info: Table metadata
+        results: All extraction results
+        scores: All scores (extraction quality for the vote)
+        output_dir: Path to RAW/ folder
+        accuracy: Method accuracies (updated from the reviewed table)
+        pdf_hash: Content hash of the PDF (identifies reviewed outcomes)
+
+    Returns:
+        (consensus DataFrame, validator audit entry), or (None, None) if no method succeeded
+    """
+    table_name = table_info['name']
+    safe_name = re.sub(r'[^a-zA-Z0-9]', '-', table_name).lower()
+    extractions = {
+        method_name: {'data': results[method_name], 'quality': scores.get(method_name, 0.0)}
+        for method_name in distinct_methods()
+        if results.get(method_name) is not None and len(results[method_name]) > 0
+    }
+    if not extractions:
+        return None, None
+
+    reviewed_path = output_dir / f"table-{safe_name}-reviewed.csv"
+    if reviewed_path.exists():
+        reviewed = pd.read_csv(reviewed_path)
+        for method_name, extraction in extractions.items():
+            share = accuracy.record_reference(
+                method_name, table_info['type'], f"{pdf_hash}:{table_name}:{method_name}",
+                extraction['data'], reviewed
+            )
+            if share is not None:
+                logger.info(f"  📋 {method_name}: {share:.0%} of reviewed cells matched")
+
+    consensus_df, audit_entry = ExtractionValidator(accuracy).validate_and_merge(
+        table_name, extractions, table_info['type']
+    )
+    consensus_df.to_csv(output_dir / f"table-{safe_name}-consensus.csv", index=False)
+    logger.info(f"  🗳 Consensus: {audit_entry['resolution']} (confidence: {audit_entry['confidence']:.2f})")
+
+    return consensus_df, audit_entry
+
+
 def extract_all_tables_multi_method(
     paper_dir: Path,
     pdf_path: Path,
-    output_dir: Path
+    output_dir: Path,
+    accuracy_path: Optional[Path] = None
 ) -> List[Dict]:
     """
     Main orchestration function: Extract all discovered tables using multiple methods
@@ -526,6 +722,8 @@ def extract_all_tables_multi_method(
         paper_dir: Path to paper folder (contains text/ folder)
         pdf_path: Path to PDF file
         output_dir: Path to RAW/ folder (will be created)
+        accuracy_path: Method accuracy history (default: method-accuracy.json
+                       next to the paper folder, shared by all papers)
 
     Returns:
         List of all table extraction results
@@ -544,31 +742,52 @@ def extract_all_tables_multi_method(
 
     all_results = []
 
-    for table_info in discovered_tables:
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Processing: {table_info['name']} ({table_info['type']})")
-        logger.info(f"{'='*60}\n")
-
-        # Extract with all methods
-        results = extract_table_all_methods(table_info, pdf_path, text_file)
+    # One open PDF, caption map and result memo for all tables; the
+    # session is closed and learned accuracy saved even if a table fails
+    memo = ExtractionMemo()
+    accuracy = MethodAccuracy(accuracy_path or paper_dir.parent / METHOD_ACCURACY_FILENAME)
 
-        # Score all results
-        scores = score_extraction_results(results, table_info['type'])
-
-        # Select best method
-        best_method, best_df, best_score = select_best_method(results, scores)
-
-        # Save results
-        save_extraction_results(table_info, results, scores, best_method, output_dir)
+    with open_session(str(pdf_path)) as session:
+        try:
+            structure = DocumentStructure(str(pdf_path), session=session)
+            structure.build_reference_map()
+
+            for table_info in discovered_tables:
+                logger.info(f"\n{'='*60}")
+                logger.info(f"Processing: {table_info['name']} ({table_info['type']})")
+                logger.info(f"{'='*60}\n")
+
+                # Extract with all methods
+                results = extract_table_all_methods(table_info, pdf_path, text_file, session, structure, memo)
+
+                # Score all results
+                scores = score_extraction_results(results, table_info['type'])
+
+                # Select best method
+                best_method, best_df, best_score = select_best_method(results, scores)
+
+                # Save results
+                save_extraction_results(table_info, results, scores, best_method, output_dir)
+
+                # Cell vote across methods (learning from a reviewed table first)
+                consensus_df, consensus_audit = merge_consensus(
+                    table_info, results, scores, output_dir, accuracy, memo.pdf_hash(pdf_path)
+                )
+
+                # Store for report
+                all_results.append({
+                    'table_info': table_info,
+                    'results': results,
+                    'scores': scores,
+                    'best_method': best_method,
+                    'best_score': best_score,
+                    'consensus': consensus_df,
+                    'consensus_audit': consensus_audit
+                })
+        finally:
+            accuracy.save()
 
-        # Store for report
-        all_results.append({
-            'table_info': table_info,
-            'results': results,
-            'scores': scores,
-            'best_method': best_method,
-            'best_score': best_score
-        })
+    logger.info(f"  Page extractions: {memo.misses} run, {memo.hits} reused")
 
     # Step 3: Generate comparison report
     generate_comparison_report(all_results, output_dir)
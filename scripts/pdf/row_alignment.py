@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Row Alignment
+
+Purpose: Pair up the rows of tables extracted by different methods when
+         their row counts differ (dropped, split or extra rows)
+Created: 2026-10-17
+
+Features:
+- Row fingerprints: sample ID + normalized cell tokens (numbers rounded)
+- Patience-style alignment: common prefix/suffix, then rows whose
+  fingerprint is unique in both tables as anchors (longest increasing
+  run), repeated between anchors (explicit stack, no recursion)
+- Rows left between anchors paired by token overlap (same sample ID
+  required), positionally for large gaps
+- Gap pairing vectorized: similarity matrix as one matrix product, DP
+  filled one anti-diagonal at a time
+- Identical fingerprints short-circuit to the identity map
+- Near-linear on tables that mostly agree; a gap costs O(n·m) numpy work
+  but only O(n + m) Python steps
+
+Example:
+    row_map = align_rows(reference_df, other_df)
+    # row_map[i] = row of other_df matching reference row i, or -1
+
+    # Several tables against one reference: fingerprint it once
+    ref = row_fingerprints(reference_df)
+    row_maps = [align_rows(reference_df, df, ref) for df in other_dfs]
+"""
+
+import logging
+import re
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Hashable, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Sample-ID-like tokens: letters and digits, no spaces (e.g. MU-0012, 17KD03)
+SAMPLE_ID_RE = re.compile(r'^(?=.*[a-z])(?=.*\d)[a-z0-9][a-z0-9_\-./]*$')
+
+# Significant digits kept when fingerprinting numbers
+NUMERIC_DIGITS = 3
+
+# Rows between anchors pair up if this share of their tokens agrees
+MIN_ROW_SIMILARITY = 0.5
+
+# Gaps larger than this (rows × rows) are paired positionally
+MAX_GAP_CELLS = 40000
+
+# Row fingerprint: (sample ID or None, cell tokens)
+Fingerprint = Tuple[Optional[str], Tuple[Hashable, ...]]
+
+
+def _cell_token(value: Any) -> Optional[Hashable]:
+    """Normalized cell token: rounded number, compact lowercase text, or None if empty"""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        text = re.sub(r'\s+', '', str(value)).lower()
+        return text or None
+    if np.isnan(number):
+        return None
+    return float(f"{number:.{NUMERIC_DIGITS}g}")
+
+
+def row_fingerprints(df: pd.DataFrame) -> List[Fingerprint]:
+    """
+    Fingerprint every row of a table
+
+    Empty cells are skipped, so padding columns and column shifts do not
+    change a row's fingerprint.
+
+    Args:
+        df: Extracted table
+
+    Returns:
+        Per row: (first sample-ID-like token or None, tuple of cell tokens)
+    """
+    fingerprints = []
+    for row in df.to_numpy(dtype=object):
+        tokens = tuple(token for token in map(_cell_token, row) if token is not None)
+        sample_id = next(
+            (token for token in tokens if isinstance(token, str) and SAMPLE_ID_RE.match(token)),
+            None
+        )
+        fingerprints.append((sample_id, tokens))
+    return fingerprints
+
+
+def _longest_increasing(pairs: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Longest run of (i, j) pairs (sorted by i) with increasing j (patience sorting)"""
+    tails, tail_ids, previous = [], [], [-1] * len(pairs)
+    for k, (_, j) in enumerate(pairs):
+        pos = bisect_left(tails, j)
+        if pos == len(tails):
+            tails.append(j)
+            tail_ids.append(k)
+        else:
+            tails[pos] = j
+            tail_ids[pos] = k
+        previous[k] = tail_ids[pos - 1] if pos > 0 else -1
+
+    run = []
+    k = tail_ids[-1] if tail_ids else -1
+    while k >= 0:
+        run.append(pairs[k])
+        k = previous[k]
+    return run[::-1]
+
+
+def _unique_anchors(
+    a: Sequence[Fingerprint], b: Sequence[Fingerprint],
+    a0: int, a1: int, b0: int, b1: int
+) -> List[Tuple[int, int]]:
+    """Rows whose fingerprint occurs exactly once in both ranges, as an increasing run"""
+    a_counts = Counter(a[a0:a1])
+    b_positions = {}
+    for j in range(b0, b1):
+        b_positions.setdefault(b[j], []).append(j)
+
+    pairs = [
+        (i, b_positions[a[i]][0])
+        for i in range(a0, a1)
+        if a_counts[a[i]] == 1 and len(b_positions.get(a[i], ())) == 1
+    ]
+    return _longest_increasing(pairs)
+
+
+def _occurrence_vectors(
+    a: Sequence[Fingerprint], b: Sequence[Fingerprint]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    0/1 token-occurrence matrices of two row lists over a shared vocabulary
+
+    Tokens are numbered per occurrence within their row ('x' twice becomes
+    (x, 0) and (x, 1)), so the dot product of two rows is the size of their
+    token multiset intersection.
+    """
+    vocabulary = {}
+    rows_ids = []
+    for _, tokens in list(a) + list(b):
+        seen = Counter()
+        ids = []
+        for token in tokens:
+            ids.append(vocabulary.setdefault((token, seen[token]), len(vocabulary)))
+            seen[token] += 1
+        rows_ids.append(ids)
+
+    vectors = np.zeros((len(rows_ids), len(vocabulary)), dtype=np.float32)
+    for row, ids in enumerate(rows_ids):
+        vectors[row, ids] = 1.0
+    return vectors[:len(a)], vectors[len(a):]
+
+
+def _similarity_matrix(a: Sequence[Fingerprint], b: Sequence[Fingerprint]) -> np.ndarray:
+    """
+    Token overlap of every (a row, b row) pair, as one matrix product
+
+    Similarity is the number of shared tokens (as multisets) over the
+    longer row's token count, and 0 where both rows have sample IDs that
+    differ.
+    """
+    a_vectors, b_vectors = _occurrence_vectors(a, b)
+    shared = a_vectors @ b_vectors.T
+    longest = np.maximum.outer([len(tokens) for _, tokens in a], [len(tokens) for _, tokens in b])
+    similarity = np.divide(shared, longest, out=np.zeros(shared.shape), where=longest > 0)
+
+    # Rows naming different samples never match
+    codes = {}
+    a_ids = np.array([codes.setdefault(sid, len(codes)) if sid is not None else -1 for sid, _ in a])
+    b_ids = np.array([codes.setdefault(sid, len(codes)) if sid is not None else -1 for sid, _ in b])
+    conflict = (a_ids[:, None] >= 0) & (b_ids[None, :] >= 0) & (a_ids[:, None] != b_ids[None, :])
+    similarity[conflict] = 0.0
+    return similarity
+
+
+def _fill_gap(
+    a: Sequence[Fingerprint], b: Sequence[Fingerprint],
+    a0: int, a1: int, b0: int, b1: int,
+    row_map: np.ndarray
+) -> None:
+    """Pair rows between anchors by token overlap (order preserved)"""
+    n, m = a1 - a0, b1 - b0
+    if n == 0 or m == 0:
+        return
+
+    if n * m > MAX_GAP_CELLS:
+        for k in range(min(n, m)):
+            row_map[a0 + k] = b0 + k
+        return
+
+    # Order-preserving pairing maximizing total similarity (LCS over scores)
+    similarity = _similarity_matrix(a[a0:a1], b[b0:b1])
+    gain = np.where(similarity >= MIN_ROW_SIMILARITY, similarity, -np.inf)
+
+    # score[i, j] depends on its left, upper and upper-left neighbours only,
+    # so each anti-diagonal i + j = d is filled in one step from the two before it
+    score = np.zeros((n + 1, m + 1))
+    for d in range(2, n + m + 1):
+        i = np.arange(max(1, d - m), min(n, d - 1) + 1)
+        j = d - i
+        score[i, j] = np.maximum(
+            np.maximum(score[i - 1, j], score[i, j - 1]),
+            score[i - 1, j - 1] + gain[i - 1, j - 1]
+        )
+
+    i, j = n, m
+    while i > 0 and j > 0:
+        if score[i, j] == score[i - 1, j]:
+            i -= 1
+        elif score[i, j] == score[i, j - 1]:
+            j -= 1
+        else:
+            row_map[a0 + i - 1] = b0 + j - 1
+            i, j = i - 1, j - 1
+
+
+def _align_range(
+    a: Sequence[Fingerprint], b: Sequence[Fingerprint],
+    a0: int, a1: int, b0: int, b1: int,
+    row_map: np.ndarray
+) -> None:
+    """Align a[a0:a1] with b[b0:b1] into row_map (ranges between anchors kept on a stack)"""
+    stack = [(a0, a1, b0, b1)]
+    while stack:
+        a0, a1, b0, b1 = stack.pop()
+
+        # Common prefix and suffix
+        while a0 < a1 and b0 < b1 and a[a0] == b[b0]:
+            row_map[a0] = b0
+            a0, b0 = a0 + 1, b0 + 1
+        while a0 < a1 and b0 < b1 and a[a1 - 1] == b[b1 - 1]:
+            a1, b1 = a1 - 1, b1 - 1
+            row_map[a1] = b1
+
+        anchors = _unique_anchors(a, b, a0, a1, b0, b1) if a0 < a1 and b0 < b1 else []
+        if not anchors:
+            _fill_gap(a, b, a0, a1, b0, b1, row_map)
+            continue
+
+        # Ranges between consecutive anchors are aligned the same way
+        for i, j in anchors:
+            stack.append((a0, i, b0, j))
+            row_map[i] = j
+            a0, b0 = i + 1, j + 1
+        stack.append((a0, a1, b0, b1))
+
+
+def align_rows(
+    reference: pd.DataFrame,
+    other: pd.DataFrame,
+    reference_fingerprints: Optional[List[Fingerprint]] = None,
+    other_fingerprints: Optional[List[Fingerprint]] = None
+) -> np.ndarray:
+    """
+    Match the rows of one extraction to those of a reference extraction
+
+    Args:
+        reference: Reference table
+        other: Table from another method
+        reference_fingerprints: row_fingerprints(reference), if already
+            computed (callers aligning several tables to one reference)
+        other_fingerprints: row_fingerprints(other), if already computed
+
+    Returns:
+        int array (one entry per reference row): matching row of other, or -1
+    """
+    a = reference_fingerprints if reference_fingerprints is not None else row_fingerprints(reference)
+    b = other_fingerprints if other_fingerprints is not None else row_fingerprints(other)
+    if a == b:
+        return np.arange(len(a))
+
+    row_map = np.full(len(a), -1, dtype=np.int64)
+    _align_range(a, b, 0, len(a), 0, len(b), row_map)
+
+    logger.debug(f"Aligned {int((row_map >= 0).sum())}/{len(a)} reference rows with {len(b)} rows")
+    return row_map
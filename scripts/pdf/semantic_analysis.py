@@ -10,7 +10,7 @@ Features:
 - Build table reference map ("Table 2A" → actual location + type)
 - Classify table types (AFT ages, U-Th-He, counts, track lengths)
 - Caption extraction and parsing
-- Bounding box detection
+- Bounding box detection (layout-based, fixed-box fallback, rotation-aware)
 """
 
 import logging
@@ -19,23 +19,51 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import fitz  # pymupdf
 
+from .document_session import DocumentSession
+
 logger = logging.getLogger(__name__)
 
 
 class DocumentStructure:
     """Understand document layout and semantics"""
 
-    def __init__(self, pdf_path: str):
+    def __init__(self, pdf_path: str, session: Optional[DocumentSession] = None):
         """
         Initialize document structure analyzer
 
         Args:
             pdf_path: Path to PDF file
+            session: Shared document session (a private one is opened if not provided)
         """
         self.pdf_path = Path(pdf_path)
-        self.pdf = fitz.open(str(self.pdf_path))
+        self._owns_session = session is None
+        self.session = session if session is not None else DocumentSession(str(self.pdf_path))
+        self.pdf = self.session.doc
         self.tables = {}  # table_id → {type, page, bbox, caption}
         self.full_text = ""
+        self.text_index = None
+
+    @classmethod
+    def from_tables(cls, pdf_path: str, tables: Dict) -> 'DocumentStructure':
+        """
+        Rebuild an analyzed structure (e.g. from cache) without opening the PDF
+
+        Args:
+            pdf_path: Path to PDF file
+            tables: Reference map from build_reference_map()
+
+        Returns:
+            DocumentStructure with tables populated and PDF closed
+        """
+        structure = cls.__new__(cls)
+        structure.pdf_path = Path(pdf_path)
+        structure._owns_session = False
+        structure.session = None
+        structure.pdf = None
+        structure.tables = tables
+        structure.full_text = ""
+        structure.text_index = None
+        return structure
 
     def build_reference_map(self) -> Dict:
         """
@@ -52,10 +80,9 @@ class DocumentStructure:
         """
         logger.info("Building table reference map...")
 
-        # Extract all text first
-        self.full_text = ""
-        for page in self.pdf:
-            self.full_text += page.get_text()
+        # Text of every page (extracted once, shared with metadata/methods parsing)
+        self.text_index = self.session.text_index()
+        self.full_text = self.text_index.full_text
 
         # Find all table captions
         captions = self._extract_table_captions()
@@ -83,9 +110,8 @@ class DocumentStructure:
 
             logger.debug(f"  {table_id}: {table_type} (page {page_num})")
 
-        # Close PDF after analysis (enables caching)
-        self.pdf.close()
-        self.pdf = None
+        # Release PDF after analysis (enables caching)
+        self.close()
 
         return self.tables
 
@@ -104,34 +130,33 @@ class DocumentStructure:
         # Requires caption to start with uppercase letter (avoid "(continued)" matches)
         pattern = r'(?:^|\n)\s*Table\s+([A-Z]?\d+[A-Z]?)\s*[.:]?\s*([A-Z][^\n]{10,300})'
 
-        for page_num in range(len(self.pdf)):
-            page = self.pdf[page_num]
-            text = page.get_text()
-
-            # Find caption matches
-            for match in re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE):
-                table_id = match.group(1).strip()
-                caption_text = match.group(2).strip()
-
-                # Skip false positives (continuation markers, etc.)
-                if caption_text.lower().startswith('(continued)'):
-                    continue
-                if caption_text.startswith('(') and len(caption_text) < 30:
-                    continue
-
-                # Normalize table ID (e.g., "2a" → "2A")
-                if table_id[-1].isalpha():
-                    table_id = table_id[:-1] + table_id[-1].upper()
-
-                # Find caption bounding box (for bbox detection)
-                caption_bbox = self._find_text_bbox(page, match.group(0)[:50])
-
-                captions.append({
-                    'id': f"Table {table_id}",
-                    'page': page_num,
-                    'caption': caption_text,
-                    'caption_bbox': caption_bbox
-                })
+        # Pages are only loaded for captions found in the text index
+        for page_num, match in self.text_index.finditer_pages(pattern, re.IGNORECASE | re.MULTILINE):
+            table_id = match.group(1).strip()
+            caption_text = match.group(2).strip()
+
+            # Skip false positives (continuation markers, etc.)
+            if caption_text.lower().startswith('(continued)'):
+                continue
+            if caption_text.startswith('(') and len(caption_text) < 30:
+                continue
+
+            # Normalize table ID (e.g., "2a" → "2A")
+            if table_id[-1].isalpha():
+                table_id = table_id[:-1] + table_id[-1].upper()
+
+            # Find caption bounding box (for bbox detection); the indexed
+            # text block holding the caption is the fallback
+            caption_bbox = self._find_text_bbox(self.session.page(page_num), match.group(0)[:50])
+            if caption_bbox is None:
+                caption_bbox = self.text_index.block_at(page_num, match.start(1))
+
+            captions.append({
+                'id': f"Table {table_id}",
+                'page': page_num,
+                'caption': caption_text,
+                'caption_bbox': caption_bbox
+            })
 
         return captions
 
@@ -162,7 +187,7 @@ class DocumentStructure:
             return None
 
         # Filter instances to reasonable caption locations
-        # Captions are usually:
+        # Captions are usually (as displayed, so rotated pages count too):
         # - In the left 70% of the page (not far right margin)
         # - Not in the very bottom 20% of the page
         page_width = page.rect.width
@@ -170,16 +195,17 @@ class DocumentStructure:
 
         valid_instances = []
         for rect in text_instances:
-            # Check if in reasonable location
-            if rect.x0 < page_width * 0.7 and rect.y0 < page_height * 0.8:
+            # Check if in reasonable location (search results are in the page frame)
+            shown = rect * page.rotation_matrix
+            if shown.x0 < page_width * 0.7 and shown.y0 < page_height * 0.8:
                 valid_instances.append(rect)
 
         if not valid_instances:
             # Fallback: use first match
             valid_instances = text_instances
 
-        # Return the topmost valid instance (earliest on page)
-        topmost = min(valid_instances, key=lambda r: r.y0)
+        # Return the topmost valid instance (earliest on page, as displayed)
+        topmost = min(valid_instances, key=lambda r: (r * page.rotation_matrix).y0)
         return (topmost.x0, topmost.y0, topmost.x1, topmost.y1)
 
     def _find_table_bbox(self, page_num: int, caption_bbox: Optional[Tuple]) -> Tuple:
@@ -187,36 +213,35 @@ class DocumentStructure:
         Find table bounding box below caption
 
         Strategy:
+        - Detect the table region from text rows below the caption (layout,
+          in the page's reading frame, so rotated tables work too)
+        - Otherwise fall back to a fixed box:
         - Table usually starts below caption
         - Extends to next section or page bottom
         - Full page width or slightly inset
-        - Handles rotated pages (90° rotation)
+        - Rotated pages: most of the page
 
         Args:
             page_num: Page number
-            caption_bbox: Caption bounding box (x0, y0, x1, y1) - may be in rotated coords
+            caption_bbox: Caption bounding box (x0, y0, x1, y1) in the page frame
 
         Returns:
-            Table bounding box (x0, y0, x1, y1)
+            Table bounding box (x0, y0, x1, y1) in the page frame (unrotated)
         """
-        page = self.pdf[page_num]
-        page_rect = page.rect
+        # Table region from the text layout below the caption
+        if caption_bbox:
+            region = self.session.layout(page_num).table_region(caption_bbox)
+            if region:
+                return region
 
-        # Check if page is rotated
-        rotation = page.rotation
+        page_rect = self.session.page_frame_rect(page_num)
 
-        # For rotated pages (90°), caption coords are in original system
-        # which doesn't match page.rect. Use simple fallback for now.
-        if rotation != 0:
+        # Rotated pages: the caption's "below" is not the page frame's
+        if self.session.page_rotation(page_num) != 0:
             # Use generous bbox that covers most of page
-            # Tables on rotated pages typically span full width/height
-            x0 = page_rect.x0 + 50
-            x1 = page_rect.x1 - 50
-            y0 = page_rect.y0 + 100  # Start from top
-            y1 = page_rect.y1 - 50   # Go to bottom
-            return (x0, y0, x1, y1)
-
-        # Default: full page width, below caption
+            return (page_rect.x0 + 50, page_rect.y0 + 50, page_rect.x1 - 50, page_rect.y1 - 50)
+
+        # Fallback: full page width, below caption
         x0 = page_rect.x0 + 50  # Left margin
         x1 = page_rect.x1 - 50  # Right margin
 
@@ -347,7 +372,20 @@ class DocumentStructure:
             if info['type'] == table_type
         ]
 
+    def close(self) -> None:
+        """Release the PDF (a shared session is left open for other extractors)"""
+        if getattr(self, 'session', None) is not None and self._owns_session:
+            self.session.close()
+        self.session = None
+        self.pdf = None
+
+    def __getstate__(self):
+        """Pickle the analysis only (never the open document)"""
+        state = self.__dict__.copy()
+        state.update(session=None, pdf=None, _owns_session=False)
+        return state
+
     def __del__(self):
         """Close PDF on cleanup"""
-        if hasattr(self, 'pdf') and self.pdf is not None:
-            self.pdf.close()
+        if hasattr(self, 'session'):
+            self.close()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Compact Text Span Store
+
+Purpose: Hold positioned text spans as arrays instead of one dict per span
+Created: 2026-10-17
+
+Features:
+- float32 coordinate array (x0, y0, x1, y1) per span
+- Interned string table (repeated cell values stored once)
+- Block/line numbers and writing direction per span (for layout analysis)
+- Coordinate transforms (e.g. rotated pages into their reading frame)
+- Region cuts from a page-level store (no re-parse per table)
+- Built straight from PyMuPDF text dicts (image data never requested)
+
+Example:
+    spans = SpanStore.from_page(page).clipped(bbox)
+    x0, y0 = spans.x0, spans.y0
+    texts = spans.texts()
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+import fitz  # pymupdf
+
+# Text dict flags without TEXT_PRESERVE_IMAGES (we only read text blocks)
+SPAN_TEXT_FLAGS = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+
+
+class SpanStore:
+    """Non-empty text spans of a page region as parallel arrays"""
+
+    __slots__ = ('coords', 'text_ids', 'block_ids', 'line_ids', 'dirs', 'strings')
+
+    def __init__(
+        self,
+        coords: np.ndarray,
+        text_ids: np.ndarray,
+        block_ids: np.ndarray,
+        line_ids: np.ndarray,
+        dirs: np.ndarray,
+        strings: List[str]
+    ):
+        """
+        Args:
+            coords: (n, 4) float32 array of span bboxes (x0, y0, x1, y1)
+            text_ids: (n,) int32 indices into strings
+            block_ids: (n,) int32 block number of each span
+            line_ids: (n,) int32 line number (within its block) of each span
+            dirs: (n, 2) float32 writing direction (cos, sin) of each span's line
+            strings: Interned span texts (whitespace-stripped)
+        """
+        self.coords = coords
+        self.text_ids = text_ids
+        self.block_ids = block_ids
+        self.line_ids = line_ids
+        self.dirs = dirs
+        self.strings = strings
+
+    @classmethod
+    def from_text_dict(cls, text_dict: Dict) -> 'SpanStore':
+        """
+        Build from a PyMuPDF get_text("dict") result
+
+        Args:
+            text_dict: Text dict (image blocks are skipped)
+
+        Returns:
+            SpanStore of spans with non-blank text, in reading order
+        """
+        interned: Dict[str, int] = {}
+        coords = []
+        text_ids = []
+        block_ids = []
+        line_ids = []
+        dirs = []
+
+        for block_no, block in enumerate(text_dict.get('blocks', [])):
+            if block.get('type') != 0:  # Text blocks only
+                continue
+            for line_no, line in enumerate(block.get('lines', [])):
+                for span in line.get('spans', []):
+                    text = span['text'].strip()
+                    if not text:
+                        continue
+                    coords.append(span['bbox'])
+                    text_ids.append(interned.setdefault(text, len(interned)))
+                    block_ids.append(block_no)
+                    line_ids.append(line_no)
+                    dirs.append(line.get('dir', (1.0, 0.0)))
+
+        return cls(
+            np.asarray(coords, dtype=np.float32).reshape(-1, 4),
+            np.asarray(text_ids, dtype=np.int32),
+            np.asarray(block_ids, dtype=np.int32),
+            np.asarray(line_ids, dtype=np.int32),
+            np.asarray(dirs, dtype=np.float32).reshape(-1, 2),
+            list(interned)
+        )
+
+    @classmethod
+    def from_page(cls, page: fitz.Page, clip: Optional[Tuple] = None) -> 'SpanStore':
+        """
+        Build from a page (optionally clipped to a region)
+
+        Args:
+            page: PyMuPDF page
+            clip: Optional (x0, y0, x1, y1) region
+
+        Returns:
+            SpanStore
+        """
+        return cls.from_text_dict(page.get_text("dict", clip=clip, flags=SPAN_TEXT_FLAGS))
+
+    def __len__(self) -> int:
+        return len(self.text_ids)
+
+    @property
+    def x0(self) -> np.ndarray:
+        return self.coords[:, 0]
+
+    @property
+    def y0(self) -> np.ndarray:
+        return self.coords[:, 1]
+
+    @property
+    def x1(self) -> np.ndarray:
+        return self.coords[:, 2]
+
+    @property
+    def y1(self) -> np.ndarray:
+        return self.coords[:, 3]
+
+    def text(self, index: int) -> str:
+        """Text of one span"""
+        return self.strings[self.text_ids[index]]
+
+    def texts(self, indices: Optional[Sequence[int]] = None) -> List[str]:
+        """
+        Texts of several spans
+
+        Args:
+            indices: Span indices (default: all spans, in order)
+
+        Returns:
+            List of span texts
+        """
+        ids = self.text_ids if indices is None else self.text_ids[indices]
+        strings = self.strings
+        return [strings[i] for i in ids.tolist()]
+
+    def subset(self, mask: np.ndarray) -> 'SpanStore':
+        """
+        Spans selected by a boolean mask or index array (string table shared)
+
+        Args:
+            mask: Boolean mask or integer indices
+
+        Returns:
+            SpanStore view of the selected spans
+        """
+        return SpanStore(
+            self.coords[mask], self.text_ids[mask],
+            self.block_ids[mask], self.line_ids[mask], self.dirs[mask], self.strings
+        )
+
+    def within(self, bbox: Tuple[float, float, float, float]) -> 'SpanStore':
+        """
+        Spans whose bbox intersects a region
+
+        Args:
+            bbox: (x0, y0, x1, y1) region
+
+        Returns:
+            SpanStore of intersecting spans
+        """
+        x0, y0, x1, y1 = bbox
+        mask = (self.x1 > x0) & (self.x0 < x1) & (self.y1 > y0) & (self.y0 < y1)
+        return self.subset(mask)
+
+    def clipped(self, bbox: Tuple[float, float, float, float]) -> 'SpanStore':
+        """
+        Spans whose centre lies in a region (cuts a region from a page's spans)
+
+        Args:
+            bbox: (x0, y0, x1, y1) region
+
+        Returns:
+            SpanStore of the region's spans (whole spans, never split)
+        """
+        x0, y0, x1, y1 = bbox
+        cx = (self.x0 + self.x1) / 2
+        cy = (self.y0 + self.y1) / 2
+        return self.subset((cx >= x0) & (cx <= x1) & (cy >= y0) & (cy <= y1))
+
+    def transform(self, matrix: fitz.Matrix) -> 'SpanStore':
+        """
+        Spans mapped through a PyMuPDF matrix (e.g. a page rotation)
+
+        Bboxes become the bounding box of their transformed corners and
+        writing directions are rotated with the matrix.
+
+        Args:
+            matrix: Transformation matrix
+
+        Returns:
+            SpanStore in the new coordinate frame (string table shared)
+        """
+        a, b, c, d, e, f = (float(v) for v in matrix)
+        x0, y0, x1, y1 = self.x0, self.y0, self.x1, self.y1
+
+        xs = np.stack([a * x + c * y + e for x, y in ((x0, y0), (x1, y0), (x0, y1), (x1, y1))])
+        ys = np.stack([b * x + d * y + f for x, y in ((x0, y0), (x1, y0), (x0, y1), (x1, y1))])
+        coords = np.stack([xs.min(axis=0), ys.min(axis=0), xs.max(axis=0), ys.max(axis=0)], axis=1)
+
+        dx, dy = self.dirs[:, 0], self.dirs[:, 1]
+        dirs = np.stack([a * dx + c * dy, b * dx + d * dy], axis=1)
+
+        return SpanStore(
+            coords.astype(np.float32).reshape(-1, 4), self.text_ids, self.block_ids,
+            self.line_ids, dirs.astype(np.float32).reshape(-1, 2), self.strings
+        )
@@ -10,97 +10,108 @@ Features:
 - Camelot lattice extraction (bordered tables)
 - Camelot stream extraction (borderless tables)
 - pdfplumber extraction (fallback)
+- Rotation-aware coordinates (reading-frame spans and Camelot areas)
+- Page parses shared by every table region on a page (via DocumentSession)
 - Extraction quality evaluation
 - Voting mechanism for best result
 """
 
 import logging
 from typing import Dict, List, Optional, Tuple
+import numpy as np
 import pandas as pd
-import fitz  # pymupdf for page dimensions
 
-# Core extraction libraries
-try:
-    import camelot
-    import pdfplumber
-except ImportError as e:
-    logging.error(f"Missing required package: {e}")
-    raise
+from .coordinates import to_camelot_area, to_display
+from .document_session import DocumentSession, open_session
 
 logger = logging.getLogger(__name__)
 
+# Text extraction tolerances (points)
+TEXT_X_TOLERANCE = 15.0        # Column clustering gap
+TEXT_DENSE_X_TOLERANCE = 25.0  # Retry gap when clustering finds >50 columns
+TEXT_Y_TOLERANCE = 5.0         # Same-row distance
 
-def _cluster_x_coordinates(text_items: List[Dict], tolerance: float = 15.0) -> List[float]:
+
+def _cluster_x_coordinates(x_coords: np.ndarray, tolerance: float = 15.0) -> np.ndarray:
     """
     Cluster x-coordinates to identify column positions
 
+    Distinct x-coordinates are sorted and split wherever the gap to the
+    previous one exceeds the tolerance; each column is the mean of its cluster.
+
     Args:
-        text_items: List of text items with x0 coordinates
+        x_coords: Array of span x0 coordinates
         tolerance: Max distance between items in same column (pixels)
 
     Returns:
-        List of column x-positions (sorted)
+        Array of column x-positions (sorted)
     """
-    if not text_items:
-        return []
+    xs = np.unique(x_coords)
+    if xs.size == 0:
+        return xs
 
-    # Collect all x-coordinates
-    x_coords = sorted(set(item['x0'] for item in text_items))
+    # Cluster id increments at every gap wider than the tolerance
+    cluster_ids = np.concatenate(([0], np.cumsum(np.diff(xs) > tolerance)))
+    return np.bincount(cluster_ids, weights=xs) / np.bincount(cluster_ids)
 
-    if not x_coords:
-        return []
 
-    # Simple clustering: group coords within tolerance
-    clusters = []
-    current_cluster = [x_coords[0]]
+def _assign_to_column(x_coords: np.ndarray, column_positions: np.ndarray, tolerance: float = 20.0) -> np.ndarray:
+    """
+    Assign x-coordinates to their nearest column
 
-    for x in x_coords[1:]:
-        if x - current_cluster[-1] <= tolerance:
-            current_cluster.append(x)
-        else:
-            # Finalize cluster (use median as representative)
-            clusters.append(sum(current_cluster) / len(current_cluster))
-            current_cluster = [x]
+    Args:
+        x_coords: Array of x-coordinates to assign
+        column_positions: Sorted array of column x-positions
+        tolerance: Max distance to column center
 
-    # Add last cluster
-    if current_cluster:
-        clusters.append(sum(current_cluster) / len(current_cluster))
+    Returns:
+        Array of column indices (0-based); len(column_positions) where no
+        column is within tolerance
+    """
+    n_cols = len(column_positions)
+    if n_cols == 0:
+        return np.zeros(len(x_coords), dtype=np.intp)
 
-    return sorted(clusters)
+    # Nearest column is either side of the insertion point (ties go left)
+    right = np.clip(np.searchsorted(column_positions, x_coords), 0, n_cols - 1)
+    left = np.clip(right - 1, 0, n_cols - 1)
+    left_dist = np.abs(x_coords - column_positions[left])
+    right_dist = np.abs(x_coords - column_positions[right])
 
+    nearest = np.where(left_dist <= right_dist, left, right)
+    nearest_dist = np.minimum(left_dist, right_dist)
 
-def _assign_to_column(x_coord: float, column_positions: List[float], tolerance: float = 20.0) -> int:
-    """
-    Assign x-coordinate to nearest column
+    return np.where(nearest_dist > tolerance, n_cols, nearest)
 
-    Args:
-        x_coord: X-coordinate to assign
-        column_positions: List of column x-positions
-        tolerance: Max distance to column center
 
-    Returns:
-        Column index (0-based)
+def _group_rows(y_coords: np.ndarray, tolerance: float = 5.0) -> Tuple[np.ndarray, np.ndarray]:
     """
-    if not column_positions:
-        return 0
+    Band items into rows by y-coordinate
 
-    # Find nearest column
-    distances = [abs(x_coord - col_x) for col_x in column_positions]
-    min_dist = min(distances)
+    Items are sorted by y and a new row starts wherever the gap to the
+    previous item reaches the tolerance.
 
-    # Only assign if within tolerance
-    if min_dist > tolerance:
-        # Create new column (shouldn't happen if clustering worked)
-        return len(column_positions)
+    Args:
+        y_coords: Array of span y0 coordinates
+        tolerance: Max y distance between neighbouring items in the same row
 
-    return distances.index(min_dist)
+    Returns:
+        (order, row_ids): item order sorted by y, and the row index of each
+        item in that order
+    """
+    order = np.argsort(y_coords, kind='stable')
+    row_ids = np.concatenate(([0], np.cumsum(np.diff(y_coords[order]) >= tolerance)))
+    return order, row_ids
 
 
 def extract_table_from_text(
     pdf_path: str,
     page: int,
     bbox: Tuple[float, float, float, float],
-    table_type: str = None
+    table_type: str = None,
+    x_tolerance: float = TEXT_X_TOLERANCE,
+    y_tolerance: float = TEXT_Y_TOLERANCE,
+    session: Optional[DocumentSession] = None
 ) -> Optional[pd.DataFrame]:
     """
     Extract table by parsing text within bounding box
@@ -116,53 +127,31 @@ def extract_table_from_text(
         page: Page number (0-indexed)
         bbox: Bounding box (x0, y0, x1, y1)
         table_type: Table type (for type-specific parsing)
+        x_tolerance: Max gap between x-coordinates in the same column
+        y_tolerance: Max y distance between items in the same row
+        session: Shared document session (opened here if not provided)
 
     Returns:
         DataFrame or None
     """
     try:
-        import fitz
-
-        doc = fitz.open(pdf_path)
-        pdf_page = doc[page]
-
-        # Extract text with position information
-        text_dict = pdf_page.get_text("dict", clip=bbox)
-
-        doc.close()
+        # Extract text spans with positions (rotated text derotated into its reading frame)
+        with open_session(pdf_path, session) as doc_session:
+            spans = doc_session.reading_spans(page, bbox)
 
-        if not text_dict or 'blocks' not in text_dict:
-            logger.debug("No text blocks found in bbox")
+        if len(spans) < 10:  # Need reasonable amount of text
+            logger.debug(f"Insufficient text items: {len(spans)}")
             return None
 
-        # Extract text blocks with positions
-        text_items = []
-        for block in text_dict['blocks']:
-            if block['type'] == 0:  # Text block
-                for line in block.get('lines', []):
-                    for span in line.get('spans', []):
-                        text = span['text'].strip()
-                        if text:
-                            bbox_item = span['bbox']
-                            text_items.append({
-                                'text': text,
-                                'x0': bbox_item[0],
-                                'y0': bbox_item[1],
-                                'x1': bbox_item[2],
-                                'y1': bbox_item[3]
-                            })
-
-        if len(text_items) < 10:  # Need reasonable amount of text
-            logger.debug(f"Insufficient text items: {len(text_items)}")
-            return None
+        x0, y0 = spans.x0, spans.y0
 
         # STEP 1: Cluster x-coordinates to identify columns
-        column_positions = _cluster_x_coordinates(text_items, tolerance=15.0)
+        column_positions = _cluster_x_coordinates(x0, tolerance=x_tolerance)
 
         if len(column_positions) > 50:
             # Too many columns - likely dense layout, increase tolerance
             logger.debug(f"Too many columns ({len(column_positions)}), increasing tolerance")
-            column_positions = _cluster_x_coordinates(text_items, tolerance=25.0)
+            column_positions = _cluster_x_coordinates(x0, tolerance=max(x_tolerance, TEXT_DENSE_X_TOLERANCE))
 
         if len(column_positions) < 2:
             logger.debug(f"Too few columns: {len(column_positions)}")
@@ -171,55 +160,23 @@ def extract_table_from_text(
         logger.debug(f"Detected {len(column_positions)} columns")
 
         # STEP 2: Group text items by row (y-coordinate)
-        text_items.sort(key=lambda x: x['y0'])
-
-        rows = []
-        current_row_items = []
-        current_y = None
-        y_tolerance = 5.0  # Pixels tolerance for same row
-
-        for item in text_items:
-            if current_y is None or abs(item['y0'] - current_y) < y_tolerance:
-                current_row_items.append(item)
-                if current_y is None:
-                    current_y = item['y0']
-                else:
-                    # Update to average y-position
-                    current_y = (current_y + item['y0']) / 2
-            else:
-                # New row - process current row
-                if current_row_items:
-                    rows.append(current_row_items)
-                current_row_items = [item]
-                current_y = item['y0']
-
-        # Add last row
-        if current_row_items:
-            rows.append(current_row_items)
-
-        if len(rows) < 2:
-            logger.debug(f"Too few rows: {len(rows)}")
+        order, row_ids = _group_rows(y0, tolerance=y_tolerance)
+        n_rows = int(row_ids[-1]) + 1
+
+        if n_rows < 2:
+            logger.debug(f"Too few rows: {n_rows}")
             return None
 
         # STEP 3: Assign items to columns and build table
-        table_data = []
-
-        for row_items in rows:
-            # Initialize row with empty strings
-            row_data = [''] * len(column_positions)
+        col_ids = _assign_to_column(x0[order], column_positions)
+        keep = col_ids < len(column_positions)  # Items too far from any column are dropped
 
-            # Assign each item to a column
-            for item in row_items:
-                col_idx = _assign_to_column(item['x0'], column_positions)
-
-                if col_idx < len(row_data):
-                    # Concatenate if column already has text (multi-part cells)
-                    if row_data[col_idx]:
-                        row_data[col_idx] += ' ' + item['text']
-                    else:
-                        row_data[col_idx] = item['text']
-
-            table_data.append(row_data)
+        table_data = [[''] * len(column_positions) for _ in range(n_rows)]
+        for item_idx, row_idx, col_idx in zip(order[keep], row_ids[keep], col_ids[keep]):
+            # Concatenate if column already has text (multi-part cells)
+            cell = table_data[row_idx][col_idx]
+            text = spans.text(item_idx)
+            table_data[row_idx][col_idx] = f"{cell} {text}" if cell else text
 
         # STEP 4: Create DataFrame
         if len(table_data) < 2:
@@ -310,31 +267,42 @@ def extract_table_from_text(
         return None
 
 
-def _get_page_height(pdf_path: str, page: int) -> float:
+def _camelot_area(
+    pdf_path: str,
+    page: int,
+    bbox: Tuple[float, float, float, float],
+    session: Optional[DocumentSession] = None
+) -> str:
     """
-    Get PDF page height for coordinate conversion
+    Camelot table area for a bbox
+
+    Camelot uses a bottom-left origin and turns rotated text upright
+    itself, so the bbox is mapped into the region's reading frame before
+    y is flipped.
 
     Args:
         pdf_path: Path to PDF
         page: Page number (0-indexed)
+        bbox: Bounding box (x0, y0, x1, y1) in the page frame
+        session: Shared document session (opened here if not provided)
 
     Returns:
-        Page height in points
+        Camelot table_areas entry ("x1,y1,x2,y2")
     """
     try:
-        doc = fitz.open(pdf_path)
-        page_height = doc[page].rect.height
-        doc.close()
-        return page_height
+        with open_session(pdf_path, session) as doc_session:
+            return to_camelot_area(bbox, doc_session.page(page), doc_session.reading_matrix(page, bbox))
     except:
-        return 842.0  # A4 default
+        x1, y1, x2, y2 = bbox
+        return f"{x1},{842.0 - y2},{x2},{842.0 - y1}"  # A4 default
 
 
 def extract_with_camelot_lattice(
     pdf_path: str,
     page: int,
     bbox: Tuple[float, float, float, float],
-    table_type: str = None
+    table_type: str = None,
+    session: Optional[DocumentSession] = None
 ) -> Optional[pd.DataFrame]:
     """
     Extract table using Camelot lattice method (for bordered tables)
@@ -344,33 +312,25 @@ def extract_with_camelot_lattice(
         page: Page number (0-indexed)
         bbox: Bounding box (x0, y0, x1, y1)
         table_type: Table type (for type-specific extraction)
+        session: Shared document session (page geometry; one Camelot parse
+            per page for all its table regions)
 
     Returns:
         DataFrame or None
     """
     try:
-        # Convert bbox to Camelot format (x1,y1,x2,y2 in PDF coordinates)
-        # Camelot uses bottom-left origin, but we use top-left
-        # Need to flip y-coordinates
+        with open_session(pdf_path, session) as doc_session:
+            # Convert bbox to Camelot format (x1,y1,x2,y2 in PDF coordinates)
+            # Camelot uses bottom-left origin, but we use top-left
+            # Need to flip y-coordinates (in the upright frame Camelot reads)
+            camelot_bbox = _camelot_area(pdf_path, page, bbox, doc_session)
 
-        # Get page height for coordinate conversion
-        page_height = _get_page_height(pdf_path, page)
+            # Extract with specific table area
+            df = doc_session.camelot_table(page, camelot_bbox, 'lattice')
 
-        # Convert bbox (top-left origin) to Camelot format (bottom-left origin)
-        x1, y1, x2, y2 = bbox
-        camelot_bbox = f"{x1},{page_height - y2},{x2},{page_height - y1}"
-
-        # Extract with specific table area
-        tables = camelot.read_pdf(
-            pdf_path,
-            pages=str(page + 1),
-            flavor='lattice',
-            table_areas=[camelot_bbox]
-        )
-
-        if tables and len(tables) > 0:
-            logger.debug(f"Camelot lattice extracted {len(tables[0].df)} rows")
-            return tables[0].df
+        if df is not None:
+            logger.debug(f"Camelot lattice extracted {len(df)} rows")
+            return df
 
         return None
 
@@ -383,7 +343,8 @@ def extract_with_camelot_stream(
     pdf_path: str,
     page: int,
     bbox: Tuple[float, float, float, float],
-    table_type: str = None
+    table_type: str = None,
+    session: Optional[DocumentSession] = None
 ) -> Optional[pd.DataFrame]:
     """
     Extract table using Camelot stream method (for borderless tables)
@@ -393,30 +354,26 @@ def extract_with_camelot_stream(
         page: Page number (0-indexed)
         bbox: Bounding box (x0, y0, x1, y1)
         table_type: Table type (for type-specific extraction)
+        session: Shared document session (page geometry; one Camelot parse
+            per page for all its table regions)
 
     Returns:
         DataFrame or None
     """
     try:
-        # Get page height for coordinate conversion
-        page_height = _get_page_height(pdf_path, page)
-
-        # Convert bbox
-        x1, y1, x2, y2 = bbox
-        camelot_bbox = f"{x1},{page_height - y2},{x2},{page_height - y1}"
-
-        # Extract with stream method
-        tables = camelot.read_pdf(
-            pdf_path,
-            pages=str(page + 1),
-            flavor='stream',
-            table_areas=[camelot_bbox],
-            edge_tol=50  # Tolerance for detecting columns
-        )
+        with open_session(pdf_path, session) as doc_session:
+            # Convert bbox
+            camelot_bbox = _camelot_area(pdf_path, page, bbox, doc_session)
+
+            # Extract with stream method
+            df = doc_session.camelot_table(
+                page, camelot_bbox, 'stream',
+                edge_tol=50  # Tolerance for detecting columns
+            )
 
-        if tables and len(tables) > 0:
-            logger.debug(f"Camelot stream extracted {len(tables[0].df)} rows")
-            return tables[0].df
+        if df is not None:
+            logger.debug(f"Camelot stream extracted {len(df)} rows")
+            return df
 
         return None
 
@@ -429,7 +386,8 @@ def extract_with_pdfplumber(
     pdf_path: str,
     page: int,
     bbox: Tuple[float, float, float, float],
-    table_type: str = None
+    table_type: str = None,
+    session: Optional[DocumentSession] = None
 ) -> Optional[pd.DataFrame]:
     """
     Extract table using pdfplumber
@@ -439,20 +397,19 @@ def extract_with_pdfplumber(
         page: Page number (0-indexed)
         bbox: Bounding box (x0, y0, x1, y1)
         table_type: Table type (for type-specific extraction)
+        session: Shared document session (reuses its pdfplumber handle)
 
     Returns:
         DataFrame or None
     """
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            if page >= len(pdf.pages):
+        with open_session(pdf_path, session) as doc_session:
+            pdf_page = doc_session.plumber_page(page)
+            if pdf_page is None:
                 return None
 
-            pdf_page = pdf.pages[page]
-
-            # Crop to bbox
-            x0, y0, x1, y1 = bbox
-            cropped = pdf_page.crop((x0, y0, x1, y1))
+            # Crop to bbox (pdfplumber works in the displayed, rotated frame)
+            cropped = pdf_page.crop(to_display(bbox, doc_session.page(page)))
 
             # Extract table
             table = cropped.extract_table()
@@ -529,6 +486,42 @@ def get_validation_keywords(table_type: str) -> List[str]:
     return keywords.get(table_type, keywords['unknown'])
 
 
+def _cell_arrays(frames: List[pd.DataFrame]) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Per-cell text and numeric flags for several DataFrames in one vectorized pass
+
+    All cells are flattened row-major into one array, stringified once and
+    split back per frame.
+
+    Args:
+        frames: DataFrames to analyze
+
+    Returns:
+        Per frame: (lowercased cell text, non-empty flags, numeric flags),
+        each shaped (rows, columns)
+    """
+    shapes = [df.shape for df in frames]
+    sizes = [rows * cols for rows, cols in shapes]
+    if sum(sizes) == 0:
+        return [(np.empty(shape, dtype=str), np.zeros(shape, dtype=bool), np.zeros(shape, dtype=bool))
+                for shape in shapes]
+
+    values = np.concatenate([df.to_numpy(dtype=object).ravel() for df in frames])
+    text = values.astype(str)
+    lower = np.char.lower(text)
+    non_empty = (np.char.strip(text) != '') & (lower != 'nan') & (lower != 'none')
+    try:
+        numeric = pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').notna().to_numpy()
+    except (TypeError, ValueError):
+        numeric = np.zeros(len(values), dtype=bool)
+
+    bounds = np.cumsum([0] + sizes)
+    return [
+        (lower[start:end].reshape(shape), non_empty[start:end].reshape(shape), numeric[start:end].reshape(shape))
+        for start, end, shape in zip(bounds[:-1], bounds[1:], shapes)
+    ]
+
+
 def evaluate_extraction_quality(df: pd.DataFrame, table_type: str = None) -> float:
     """
     Evaluate quality of extracted table
@@ -548,37 +541,62 @@ def evaluate_extraction_quality(df: pd.DataFrame, table_type: str = None) -> flo
     Returns:
         Quality score (0.0 - 1.0)
     """
-    if df is None or len(df) == 0:
-        return 0.0
+    return evaluate_extraction_quality_batch([df], table_type)[0]
+
+
+def evaluate_extraction_quality_batch(frames: List[Optional[pd.DataFrame]], table_type: str = None) -> List[float]:
+    """
+    Evaluate quality of several candidate extractions of the same table
+
+    Scores are identical to calling evaluate_extraction_quality() on each
+    frame; cell text is analyzed for all frames in a single pass.
+
+    Args:
+        frames: Candidate DataFrames (None or empty score 0.0)
+        table_type: Expected table type (for type-specific checks)
+
+    Returns:
+        Quality score (0.0 - 1.0) per frame
+    """
+    scores = [0.0] * len(frames)
+    present = [i for i, df in enumerate(frames) if df is not None and len(df) > 0]
+    cells = _cell_arrays([frames[i] for i in present])
+
+    for i, (lower, non_empty, numeric) in zip(present, cells):
+        scores[i] = _score_frame(frames[i], table_type, lower, non_empty, numeric)
 
+    return scores
+
+
+def _score_frame(
+    df: pd.DataFrame,
+    table_type: Optional[str],
+    lower: np.ndarray,
+    non_empty: np.ndarray,
+    numeric: np.ndarray
+) -> float:
+    """Quality score of one non-empty frame from its precomputed cell arrays"""
+    n_rows, n_cols = df.shape
     score = 0.0
 
     # 1. Row count (up to 0.2)
     # More rows = better (typical table has 10-50 rows)
-    row_score = min(len(df) / 50, 1.0) * 0.2
+    row_score = min(n_rows / 50, 1.0) * 0.2
     score += row_score
 
     # 2. Column count (up to 0.2)
     # More columns = better (typical table has 5-15 columns)
     # Penalize if too many columns (likely parsing error)
-    if len(df.columns) > 30:
+    if n_cols > 30:
         col_score = 0.0  # Too many columns = bad extraction
     else:
-        col_score = min(len(df.columns) / 15, 1.0) * 0.2
+        col_score = min(n_cols / 15, 1.0) * 0.2
     score += col_score
 
     # 3. Non-empty cells (up to 0.3)
-    total_cells = len(df) * len(df.columns)
-    if total_cells > 0:
-        # Count non-empty string cells (not just notna)
-        non_empty = sum(
-            1 for row in df.itertuples(index=False)
-            for cell in row
-            if str(cell).strip() and str(cell).lower() not in ['nan', 'none']
-        )
-        completeness = non_empty / total_cells
-    else:
-        completeness = 0
+    # Count non-empty string cells (not just notna)
+    total_cells = n_rows * n_cols
+    completeness = int(non_empty.sum()) / total_cells if total_cells > 0 else 0
     score += completeness * 0.3
 
     # 4. Column headers quality (up to 0.15)
@@ -590,25 +608,21 @@ def evaluate_extraction_quality(df: pd.DataFrame, table_type: str = None) -> flo
         and not str(col).isdigit()
         and len(str(col)) > 1  # Exclude single-char headers
     )
-    header_quality = good_headers / len(df.columns) if len(df.columns) > 0 else 0
+    header_quality = good_headers / n_cols if n_cols > 0 else 0
     score += header_quality * 0.15
 
     # 5. Numeric data presence (up to 0.15)
     # Scientific tables should have numeric data
     numeric_cols = df.select_dtypes(include=['number']).columns
-    if len(numeric_cols) == 0:
-        # Try converting strings to numbers
-        numeric_convertible = 0
-        for col in df.columns:
-            try:
-                converted = pd.to_numeric(df[col], errors='coerce')
-                if converted.notna().sum() > len(df) * 0.3:  # At least 30% numeric
-                    numeric_convertible += 1
-            except:
-                pass
-        numeric_quality = numeric_convertible / len(df.columns) if len(df.columns) > 0 else 0
+    if len(numeric_cols) == 0 and n_cols > 0:
+        # Columns where at least 30% of values convert to numbers
+        # (duplicate-named columns never count, as df[col] is not a Series)
+        convertible = (numeric.sum(axis=0) > n_rows * 0.3) & ~df.columns.duplicated(keep=False)
+        numeric_quality = int(convertible.sum()) / n_cols
+    elif n_cols > 0:
+        numeric_quality = len(numeric_cols) / n_cols
     else:
-        numeric_quality = len(numeric_cols) / len(df.columns)
+        numeric_quality = 0
 
     score += numeric_quality * 0.15
 
@@ -617,24 +631,17 @@ def evaluate_extraction_quality(df: pd.DataFrame, table_type: str = None) -> flo
     if table_type and table_type != 'unknown':
         # Check row count expectation
         expected_rows = get_expected_row_range(table_type)
-        if expected_rows['min'] <= len(df) <= expected_rows['max']:
+        if expected_rows['min'] <= n_rows <= expected_rows['max']:
             type_score += 0.07
 
         # Check column count expectation
         expected_cols = get_expected_col_range(table_type)
-        if expected_cols['min'] <= len(df.columns) <= expected_cols['max']:
+        if expected_cols['min'] <= n_cols <= expected_cols['max']:
             type_score += 0.07
 
-        # Check for validation keywords
+        # Check for validation keywords in cell values and column names
         keywords = get_validation_keywords(table_type)
-
-        # Convert all cell values to lowercase strings for searching
-        all_text = ' '.join(
-            str(cell).lower()
-            for row in df.itertuples(index=False)
-            for cell in row
-        )
-        # Also check column names
+        all_text = ' '.join(lower.ravel().tolist())
         all_text += ' ' + ' '.join(str(col).lower() for col in df.columns)
 
         # Count how many keywords found
@@ -681,23 +688,25 @@ def extract_table_with_voting(
     ]
 
     # Try each method
-    results = []
+    candidates = []
     for method_name, extractor in methods:
         try:
             logger.debug(f"  Trying {method_name}...")
             df = extractor(pdf_path, page, bbox)
 
             if df is not None and len(df) > 0:
-                # Evaluate quality
-                quality = evaluate_extraction_quality(df)
-                results.append((method_name, df, quality))
-                logger.debug(f"    → Success (quality: {quality:.2f})")
+                candidates.append((method_name, df))
+                logger.debug("    → Success")
             else:
-                logger.debug(f"    → No data extracted")
+                logger.debug("    → No data extracted")
 
         except Exception as e:
             logger.warning(f"  {method_name} failed: {e}")
 
+    # Evaluate quality of all candidates together
+    qualities = evaluate_extraction_quality_batch([df for _, df in candidates])
+    results = [(method_name, df, quality) for (method_name, df), quality in zip(candidates, qualities)]
+
     # Vote: choose extraction with highest quality score
     if not results:
         logger.warning("All extraction methods failed")
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Page Text Index
+
+Purpose: Extract a PDF's text once and share it across the pipeline
+Created: 2026-10-17
+
+Features:
+- Plain text of every page (same text as page.get_text())
+- Page start offsets into the concatenated full text
+- Text block geometry per page, with each block's character range
+- One text page parse per page (text and blocks come from the same parse)
+- Plain payload (lists + one frame) for caching with PDFCache
+
+Example:
+    index = PageTextIndex.from_document(doc)
+    for page_num, match in index.finditer_pages(r'Table\\s+\\d+'):
+        bbox = index.block_at(page_num, match.start())
+"""
+
+import logging
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+import fitz  # pymupdf
+
+logger = logging.getLogger(__name__)
+
+# Block table columns (one row per text block)
+BLOCK_COLUMNS = ['page', 'x0', 'y0', 'x1', 'y1', 'start', 'end']
+
+
+class PageTextIndex:
+    """Per-page text, offsets and block geometry of one PDF"""
+
+    def __init__(self, pages: List[str], blocks: pd.DataFrame, metadata: Optional[Dict] = None):
+        """
+        Args:
+            pages: Plain text of each page
+            blocks: Text blocks (BLOCK_COLUMNS); start/end are offsets into
+                the page text (-1 if the block text could not be located)
+            metadata: PDF document metadata (title, author, ...)
+        """
+        self.pages = pages
+        self.metadata = metadata or {}
+        self.offsets = np.cumsum([0] + [len(text) for text in pages], dtype=np.int64)
+        self._full_text = None
+
+        self.block_pages = blocks['page'].to_numpy(dtype=np.int32)
+        self.block_coords = blocks[['x0', 'y0', 'x1', 'y1']].to_numpy(dtype=np.float32).reshape(-1, 4)
+        self.block_ranges = blocks[['start', 'end']].to_numpy(dtype=np.int64).reshape(-1, 2)
+
+    @classmethod
+    def from_document(cls, doc: fitz.Document, pages: Optional[Dict[int, fitz.Page]] = None) -> 'PageTextIndex':
+        """
+        Build from an open PyMuPDF document
+
+        Args:
+            doc: PyMuPDF document
+            pages: Already-loaded pages by number (reused instead of reloading)
+
+        Returns:
+            PageTextIndex
+        """
+        pages = pages if pages is not None else {}
+        texts = []
+        rows = []
+
+        for page_num in range(len(doc)):
+            page = pages.get(page_num) or doc[page_num]
+            textpage = page.get_textpage()
+            text = page.get_text("text", textpage=textpage)
+            texts.append(text)
+
+            # Locate each block in the page text (blocks come in text order)
+            cursor = 0
+            for x0, y0, x1, y1, block_text, _, block_type in page.get_text("blocks", textpage=textpage):
+                if block_type != 0:  # Text blocks only
+                    continue
+                start = text.find(block_text, cursor)
+                if start < 0:
+                    rows.append((page_num, x0, y0, x1, y1, -1, -1))
+                    continue
+                cursor = start + len(block_text)
+                rows.append((page_num, x0, y0, x1, y1, start, cursor))
+
+        logger.debug(f"Indexed text of {len(texts)} pages ({len(rows)} blocks)")
+        return cls(texts, pd.DataFrame(rows, columns=BLOCK_COLUMNS), dict(doc.metadata or {}))
+
+    @classmethod
+    def from_payload(cls, payload: Dict) -> 'PageTextIndex':
+        """
+        Rebuild from to_payload() output (e.g. from cache)
+
+        Args:
+            payload: Dict with 'pages', 'blocks' and 'metadata'
+
+        Returns:
+            PageTextIndex
+        """
+        return cls(list(payload['pages']), payload['blocks'], payload.get('metadata'))
+
+    def to_payload(self) -> Dict:
+        """Plain dict for caching (text lists, metadata, one block frame)"""
+        blocks = pd.DataFrame({
+            'page': self.block_pages,
+            'x0': self.block_coords[:, 0],
+            'y0': self.block_coords[:, 1],
+            'x1': self.block_coords[:, 2],
+            'y1': self.block_coords[:, 3],
+            'start': self.block_ranges[:, 0],
+            'end': self.block_ranges[:, 1],
+        })
+        metadata = {k: v for k, v in self.metadata.items() if isinstance(v, str)}
+        return {'pages': list(self.pages), 'blocks': blocks, 'metadata': metadata}
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    def page_text(self, page_num: int) -> str:
+        """Plain text of a page"""
+        return self.pages[page_num]
+
+    @property
+    def full_text(self) -> str:
+        """Concatenated text of all pages (joined once)"""
+        if self._full_text is None:
+            self._full_text = "".join(self.pages)
+        return self._full_text
+
+    def page_of(self, offset: int) -> int:
+        """
+        Page containing a full-text offset
+
+        Args:
+            offset: Character offset into full_text
+
+        Returns:
+            Page number (0-indexed)
+        """
+        return int(np.searchsorted(self.offsets, offset, side='right')) - 1
+
+    def finditer_pages(self, pattern: str, flags: int = 0) -> Iterator[Tuple[int, re.Match]]:
+        """
+        Search every page's text (matches never span pages)
+
+        Args:
+            pattern: Regular expression
+            flags: re flags
+
+        Yields:
+            (page number, match in that page's text)
+        """
+        regex = re.compile(pattern, flags)
+        for page_num, text in enumerate(self.pages):
+            for match in regex.finditer(text):
+                yield page_num, match
+
+    def blocks_on(self, page_num: int) -> np.ndarray:
+        """
+        Text block bboxes on a page
+
+        Args:
+            page_num: Page number (0-indexed)
+
+        Returns:
+            (n, 4) float32 array of (x0, y0, x1, y1)
+        """
+        return self.block_coords[self.block_pages == page_num]
+
+    def block_at(self, page_num: int, offset: int) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Bbox of the text block containing a page-text offset
+
+        Args:
+            page_num: Page number (0-indexed)
+            offset: Character offset into the page text
+
+        Returns:
+            (x0, y0, x1, y1) or None if no located block contains it
+        """
+        starts, ends = self.block_ranges[:, 0], self.block_ranges[:, 1]
+        hits = np.flatnonzero((self.block_pages == page_num) & (starts <= offset) & (offset < ends))
+        if len(hits) == 0:
+            return None
+        return tuple(float(v) for v in self.block_coords[hits[0]])
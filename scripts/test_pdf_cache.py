@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test the PDF extraction cache (scripts/pdf/cache.py)
+
+Purpose: Round-trip, per-PDF key index, LRU eviction with a running usage
+         total, and TTL expiry
+Created: 2026-10-17
+
+Usage:
+    python -m pytest scripts/test_pdf_cache.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pdf import cache as cache_module
+from pdf.cache import INDEX_DIRNAME, PDFCache
+
+
+def _pdfs(tmp_path: Path, n: int) -> list:
+    """n small files with distinct content (the cache only hashes bytes)"""
+    paths = []
+    for i in range(n):
+        path = tmp_path / f"paper-{i}.pdf"
+        path.write_bytes(b"%PDF-1.7\n" + str(i).encode() * 64)
+        paths.append(str(path))
+    return paths
+
+
+def test_key_index_one_file_per_pdf(tmp_path, monkeypatch):
+    pdfs = _pdfs(tmp_path, 3)
+    cache = PDFCache(str(tmp_path / 'cache'))
+    digests = [cache.get_pdf_hash(pdf) for pdf in pdfs]
+
+    assert len(set(digests)) == 3
+    assert len(list((tmp_path / 'cache' / INDEX_DIRNAME).glob('*.json'))) == 3
+
+    # Another instance finds every digest in the index without rehashing
+    def no_hashing(path, *args, **kwargs):
+        raise AssertionError(f"rehashed {path}")
+
+    monkeypatch.setattr(cache_module, 'hash_file', no_hashing)
+    assert [PDFCache(str(tmp_path / 'cache')).get_pdf_hash(pdf) for pdf in pdfs] == digests
+
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    pdfs = _pdfs(tmp_path, 5)
+    cache = PDFCache(str(tmp_path / 'cache'), max_entries=4)
+    frame = pd.DataFrame({'x': range(100)})
+
+    for pdf in pdfs[:4]:
+        cache.set(pdf, 'structure', frame)
+        time.sleep(0.01)
+    cache.get(pdfs[0], 'structure')  # Oldest write, but used most recently
+    time.sleep(0.01)
+
+    # Fifth entry crosses the limit: evicted down to 90% of it (3 entries)
+    cache.set(pdfs[4], 'structure', frame)
+    present = [cache.get(pdf, 'structure') is not None for pdf in pdfs]
+    assert present == [True, False, False, True, True]
+    assert cache.stats()['evictions'] == 2
+
+    # Running total matches the disk after eviction and further writes
+    cache.set(pdfs[1], 'structure', frame)
+    stats = cache.stats()
+    assert stats['entries'] == 4
+    assert cache._usage == {'bytes': stats['bytes'], 'entries': 4}
+
+
+def test_byte_limit(tmp_path):
+    pdfs = _pdfs(tmp_path, 6)
+    frame = pd.DataFrame({'x': range(1000)})
+
+    probe = PDFCache(str(tmp_path / 'probe'))
+    probe.set(pdfs[0], 'tables', frame)
+    entry_bytes = probe.stats()['bytes']
+
+    cache = PDFCache(str(tmp_path / 'cache'), max_bytes=int(entry_bytes * 3.5))
+    for pdf in pdfs:
+        cache.set(pdf, 'tables', frame)
+        assert cache.stats()['bytes'] <= cache.max_bytes
+    assert cache.stats()['entries'] == 3
+
+
+def test_ttl_expires_only_listed_steps(tmp_path):
+    pdf, = _pdfs(tmp_path, 1)
+    cache = PDFCache(str(tmp_path / 'cache'), ttl={'fair_data': 0.0})
+    cache.set(pdf, 'fair_data', {'rows': 1})
+    cache.set(pdf, 'structure', {'tables': 2})
+    time.sleep(0.01)
+
+    assert cache.get(pdf, 'fair_data') is None
+    assert cache.get(pdf, 'structure') == {'tables': 2}
+    assert cache.stats()['expired'] == 1
+
+
+def test_round_trip(tmp_path):
+    pdf, = _pdfs(tmp_path, 1)
+    df = pd.DataFrame({'Sample': ['MU-01', 'MU-02'], 'Age': [12.5, 30.1], 'Ns': [100, 200]})
+    data = {'tables': {'Table 1': df}, 'pages': [0, 3], 'type': 'AFT_ages'}
+
+    cache = PDFCache(str(tmp_path / 'cache'))
+    assert cache.get(pdf, 'tables') is None
+    cache.set(pdf, 'tables', data)
+
+    # A fresh instance (another run) reads the same entry
+    loaded = PDFCache(str(tmp_path / 'cache')).get(pdf, 'tables')
+    pd.testing.assert_frame_equal(loaded['tables']['Table 1'], df)
+    assert loaded['pages'] == [0, 3] and loaded['type'] == 'AFT_ages'
+
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['writes'], stats['entries']) == (0, 1, 1, 1)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Test per-page Camelot parsing shared by table regions (scripts/pdf/document_session.py)
+
+Purpose: Two tables on one page (ruled.pdf fixture) parsed by one Camelot
+         call, each area getting its own table; page-level extraction memo,
+         and cleanup when a table fails
+Created: 2026-10-17
+
+Usage:
+    python -m pytest scripts/test_pdf_camelot.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import camelot
+import pytest
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pdf.coordinates import to_camelot_area
+from pdf.document_session import DocumentSession
+from pdf import multi_method_extraction
+from pdf.extraction_validator import MethodAccuracy
+from pdf.multi_method_extraction import ExtractionMemo, extract_all_tables_multi_method
+from pdf.semantic_analysis import DocumentStructure
+
+FIXTURE = Path(__file__).parent / 'fixtures' / 'pdf' / 'ruled.pdf'
+
+
+@pytest.fixture
+def read_pdf_calls(monkeypatch):
+    """Arguments of every camelot.read_pdf call"""
+    calls = []
+    read_pdf = camelot.read_pdf
+
+    def counting(*args, **kwargs):
+        calls.append(kwargs.get('table_areas'))
+        return read_pdf(*args, **kwargs)
+
+    monkeypatch.setattr(camelot, 'read_pdf', counting)
+    return calls
+
+
+@pytest.mark.parametrize('order', [(0, 1), (1, 0)])
+def test_one_parse_per_page_each_area_its_table(read_pdf_calls, order):
+    with DocumentSession(str(FIXTURE)) as session:
+        tables = DocumentStructure(str(FIXTURE), session=session).build_reference_map()
+        assert [info['page'] for info in tables.values()] == [0, 0]
+
+        bboxes = [tables['Table 1']['bbox'], tables['Table 2']['bbox']]
+        for bbox in bboxes:
+            session.add_table_region(0, bbox)
+        areas = [to_camelot_area(bbox, session.page(0)) for bbox in bboxes]
+
+        # Either area first: the page is parsed once, with both areas
+        results = {i: session.camelot_table(0, areas[i], 'stream') for i in order}
+        assert len(read_pdf_calls) == 1
+        assert sorted(read_pdf_calls[0]) == sorted(areas)
+
+        assert results[0].shape == (9, 4)
+        assert results[0].iloc[0].tolist() == ['Sample', 'U', 'Th', 'Age']
+        assert results[0].iloc[8].tolist() == ['S8', '12.0', '24.0', '36.0']
+        assert results[1].shape == (6, 3)
+        assert results[1].iloc[0].tolist() == ['ID', 'Ns', 'Ni']
+        assert results[1].iloc[5].tolist() == ['K5', '51', '52']
+
+        # Other params are a separate parse
+        session.camelot_table(0, areas[0], 'stream', edge_tol=50)
+        assert len(read_pdf_calls) == 2
+
+
+def test_extraction_memo_reuses_page_results():
+    memo = ExtractionMemo()
+    computed = []
+
+    def compute():
+        computed.append(1)
+        return ['page tables']
+
+    key = memo.key(FIXTURE, 0, (10.04, 20.0, 30.0, 40.0), 'pdfplumber', {})
+    alias = memo.key(FIXTURE, 0, (10.0, 20.0, 30.0, 40.0), 'pdfplumber', {})
+    assert key == alias  # bbox rounded to 0.1 pt
+
+    assert memo.get_or_compute(key, compute) is memo.get_or_compute(alias, compute)
+    assert (len(computed), memo.hits, memo.misses) == (1, 1, 1)
+
+    memo.get_or_compute(memo.key(FIXTURE, 0, None, 'camelot', {'flavor': 'lattice'}), compute)
+    assert len(computed) == 2
+
+
+def test_failed_table_still_closes_session_and_saves_accuracy(tmp_path, monkeypatch):
+    paper_dir = tmp_path / 'paper'
+    (paper_dir / 'text').mkdir(parents=True)
+    (paper_dir / 'text' / 'discovered_tables.json').write_text(json.dumps([
+        {'name': 'Table 1', 'type': 'AFT_ages', 'page_estimate': 1, 'context': ''},
+    ]))
+
+    closed, saved = [], []
+    close = DocumentSession.close
+    monkeypatch.setattr(DocumentSession, 'close', lambda self: (closed.append(1), close(self)))
+    monkeypatch.setattr(MethodAccuracy, 'save', lambda self: saved.append(self.path))
+
+    def failing(*args, **kwargs):
+        raise RuntimeError('extraction failed')
+
+    monkeypatch.setattr(multi_method_extraction, 'extract_table_all_methods', failing)
+
+    with pytest.raises(RuntimeError):
+        extract_all_tables_multi_method(paper_dir, FIXTURE, tmp_path / 'RAW')
+    assert closed
+    assert saved == [tmp_path / 'method-accuracy.json']
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
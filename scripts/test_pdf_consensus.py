@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Test the consensus vote (scripts/pdf/extraction_validator.py)
+
+Purpose: Cell diffs within numeric tolerance, cell vote weighted by
+         method accuracy, accuracy learned from reviewed tables only
+Created: 2026-10-17
+
+Usage:
+    python -m pytest scripts/test_pdf_consensus.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pdf import extraction_validator
+from pdf.extraction_validator import ExtractionValidator, MethodAccuracy
+
+N_ROWS = 40
+
+
+@pytest.fixture
+def truth() -> pd.DataFrame:
+    """Per-grain (U-Th)/He rows: three grains per sample"""
+    i = np.arange(N_ROWS)
+    return pd.DataFrame({
+        'Sample': [f"MU-{k // 3:03d}" for k in i],
+        'U': [f"{10 + 1.7 * k:.2f}" for k in i],
+        'Th': [f"{20 + 0.9 * k:.2f}" for k in i],
+        'Age': [f"{50 + 2.3 * k:.1f}" for k in i],
+    })
+
+
+def test_cell_diffs_within_tolerance_and_aligned_rows(truth):
+    other = truth.copy()
+    other.loc[5, 'U'] = f"{float(truth.loc[5, 'U']) * 1.005:.3f}"  # Within 1%
+    other.loc[6, 'Th'] = f"{float(truth.loc[6, 'Th']) * 1.05:.2f}"  # Outside
+    other.loc[8, 'Age'] = 'n.d.'
+    other = other.drop(index=[2]).reset_index(drop=True)
+
+    validator = ExtractionValidator()
+    discrepancies = validator._detect_discrepancies('T', {
+        'camelot_stream': {'data': truth}, 'pdfplumber': {'data': other},
+    })
+    row_count, cells = discrepancies
+    assert row_count['aligned_rows'] == {'camelot_stream': N_ROWS, 'pdfplumber': N_ROWS - 1}
+    assert cells['row_maps']['pdfplumber'][2] == -1
+
+    diffs = {(d['row'], d['col']): d for d in cells['differences']}
+    assert set(diffs) == {(6, 2), (8, 3)}
+    assert diffs[6, 2]['compare_row'] == 5
+    assert diffs[6, 2]['numeric_diff'] == pytest.approx(float(truth.loc[6, 'Th']) * 0.05, abs=0.01)
+    assert diffs[8, 3]['numeric_diff'] is None
+
+    # Same verdicts as the scalar comparison, cell by cell
+    for d in cells['differences']:
+        assert not validator._values_equivalent(d['reference_value'], d['compare_value'])
+    assert validator._values_equivalent(truth.loc[5, 'U'], other.loc[4, 'U'])
+
+
+def test_vote_outvotes_minority_errors(truth):
+    methods = {name: truth.copy() for name in ('camelot_lattice', 'camelot_stream', 'pdfplumber')}
+    methods['camelot_lattice'].loc[3, 'U'] = '99.99'
+    methods['camelot_stream'].loc[7, 'Th'] = '0.01'
+    methods['pdfplumber'] = methods['pdfplumber'].drop(index=[20]).reset_index(drop=True)
+
+    merged, audit = ExtractionValidator().validate_and_merge(
+        'Table 2', {m: {'data': df, 'quality': 0.7} for m, df in methods.items()}, 'UThHe'
+    )
+
+    assert audit['resolution'] == 'consensus_vote'
+    assert merged.shape == truth.shape
+    assert merged.astype(str).values.tolist() == truth.values.tolist()
+
+    voted = {(cell['row'], cell['col']) for cell in audit['details']['voted_cells']}
+    assert {(3, 1), (7, 2)} <= voted
+
+
+def test_each_method_fingerprinted_once(truth, monkeypatch):
+    fingerprinted = []
+    row_fingerprints = extraction_validator.row_fingerprints
+
+    def counting(df):
+        fingerprinted.append(len(df))
+        return row_fingerprints(df)
+
+    monkeypatch.setattr(extraction_validator, 'row_fingerprints', counting)
+    methods = {
+        'camelot_lattice': truth.drop(index=[20]).reset_index(drop=True),
+        'camelot_stream': truth.copy(),
+        'pdfplumber': truth.copy(),
+    }
+    methods['pdfplumber'].loc[7, 'Th'] = '0.01'
+
+    # Discrepancy detection aligns to camelot_lattice, the vote to camelot_stream
+    _, audit = ExtractionValidator().validate_and_merge(
+        'T', {m: {'data': df, 'quality': 0.7} for m, df in methods.items()}, 'UThHe'
+    )
+    assert audit['resolution'] == 'consensus_vote'
+    assert sorted(fingerprinted) == [N_ROWS - 1, N_ROWS, N_ROWS]
+
+
+def test_vote_weights_follow_accuracy(truth):
+    """Two methods disagree on one cell: the more accurate one wins"""
+    a, b = truth.copy(), truth.copy()
+    b.loc[4, 'Age'] = '11.1'
+    extractions = {'camelot_stream': {'data': a, 'quality': 0.7}, 'pdfplumber': {'data': b, 'quality': 0.7}}
+
+    # UThHe priors: stream 0.75 > pdfplumber 0.60
+    merged, _ = ExtractionValidator().validate_and_merge('T', extractions, 'UThHe')
+    assert merged.loc[4, 'Age'] == truth.loc[4, 'Age']
+
+    # Reviewed tables showing pdfplumber right and stream wrong flip the weights
+    accuracy = MethodAccuracy()
+    accuracy.record('pdfplumber', 'UThHe', 'review-1', 500, 500)
+    accuracy.record('camelot_stream', 'UThHe', 'review-1', 100, 500)
+    merged, _ = ExtractionValidator(accuracy).validate_and_merge('T', extractions, 'UThHe')
+    assert merged.loc[4, 'Age'] == '11.1'
+
+
+def test_accuracy_learns_from_reviewed_tables_only(truth, tmp_path):
+    path = tmp_path / 'method-accuracy.json'
+    accuracy = MethodAccuracy(path)
+    prior = accuracy.accuracy('method_1_text', 'UThHe')
+
+    # The vote itself records nothing
+    ExtractionValidator(accuracy).validate_and_merge('T', {
+        'method_1_text': {'data': truth, 'quality': 0.7},
+        'method_2_pdfplumber': {'data': truth.iloc[:30], 'quality': 0.7},
+    }, 'UThHe')
+    assert accuracy.counts == {}
+
+    # 4 of 40 rows dropped, one cell misread: 4 * 4 + 1 of 160 cells wrong
+    extracted = truth.drop(index=[0, 1, 2, 3]).copy()
+    extracted.loc[10, 'U'] = '0.00'
+    share = accuracy.record_reference('method_1_text', 'UThHe', 'paper:Table 2:method_1_text', extracted, truth)
+    assert share == pytest.approx(143 / 160)
+
+    # Same reviewed table again replaces its outcome instead of adding to it
+    accuracy.record_reference('method_1_text', 'UThHe', 'paper:Table 2:method_1_text', extracted, truth)
+    assert accuracy.counts == {'UThHe/text': {'paper:Table 2:method_1_text': [143, 160]}}
+    assert accuracy.accuracy('method_1_text', 'UThHe') > prior
+
+    # Different column count: not comparable, nothing recorded
+    assert accuracy.record_reference('method_3_camelot_lattice', 'UThHe', 's', truth.iloc[:, :3], truth) is None
+
+    accuracy.save()
+    assert MethodAccuracy(path).counts == accuracy.counts
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test text table extraction and split-row merging (scripts/pdf/table_extractors.py, cleaners.py)
+
+Purpose: Column clustering / row grouping on the tables.pdf fixture
+         (including its rotated page), batch quality scoring, and the
+         vectorized _merge_split_rows
+Created: 2026-10-17
+
+Usage:
+    python -m pytest scripts/test_pdf_extractors.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pdf.cleaners import _merge_split_rows
+from pdf.document_session import DocumentSession
+from pdf.semantic_analysis import DocumentStructure
+from pdf.table_extractors import (
+    evaluate_extraction_quality,
+    evaluate_extraction_quality_batch,
+    extract_table_from_text,
+)
+
+FIXTURE = Path(__file__).parent / 'fixtures' / 'pdf' / 'tables.pdf'
+
+
+def test_merge_split_rows():
+    df = pd.DataFrame([
+        ['MU-01', '123.4', '', ''],
+        ['', '', '±5.6', '20'],    # Continues MU-01
+        ['MU-02', '98.0', '±4.1', '18'],
+        ['', '97.5', '±4.0', ''],  # Repeats filled columns: next grain, kept
+        [np.nan, np.nan, np.nan, '17'],
+    ], columns=['Sample', 'Age', 'Error', 'N'])
+
+    merged = _merge_split_rows(df, 'AFT_ages')
+    assert merged.values.tolist() == [
+        ['MU-01', '123.4', '±5.6', '20'],
+        ['MU-02', '98.0', '±4.1', '18'],
+        ['', '97.5', '±4.0', '17'],
+    ]
+    assert merged.index.tolist() == [0, 2, 3]
+
+    # One length per row: never merged
+    assert _merge_split_rows(df, 'track_lengths') is df
+
+
+@pytest.fixture(scope='module')
+def text_tables():
+    """Table ID → (table info, extract_table_from_text result)"""
+    with DocumentSession(str(FIXTURE)) as session:
+        tables = DocumentStructure(str(FIXTURE), session=session).build_reference_map()
+        return {
+            table_id: (info, extract_table_from_text(str(FIXTURE), info['page'], info['bbox'], info['type'], session=session))
+            for table_id, info in tables.items()
+        }
+
+
+def test_fixture_tables_found(text_tables):
+    assert {table_id: (info['type'], info['page']) for table_id, (info, _) in text_tables.items()} == {
+        'Table 1': ('AFT_ages', 0),
+        'Table 2': ('UThHe', 1),
+        'Table 3': ('UThHe', 2),
+    }
+
+
+def test_text_extraction_columns_and_rows(text_tables):
+    _, aft = text_tables['Table 1']
+    assert aft.shape == (25, 7)
+    assert list(aft.columns) == ["Sample", "Central age", "Error", "Dispersion", "Ns", "Ni", "P(chi2)"]
+    assert aft.iloc[3].tolist() == ['MU19-03', '109.3', '5.6', '13', '103', '203', '0.53']
+
+    _, he = text_tables['Table 2']
+    assert he.shape == (30, 8)
+    assert he.iloc[29].tolist() == ['MU19-09', '39', '49', '3.90', '79.0', '0.7', '99.0', '3.2']
+
+
+def test_quality_batch_matches_single_scores(text_tables):
+    frames = [df for _, df in text_tables.values()] + [None, pd.DataFrame()]
+    batch = evaluate_extraction_quality_batch(frames, 'UThHe')
+    assert batch == pytest.approx([evaluate_extraction_quality(df, 'UThHe') if df is not None else 0.0 for df in frames])
+
+
+def test_rotated_table_reads_like_upright(text_tables):
+    """Table 3 is Table 2 on a landscape page"""
+    pd.testing.assert_frame_equal(text_tables['Table 3'][1], text_tables['Table 2'][1])
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
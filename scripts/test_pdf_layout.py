@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test table region detection (scripts/pdf/layout.py)
+
+Purpose: Caption column and aligned-gap table rows on the layout.pdf
+         fixture; full table regions on tables.pdf (upright and rotated)
+Created: 2026-10-17
+
+Usage:
+    python -m pytest scripts/test_pdf_layout.py
+"""
+
+import sys
+from pathlib import Path
+
+import fitz  # pymupdf
+import pytest
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pdf.document_session import DocumentSession
+
+FIXTURE = Path(__file__).parent / 'fixtures' / 'pdf' / 'layout.pdf'
+TABLES_FIXTURE = Path(__file__).parent / 'fixtures' / 'pdf' / 'tables.pdf'
+
+
+def _caption_bbox(page_num: int, text: str):
+    with fitz.open(str(FIXTURE)) as doc:
+        return tuple(doc[page_num].search_for(text)[0])
+
+
+def test_caption_over_two_column_prose_is_not_a_table():
+    caption = _caption_bbox(0, "Table 3.")
+    with DocumentSession(str(FIXTURE)) as session:
+        layout = session.layout(0)
+
+        # Caption (with its italic run) is one cell, not a table row
+        caption_row = layout.rows((0, caption[1] - 1, 595, caption[3]))[0]
+        assert caption_row['cells'] == 1
+
+        # Column stops at the right-hand prose column
+        x0, x1 = layout.column(caption)
+        assert x1 <= 305
+
+        # Both prose columns side by side: one gap per row, never a table
+        rows = layout.rows((0, caption[3], 595, 842))
+        assert rows and all(len(row['gaps']) <= 1 for row in rows)
+
+        assert layout.table_region(caption) is None
+
+
+def test_table_beside_prose_stays_in_its_column():
+    caption = _caption_bbox(1, "Table 4.")
+    with DocumentSession(str(FIXTURE)) as session:
+        region = session.layout(1).table_region(caption)
+
+    assert region is not None
+    x0, y0, x1, y1 = region
+    assert 290 < x0 < 305          # Left prose column excluded
+    assert y0 > caption[3] - 2     # Starts below the caption (header row)
+    assert 500 < x1 < 547
+    assert 230 < y1 < 250          # Header + 12 rows, nothing after
+
+
+@pytest.mark.parametrize('page_num, caption, n_rows', [(0, "Table 1.", 25), (1, "Table 2.", 30), (2, "Table 3.", 30)])
+def test_region_covers_header_and_rows_only(page_num, caption, n_rows):
+    with fitz.open(str(TABLES_FIXTURE)) as doc:
+        caption_bbox = tuple(doc[page_num].search_for(caption)[0])
+
+    with DocumentSession(str(TABLES_FIXTURE)) as session:
+        region = session.layout(page_num).table_region(caption_bbox)
+        assert region is not None
+
+        # In the reading frame: header + data rows, no methods text or figure caption
+        texts = session.reading_spans(page_num, region).texts()
+        assert texts[0] == 'Sample'
+        assert sum(text.startswith('MU19-') for text in texts) == n_rows
+        assert not any(text.startswith(('METHODS', 'Figure', 'Table')) for text in texts)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
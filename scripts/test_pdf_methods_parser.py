@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test methods section parsing (scripts/pdf/methods_parser.py)
+
+Purpose: PatternScanner gives the same fields as re.search() over each
+         field's patterns in order, with keyword prefiltering and matching
+         at keyword positions
+Created: 2026-10-17
+
+Usage:
+    python -m pytest scripts/test_pdf_methods_parser.py
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pdf.methods_parser import MethodsParser, _starts_with_keyword
+
+METHODS = """
+Introduction
+Earlier work focused on the border faults.
+
+ANALYTICAL METHODS
+Samples were analyzed by Samuel Boone at the University of Melbourne. Apatite
+mounts were etched in 5.5% HNO3 at 21°C for 20 seconds and irradiated with
+CN5 dosimeter glass. Tracks were counted on a Zeiss microscope with a 1000×
+dry objective using TrackWorks, with the external detector method and a
+zeta: 350.5 ± 12.3. Uranium was also measured by LA-ICP-MS.
+
+RESULTS
+Central ages range from 45 to 320 Ma.
+"""
+
+FRAGMENTS = [
+    'analyzed by John Smith', 'Analyst: Jane Doe', 'University of Melbourne', 'Université de Paris',
+    'Melbourne University', 'GeoSep Services', 'NIKON microscope', 'leica', 'oil immersion objective',
+    '100× objective', '5 M HNO₃', 'etching at 21 °C', 'dosimeter glass CN5', 'CN-2 dosimeter',
+    'using FastTracks', 'LAICPMS', 'EDM', 'laser ablation', 'Zeta: 350.5 ± 12.3', 'ζ 300 ± 10',
+    'isochron', 'leicanalyst', 'zetabsolute age', 'İstanbul', 'the', '12', '\n',
+]
+
+
+def _search_fields(parser: MethodsParser, text: str) -> dict:
+    """Reference: re.search() over every field's patterns in priority order"""
+    found = {}
+    for field, patterns in parser.scanner.fields.items():
+        for regex, _, _, formatter in patterns:
+            match = regex.search(text)
+            if match is not None and formatter(match) is not None:
+                found[field] = formatter(match)
+                break
+    return found
+
+
+def test_parse_methods_section():
+    metadata = MethodsParser().parse_methods(METHODS)
+    assert metadata['analyst'] == 'Samuel Boone'
+    assert metadata['laboratory'] == 'Melbourne'
+    assert metadata['microscope'] == 'Zeiss'
+    assert metadata['objective'] == '1000'
+    assert metadata['etching_conditions'] == '5.5% HNO3 at 21°C for 20s'
+    assert metadata['dosimeter'] == 'CN5'
+    assert metadata['ft_software'] == 'TrackWorks'
+    assert metadata['ft_counting_method'] == 'LA-ICP-MS'
+    assert (metadata['zeta'], metadata['zeta_error']) == (350.5, 12.3)
+
+
+def test_scan_matches_search_over_patterns():
+    parser = MethodsParser()
+    rng = random.Random(0)
+    for _ in range(2000):
+        text = rng.choice([' ', '']).join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 20)))
+        assert parser.scanner.scan(text) == _search_fields(parser, text), text
+
+
+@pytest.mark.parametrize('pattern, keywords, leading', [
+    (r'analyzed by ([A-Z][a-z]+)', ['analyzed by'], True),
+    (r'LA\-ICP\-MS', ['la-icp-ms'], True),
+    (r'(Zeiss|Nikon)\s+(?:microscope)?', ['zeiss', 'nikon'], True),
+    (r'(Zeiss|\d+x)\s+objective', ['zeiss', 'objective'], False),
+    (r'(\d+)×\s+objective', ['objective'], False),
+    (r'(?:using\s+)?(EDM)', ['edm'], False),
+    (r'zetas?', ['zeta'], True),
+    (r'zeta?', ['zeta'], False),
+    (r'zeta|ζ', ['zeta', 'ζ'], False),
+])
+def test_starts_with_keyword(pattern, keywords, leading):
+    assert _starts_with_keyword(pattern, keywords) is leading
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
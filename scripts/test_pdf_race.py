@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Test race mode configuration (scripts/pdf/extraction_engine.py)
+
+Purpose: Per-method race budgets merged over the defaults; unknown method
+         names rejected before any worker starts
+Created: 2026-10-17
+
+Usage:
+    python -m pytest scripts/test_pdf_race.py
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pdf.extraction_engine import RACE_METHOD_BUDGETS, UniversalThermoExtractor, _race_budgets, _race_methods
+
+FIXTURE = Path(__file__).parent / 'fixtures' / 'pdf' / 'tables.pdf'
+
+
+def test_budgets_merge_over_defaults():
+    assert _race_budgets(None) == RACE_METHOD_BUDGETS
+    budgets = _race_budgets({'pdfplumber': 5.0})
+    assert budgets == {**RACE_METHOD_BUDGETS, 'pdfplumber': 5.0}
+    assert RACE_METHOD_BUDGETS['pdfplumber'] != 5.0  # Defaults untouched
+
+
+def test_unknown_method_rejected(tmp_path):
+    with pytest.raises(ValueError, match='camelot_latice'):
+        _race_methods(str(FIXTURE), 0, (0, 0, 100, 100), 'AFT_ages', 0.6, 3.0, 3.0, {'camelot_latice': 10.0})
+
+    # Rejected when the extractor is configured, before any extraction
+    with pytest.raises(ValueError, match='camelot_latice'):
+        UniversalThermoExtractor(str(FIXTURE), cache_dir=str(tmp_path), race=True, method_budgets={'camelot_latice': 10.0})
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
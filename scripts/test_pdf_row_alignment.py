@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test row alignment across extraction methods (scripts/pdf/row_alignment.py)
+
+Purpose: Rows paired with dropped, extra and misread rows (precomputed
+         fingerprints included); rows naming different samples never paired
+Created: 2026-10-17
+
+Usage:
+    python -m pytest scripts/test_pdf_row_alignment.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pdf import row_alignment
+from pdf.row_alignment import align_rows, row_fingerprints
+
+N_ROWS = 40
+
+
+@pytest.fixture
+def truth() -> pd.DataFrame:
+    """Per-grain (U-Th)/He rows: three grains per sample"""
+    i = np.arange(N_ROWS)
+    return pd.DataFrame({
+        'Sample': [f"MU-{k // 3:03d}" for k in i],
+        'U': [f"{10 + 1.7 * k:.2f}" for k in i],
+        'Th': [f"{20 + 0.9 * k:.2f}" for k in i],
+        'Age': [f"{50 + 2.3 * k:.1f}" for k in i],
+    })
+
+
+def test_align_rows_identical(truth, monkeypatch):
+    assert align_rows(truth, truth.copy()).tolist() == list(range(N_ROWS))
+
+    # Equal fingerprints short-circuit before any alignment work
+    def no_alignment(*args):
+        raise AssertionError("aligned identical tables")
+
+    monkeypatch.setattr(row_alignment, '_align_range', no_alignment)
+    assert align_rows(truth, truth.astype(object)).tolist() == list(range(N_ROWS))
+
+
+def test_align_rows_dropped_extra_and_misread_rows(truth):
+    other = truth.drop(index=[5, 30]).copy()
+    other.loc[12, 'Age'] = '999.9'  # Misread cell: row still pairs by its other tokens
+    other = pd.concat([
+        pd.DataFrame([['Notes', '', '', '']], columns=truth.columns),  # Extra row at the top
+        other,
+    ], ignore_index=True)
+
+    row_map = align_rows(truth, other)
+
+    expected = np.array([k - (k > 5) - (k > 30) + 1 for k in range(N_ROWS)])
+    expected[[5, 30]] = -1
+    assert row_map.tolist() == expected.tolist()
+
+    # Precomputed fingerprints give the same map
+    assert align_rows(truth, other, row_fingerprints(truth), row_fingerprints(other)).tolist() == expected.tolist()
+
+
+def test_align_rows_never_pairs_different_samples():
+    a = pd.DataFrame({'Sample': ['AB-1', 'AB-2'], 'Age': ['10.0', '20.0']})
+    b = pd.DataFrame({'Sample': ['AB-9', 'AB-2'], 'Age': ['10.0', '20.0']})
+    assert align_rows(a, b).tolist() == [-1, 1]
+
+    # Digit-leading IDs too
+    a = pd.DataFrame({'Sample': ['17KD01', '17KD02', '17KD03', '17KD04'], 'Ns': ['120', '85', '85', '64'], 'Ni': ['240', '170', '170', '128']})
+    b = pd.DataFrame({'Sample': ['17KD01', '17KD09', '17KD04'], 'Ns': ['120', '85', '64'], 'Ni': ['240', '170', '128']})
+    assert align_rows(a, b).tolist() == [0, -1, -1, 2]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test compact spans and reading frames (scripts/pdf/spans.py, coordinates.py)
+
+Purpose: SpanStore region cuts and transforms, and the reading frame of a
+         landscape (rotated) page in the tables.pdf fixture
+Created: 2026-10-17
+
+Usage:
+    python -m pytest scripts/test_pdf_spans.py
+"""
+
+import sys
+from pathlib import Path
+
+import fitz  # pymupdf
+import numpy as np
+import pytest
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pdf.coordinates import from_camelot_area, to_camelot_area, transform_bbox
+from pdf.document_session import DocumentSession
+from pdf.spans import SpanStore
+
+FIXTURE = Path(__file__).parent / 'fixtures' / 'pdf' / 'tables.pdf'
+ROTATED_PAGE = 2
+
+
+def _store() -> SpanStore:
+    """Three spans: two on one line, one straddling x = 100"""
+    text_dict = {'blocks': [
+        {'type': 0, 'lines': [
+            {'dir': (1.0, 0.0), 'spans': [
+                {'bbox': (10, 10, 40, 20), 'text': ' MU-01 '},
+                {'bbox': (50, 10, 70, 20), 'text': '12.5'},
+            ]},
+            {'dir': (1.0, 0.0), 'spans': [
+                {'bbox': (90, 30, 130, 40), 'text': 'MU-01'},
+                {'bbox': (140, 30, 150, 40), 'text': '   '},
+            ]},
+        ]},
+        {'type': 1, 'bbox': (0, 0, 10, 10)},  # Image block
+    ]}
+    return SpanStore.from_text_dict(text_dict)
+
+
+def test_store_interns_and_skips_blanks():
+    spans = _store()
+    assert len(spans) == 3
+    assert spans.texts() == ['MU-01', '12.5', 'MU-01']
+    assert spans.strings == ['MU-01', '12.5']
+    assert spans.line_ids.tolist() == [0, 0, 1]
+
+
+def test_clipped_keeps_whole_spans_by_centre():
+    spans = _store()
+
+    # Centre of the straddling span (110, 35) is outside x <= 100
+    clipped = spans.clipped((0, 0, 100, 50))
+    assert clipped.texts() == ['MU-01', '12.5']
+    assert clipped.strings is spans.strings
+
+    # within() keeps anything intersecting
+    assert len(spans.within((0, 0, 100, 50))) == 3
+
+
+def test_transform_maps_boxes_and_directions():
+    spans = _store()
+    matrix = fitz.Matrix(90)  # Rotate 90 degrees: (x, y) -> (-y, x)
+    moved = spans.transform(matrix)
+
+    for i in range(len(spans)):
+        expected = fitz.Rect(spans.coords[i].tolist()) * matrix
+        np.testing.assert_allclose(moved.coords[i], tuple(expected), atol=1e-4)
+    np.testing.assert_allclose(moved.dirs, [[0, 1]] * 3, atol=1e-6)
+    assert moved.texts() == spans.texts()
+
+
+def test_reading_matrix_of_rotated_page():
+    with DocumentSession(str(FIXTURE)) as session:
+        assert session.reading_matrix(0) is None  # Upright page
+
+        page = session.page(ROTATED_PAGE)
+        assert page.rotation == 90
+        matrix = session.reading_matrix(ROTATED_PAGE)
+        assert matrix is not None
+        assert tuple(matrix) == pytest.approx(tuple(page.rotation_matrix))
+
+        # Reading-frame spans run left to right, rows top to bottom
+        reading = session.reading_spans(ROTATED_PAGE)
+        assert np.all(reading.dirs[:, 0] > 0.99)
+        header = [i for i, text in enumerate(reading.texts()) if text in ('Sample', 'U ppm', 'Th ppm')]
+        assert np.all(np.diff(reading.x0[header]) > 0)
+        assert np.ptp(reading.y0[header]) < 1
+
+
+def test_camelot_area_round_trip_on_rotated_page():
+    with DocumentSession(str(FIXTURE)) as session:
+        page = session.page(ROTATED_PAGE)
+        matrix = session.reading_matrix(ROTATED_PAGE)
+        bbox = (169.0, 271.0, 544.0, 784.0)
+
+        area = to_camelot_area(bbox, page, matrix)
+        x1, y1, x2, y2 = (float(v) for v in area.split(','))
+        assert x1 < x2 and y1 < y2
+        assert from_camelot_area((x1, y1, x2, y2), page, matrix) == pytest.approx(bbox)
+
+        # The area is in the landscape (displayed) frame
+        shown = transform_bbox(bbox, matrix)
+        assert x2 - x1 == pytest.approx(shown[2] - shown[0])
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))